@@ -22,5 +22,30 @@ class WarningToError(Exception):
     pass
 
 
+class ScenarioNotFoundError(Exception):
+    pass
+
+
+class InvalidScenarioDataError(Exception):
+    def __init__(self, message: str, offset: int, path: str = "", section: str = None):
+        """
+        Raised when the bytes of a scenario don't match the structure of its version.
+
+        Args:
+            message: What's wrong with the data
+            offset: The offset of the byte where the problem was found
+            path: The path to the retriever where the problem was found. Like: ``trigger_data[3].effect_data[0].message``
+            section: The name of the section the problem was found in (if known)
+        """
+        super().__init__(message)
+        self.message = message
+        self.offset = offset
+        self.path = path
+        self.section = section
+
+    def __str__(self):
+        return f"{self.message} (at offset {self.offset}" + (f" in '{self.path}')" if self.path else ")")
+
+
 def type_error_message(value, include_hint=True):
     return f"Expected int, found: {value.__class__}. " + (f"Maybe you meant: '{value}.ID'?" if include_hint else "")
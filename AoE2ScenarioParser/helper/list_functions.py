@@ -1,14 +1,6 @@
 from typing import List
 
 
-def hash_list(lst: list):
-    return hash(tuple(lst))
-
-
-def list_changed(lst, lst_hash):
-    return lst_hash != hash(tuple(lst))
-
-
 def listify(var) -> list:
     """Always return item as list"""
     return var if type(var) is list else [var]
@@ -26,12 +18,26 @@ def update_order_array(order_array: List[int], supposed_length: int) -> None:
     actual_length = len(order_array)
 
     if actual_length > supposed_length:
-        for i in range(supposed_length, actual_length):
-            order_array.remove(i)
+        order_array[:] = [i for i in order_array if i < supposed_length]
     elif supposed_length > actual_length:
-        for i in range(supposed_length):
-            if i not in order_array:
-                order_array.append(i)
+        present = set(order_array)
+        order_array.extend(i for i in range(supposed_length) if i not in present)
+
+
+def resize_order_array(order_array: List[int], old_length: int, new_length: int) -> None:
+    """
+    Update an order array after the length of the list it orders changed. Indices of new entries are appended to the
+    end, indices which no longer exist are removed.
+
+    Args:
+        order_array (List[int]): The order array like trigger.condition_order
+        old_length (int): The length of the list before it changed
+        new_length (int): The length of the list after it changed
+    """
+    if new_length > old_length:
+        order_array.extend(range(old_length, new_length))
+    elif new_length < old_length:
+        order_array[:] = [i for i in order_array if i < new_length]
 
 
 # Written by: Ned Batchelder @ https://stackoverflow.com/a/312464/7230293
@@ -0,0 +1,67 @@
+from itertools import compress
+from typing import Callable, Dict, List, Optional
+
+
+def label_chunks(
+        mask: bytearray,
+        map_width: int,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        chunk_id: Optional[Callable[[int, int], int]] = None
+) -> List[List[int]]:
+    """
+    Splits the selected tiles of a mask into chunks in a single pass using union-find. Tiles are in the same chunk when
+    they're connected through tiles sharing an edge (and, if chunk_id is given, all have the same chunk ID).
+
+    Args:
+        mask: The mask of the entire map (one byte per tile, ``index = y * map_width + x``)
+        map_width: The width of the map
+        x1: The x coordinate of the left corner of the part of the mask to label
+        y1: The y coordinate of the left corner of the part of the mask to label
+        x2: The x coordinate of the right corner of the part of the mask to label (inclusive)
+        y2: The y coordinate of the right corner of the part of the mask to label (inclusive)
+        chunk_id: A function returning the chunk ID of a selected tile (x, y). Neighbouring tiles with different chunk
+            IDs are never in the same chunk.
+
+    Returns:
+        A list of chunks, each chunk being a list of map indices (``y * map_width + x``). Chunks are ordered by their
+            first tile and the tiles within a chunk are ordered by their index.
+    """
+    width = x2 + 1 - x1
+    # Local index within the labelled part: (y - y1) * width + (x - x1)
+    parent: List[int] = list(range(width * (y2 + 1 - y1)))
+    ids: List[int] = [-1] * len(parent) if chunk_id is not None else parent
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(a: int, b: int) -> None:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    selected: List[int] = []
+    for y in range(y1, y2 + 1):
+        row_start = y * map_width + x1
+        local = (y - y1) * width
+        for x in compress(range(x1, x1 + width), mask[row_start:row_start + width]):
+            i = local + x - x1
+            selected.append(i)
+            if chunk_id is not None:
+                ids[i] = chunk_id(x, y)
+            # Connect to the (already visited) left and upper neighbours
+            if x > x1 and mask[row_start + x - x1 - 1] and (chunk_id is None or ids[i - 1] == ids[i]):
+                union(i - 1, i)
+            if y > y1 and mask[row_start + x - x1 - map_width] and (chunk_id is None or ids[i - width] == ids[i]):
+                union(i - width, i)
+
+    chunks: Dict[int, List[int]] = {}
+    for i in selected:
+        y, x = divmod(i, width)
+        chunks.setdefault(find(i), []).append((y + y1) * map_width + x + x1)
+    return list(chunks.values())
@@ -1,4 +1,7 @@
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
 
 from AoE2ScenarioParser import settings
 from AoE2ScenarioParser.helper.exceptions import WarningToError
@@ -25,6 +28,10 @@ _color = {
 }
 
 
+_print_status_updates: ContextVar[Optional[bool]] = ContextVar('print_status_updates', default=None)
+"""Overrides settings.PRINT_STATUS_UPDATES in the current context when not None (see: ``status_updates``)"""
+
+
 def rprint(string="", replace=True, final=False) -> None:
     """
     Replaceable print, print lines which can be overwritten by the next
@@ -49,14 +56,31 @@ def rprint(string="", replace=True, final=False) -> None:
 def s_print(string="", replace=True, final=False, color=None) -> None:
     """
     Status print, read rprint docstring for more info.
-    Simple rprint wrapper with a check for the PRINT_STATUS_UPDATES setting.
+    Simple rprint wrapper with a check for the PRINT_STATUS_UPDATES setting (or the value set using status_updates).
     """
-    if settings.PRINT_STATUS_UPDATES:
+    enabled = _print_status_updates.get()
+    if settings.PRINT_STATUS_UPDATES if enabled is None else enabled:
         if color is not None:
             string = color_string(string, color)
         rprint(string, replace, final)
 
 
+@contextmanager
+def status_updates(enabled: Optional[bool]):
+    """
+    Enable or disable status prints (s_print) in the current context, regardless of settings.PRINT_STATUS_UPDATES.
+    Only affects the current thread (or asyncio task), so concurrent reads and writes can each have their own setting.
+
+    Args:
+        enabled: If status updates should be printed. When None, settings.PRINT_STATUS_UPDATES is used
+    """
+    token = _print_status_updates.set(enabled)
+    try:
+        yield
+    finally:
+        _print_status_updates.reset(token)
+
+
 def color_string(string: str, color: str) -> str:
     return _color[color] + string + _color['end']
 
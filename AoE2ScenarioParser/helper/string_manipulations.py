@@ -1,4 +1,4 @@
-from typing import Union, Any, List
+from typing import Union, Any, List, Iterable, Iterator
 
 
 def add_str_trail(string: bytes) -> bytes:
@@ -69,6 +69,23 @@ def add_tabs(string: str, tabs: int) -> str:
     return ("\t" * tabs) + ("\t" * tabs).join(splitted_string)
 
 
+def add_tabs_to_lines(lines: Iterable[str], tabs: int) -> Iterator[str]:
+    """
+    Streaming variant of ``add_tabs``. Every entry in ``lines`` is expected to be a single line (with or without a
+    line ending), which is the case for all ``iter_*_lines`` functions.
+
+    Args:
+        lines (Iterable[str]): The lines to indent
+        tabs (int): The amount of tabs to add in front of every line
+
+    Returns:
+        A generator with the indented lines
+    """
+    prefix = "\t" * tabs
+    for line in lines:
+        yield prefix + line
+
+
 def create_inline_line(entries: List[Any]):
     return "\t" + ", ".join(map(str, entries)) + "\r\n"
 
@@ -79,6 +96,26 @@ def create_textual_hex(string: str, space_distance: int = 2, enter_distance: int
     return insert_char(insert_char(string, " ", space_distance), "\n", enter_distance)
 
 
+def create_textual_hex_lines(data: bytes, bytes_per_line: int = 8) -> List[str]:
+    """
+    Create the textual hex lines of the given bytes in a single pass. Every line (except the last one) contains
+    ``bytes_per_line`` bytes and ends with a space. Equal to: ``create_textual_hex(data.hex(), 2, 3 * bytes_per_line)``
+    split by line.
+
+    Args:
+        data (bytes): The bytes to format
+        bytes_per_line (int): The amount of bytes per line
+
+    Returns:
+        The lines with the bytes in hex, separated by spaces
+    """
+    if len(data) == 0:
+        return [""]
+    lines = [data[i:i + bytes_per_line].hex(" ") + " " for i in range(0, len(data), bytes_per_line)]
+    lines[-1] = lines[-1][:-1]
+    return lines
+
+
 # Credits: gurney alex @ https://stackoverflow.com/a/2657733/7230293
 def insert_char(string: str, char: str, step=64):
     return char.join(string[i:i + step] for i in range(0, len(string), step))
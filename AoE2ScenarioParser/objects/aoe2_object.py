@@ -36,6 +36,25 @@ class AoE2Object:
             val = getattr(self, k)
         return val
 
+    def copy(self):
+        """
+        Create a copy of this object without going through ``copy.deepcopy``.
+
+        All attribute values are shared with the copy, except for lists which are copied (shallowly). This is an exact
+        copy for objects that only hold immutable values and lists of immutable values (like effects and conditions).
+        Objects holding other (mutable) objects should override this function.
+
+        Returns:
+            The copy of this object
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        result.__dict__.update(self.__dict__)
+        for k, v in self.__dict__.items():
+            if type(v) is list:
+                result.__dict__[k] = v.copy()
+        return result
+
     @classmethod
     def _construct(cls, host_uuid, number_hist=None):
         if number_hist is None:
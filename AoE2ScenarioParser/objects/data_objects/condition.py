@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from enum import IntEnum
-from typing import Union
+from typing import Union, Iterator
 
 from AoE2ScenarioParser.datasets import conditions
 from AoE2ScenarioParser.helper.helper import raise_if_not_int_subclass, validate_coords, value_is_valid
 from AoE2ScenarioParser.helper.printers import warn
-from AoE2ScenarioParser.helper.string_manipulations import add_tabs
+from AoE2ScenarioParser.helper.string_manipulations import add_tabs_to_lines
 from AoE2ScenarioParser.objects.aoe2_object import AoE2Object
 from AoE2ScenarioParser.objects.support.attr_presentation import transform_condition_attr_value
 from AoE2ScenarioParser.sections.retrievers.retriever_object_link import RetrieverObjectLink
@@ -113,27 +113,39 @@ class Condition(AoE2Object):
         super().__init__(**kwargs)
 
     def get_content_as_string(self, include_effect_definition=False) -> str:
+        return "".join(self.iter_content_lines(include_effect_definition))
+
+    def iter_content_lines(self, include_effect_definition=False) -> Iterator[str]:
+        """
+        Streaming variant of ``get_content_as_string``.
+
+        Args:
+            include_effect_definition (bool): If the condition name should be included (with the attributes indented)
+
+        Returns:
+            A generator with the lines of the content (including line endings)
+        """
         if self.condition_type not in conditions.attributes:
             attributes_list = conditions.empty_attributes
         else:
             attributes_list = conditions.attributes[self.condition_type]
 
-        return_string = ""
+        lines = []
         for attribute in attributes_list:
             val = getattr(self, attribute)
             if attribute == "condition_type" or val in [[], [-1], [''], "", " ", -1]:
                 continue
 
             value_string = transform_condition_attr_value(self.condition_type, attribute, val, self._host_uuid)
-            return_string += f"{attribute}: {value_string}\n"
+            lines.extend(f"{attribute}: {value_string}\n".splitlines(keepends=True))
 
-        if return_string == "":
-            return "<< No Attributes >>\n"
-
-        if include_effect_definition:
-            return f"{conditions.condition_names[self.condition_type]}:\n{add_tabs(return_string, 1)}"
-
-        return return_string
+        if len(lines) == 0:
+            yield "<< No Attributes >>\n"
+        elif include_effect_definition:
+            yield f"{conditions.condition_names[self.condition_type]}:\n"
+            yield from add_tabs_to_lines(lines, 1)
+        else:
+            yield from lines
 
     def __str__(self):
         return f"[Condition] {self.get_content_as_string(include_effect_definition=True)}"
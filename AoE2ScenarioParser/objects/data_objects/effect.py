@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, Iterator
 
 from AoE2ScenarioParser.datasets import effects
 from AoE2ScenarioParser.datasets.effects import EffectId
@@ -8,10 +8,10 @@ from AoE2ScenarioParser.datasets.players import PlayerColorId, PlayerId
 from AoE2ScenarioParser.datasets.trigger_lists import ObjectAttribute
 from AoE2ScenarioParser.helper.helper import raise_if_not_int_subclass, value_is_valid, validate_coords
 from AoE2ScenarioParser.helper.printers import warn
-from AoE2ScenarioParser.helper.string_manipulations import add_tabs
+from AoE2ScenarioParser.helper.string_manipulations import add_tabs_to_lines
 from AoE2ScenarioParser.objects.aoe2_object import AoE2Object
 from AoE2ScenarioParser.objects.support.attr_presentation import transform_effect_attr_value
-from AoE2ScenarioParser.scenarios.scenario_store import getters
+from AoE2ScenarioParser.scenarios.scenario_store import actions, getters
 from AoE2ScenarioParser.sections.retrievers.retriever_object_link import RetrieverObjectLink
 from AoE2ScenarioParser.sections.retrievers.support import Support
 
@@ -22,6 +22,14 @@ def _add_trail_if_string_attr_is_used_in_effect(obj: Effect, attr_name, val: Uni
     return val
 
 
+def _remove_trail_if_string_attr_is_used_in_effect(obj: Effect, attr_name, val: Union[bytes, str, None]):
+    """Remove the trail added by ``_add_trail_if_string_attr_is_used_in_effect`` from committed values"""
+    if attr_name in effects.attributes[obj.effect_type] and type(val) in (bytes, str):
+        if val.endswith(b"\x00" if type(val) is bytes else "\x00"):
+            return val[:-1]
+    return val
+
+
 class Effect(AoE2Object):
     """Object for handling an effect."""
 
@@ -105,6 +113,14 @@ class Effect(AoE2Object):
                             "trigger_data[__index__].effect_data[__index__].selected_object_ids"),
     ]
 
+    @classmethod
+    def _construct(cls, host_uuid, number_hist=None):
+        effect = super()._construct(host_uuid, number_hist)
+        # Committed sections (like the ones shared with a fork) hold the strings with the trail added when committing
+        effect.message = _remove_trail_if_string_attr_is_used_in_effect(effect, 'message', effect.message)
+        effect.sound_name = _remove_trail_if_string_attr_is_used_in_effect(effect, 'sound_name', effect.sound_name)
+        return effect
+
     def __init__(self,
                  effect_type: int = None,
                  ai_script_goal: int = None,
@@ -208,7 +224,7 @@ class Effect(AoE2Object):
         self.technology: int = technology
         self.string_id: int = string_id
         self.display_time: int = display_time
-        self.trigger_id: int = trigger_id
+        self._trigger_id: int = trigger_id
         self.location_x: int = location_x
         self.location_y: int = location_y
         self.location_object_reference: int = location_object_reference
@@ -278,8 +294,20 @@ class Effect(AoE2Object):
 
     @effect_type.setter
     def effect_type(self, value):
-        self._effect_type = value
+        previous_effect_type, self._effect_type = self._effect_type, value
         self._update_armour_attack_flag()
+        if previous_effect_type != value:
+            actions.effect_change_type(self._host_uuid, self)
+
+    @property
+    def trigger_id(self) -> int:
+        return self._trigger_id
+
+    @trigger_id.setter
+    def trigger_id(self, value: int):
+        previous_trigger_id, self._trigger_id = self._trigger_id, value
+        if previous_trigger_id != value:
+            actions.effect_change_trigger_id(self._host_uuid, self, previous_trigger_id)
 
     @property
     def object_attributes(self):
@@ -339,12 +367,24 @@ class Effect(AoE2Object):
         self._selected_object_ids = val
 
     def get_content_as_string(self, include_effect_definition=False) -> str:
+        return "".join(self.iter_content_lines(include_effect_definition))
+
+    def iter_content_lines(self, include_effect_definition=False) -> Iterator[str]:
+        """
+        Streaming variant of ``get_content_as_string``.
+
+        Args:
+            include_effect_definition (bool): If the effect name should be included (with the attributes indented)
+
+        Returns:
+            A generator with the lines of the content (including line endings)
+        """
         if self.effect_type not in effects.attributes:  # Unknown effect
             attributes_list = effects.empty_attributes
         else:
             attributes_list = effects.attributes[self.effect_type]
 
-        return_string = ""
+        lines = []
         for attribute in attributes_list:
             val = getattr(self, attribute)
             if attribute == "effect_type" or val in [[], [-1], "", " ", -1]:
@@ -356,14 +396,15 @@ class Effect(AoE2Object):
                 continue
 
             value_string = transform_effect_attr_value(self.effect_type, attribute, val, self._host_uuid)
-            return_string += f"{attribute}: {value_string}\n"
+            lines.extend(f"{attribute}: {value_string}\n".splitlines(keepends=True))
 
-        if return_string == "":
-            return "<< No Attributes >>\n"
-
-        if include_effect_definition:
-            return f"{effects.effect_names[self.effect_type]}:\n{add_tabs(return_string, 1)}"
-        return return_string
+        if len(lines) == 0:
+            yield "<< No Attributes >>\n"
+        elif include_effect_definition:
+            yield f"{effects.effect_names[self.effect_type]}:\n"
+            yield from add_tabs_to_lines(lines, 1)
+        else:
+            yield from lines
 
     def _update_armour_attack_flag(self):
         self._armour_attack_flag = _set_armour_attack_flag(self.effect_type, self.object_attributes)
@@ -1,4 +1,6 @@
-from typing import List
+from __future__ import annotations
+
+from typing import List, Iterator
 
 import AoE2ScenarioParser.datasets.conditions as condition_dataset
 import AoE2ScenarioParser.datasets.effects as effect_dataset
@@ -6,15 +8,15 @@ from AoE2ScenarioParser.datasets.conditions import ConditionId
 from AoE2ScenarioParser.datasets.effects import EffectId
 from AoE2ScenarioParser.helper.exceptions import UnsupportedAttributeError
 from AoE2ScenarioParser.helper.helper import exclusive_if
-from AoE2ScenarioParser.helper.list_functions import list_changed, update_order_array, hash_list
-from AoE2ScenarioParser.helper.string_manipulations import add_tabs
+from AoE2ScenarioParser.helper.list_functions import resize_order_array
+from AoE2ScenarioParser.helper.string_manipulations import add_tabs_to_lines
 from AoE2ScenarioParser.objects.aoe2_object import AoE2Object
 from AoE2ScenarioParser.objects.data_objects.condition import Condition
 from AoE2ScenarioParser.objects.data_objects.effect import Effect
 from AoE2ScenarioParser.objects.support.new_condition import NewConditionSupport
 from AoE2ScenarioParser.objects.support.new_effect import NewEffectSupport
 from AoE2ScenarioParser.objects.support.uuid_list import UuidList
-from AoE2ScenarioParser.scenarios.scenario_store import getters
+from AoE2ScenarioParser.scenarios.scenario_store import actions, getters
 from AoE2ScenarioParser.sections.retrievers.retriever_object_link import RetrieverObjectLink
 
 
@@ -87,11 +89,12 @@ class Trigger(AoE2Object):
         self.looping: int = looping
         self.header: int = header
         self.mute_objectives: int = mute_objectives
-        self._condition_hash = hash_list(conditions)
         self.conditions: List[Condition] = conditions
         self.condition_order: List[int] = condition_order
-        self._effect_hash = hash_list(effects)
-        self.effects: List[Effect] = effects
+        # Bypass the @property which causes: actions.trigger_change_effects()
+        self._effects: List[Effect] = UuidList(
+            self._host_uuid, effects, on_length_change=self._on_effects_length_change, on_change=self._on_effects_change
+        )
         self.effect_order: List[int] = effect_order
         self.trigger_id: int = trigger_id
 
@@ -106,13 +109,43 @@ class Trigger(AoE2Object):
             if k in ['new_effect', 'new_condition']:
                 continue
             setattr(result, k, self._deepcopy_entry(k, v))
+        result._conditions.on_length_change = result._on_conditions_length_change
+        result._effects.on_length_change = result._on_effects_length_change
+        result._effects.on_change = result._on_effects_change
+        result.new_effect = NewEffectSupport(result)
+        result.new_condition = NewConditionSupport(result)
+        return result
+
+    def copy(self) -> Trigger:
+        """
+        Create a copy of this trigger including copies of all its conditions and effects.
+
+        Returns:
+            The copy of this trigger
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        result.__dict__.update(self.__dict__)
+        result._instance_number_history = self._instance_number_history.copy()
+        result._conditions = UuidList(
+            self._host_uuid,
+            [condition.copy() for condition in self._conditions],
+            on_length_change=result._on_conditions_length_change
+        )
+        result._condition_order = self._condition_order.copy()
+        result._effects = UuidList(
+            self._host_uuid,
+            [effect.copy() for effect in self._effects],
+            on_length_change=result._on_effects_length_change,
+            on_change=result._on_effects_change
+        )
+        result._effect_order = self._effect_order.copy()
+        result.new_effect = NewEffectSupport(result)
+        result.new_condition = NewConditionSupport(result)
         return result
 
     @property
     def condition_order(self):
-        if list_changed(self.conditions, self._condition_hash):
-            update_order_array(self._condition_order, len(self.conditions))
-            self._condition_hash = hash_list(self.conditions)
         return self._condition_order
 
     @condition_order.setter
@@ -121,9 +154,6 @@ class Trigger(AoE2Object):
 
     @property
     def effect_order(self):
-        if list_changed(self.effects, self._effect_hash):
-            update_order_array(self._effect_order, len(self.effects))
-            self._effect_hash = hash_list(self.effects)
         return self._effect_order
 
     @effect_order.setter
@@ -136,7 +166,7 @@ class Trigger(AoE2Object):
 
     @conditions.setter
     def conditions(self, val: List[Condition]) -> None:
-        self._conditions = UuidList(self._host_uuid, val)
+        self._conditions = UuidList(self._host_uuid, val, on_length_change=self._on_conditions_length_change)
         self.condition_order = list(range(0, len(val)))
 
     @property
@@ -145,8 +175,20 @@ class Trigger(AoE2Object):
 
     @effects.setter
     def effects(self, val: List[Effect]) -> None:
-        self._effects = UuidList(self._host_uuid, val)
+        self._effects = UuidList(
+            self._host_uuid, val, on_length_change=self._on_effects_length_change, on_change=self._on_effects_change
+        )
         self.effect_order = list(range(0, len(val)))
+        actions.trigger_change_effects(self._host_uuid, self)
+
+    def _on_conditions_length_change(self, old_length: int, new_length: int) -> None:
+        resize_order_array(self._condition_order, old_length, new_length)
+
+    def _on_effects_length_change(self, old_length: int, new_length: int) -> None:
+        resize_order_array(self._effect_order, old_length, new_length)
+
+    def _on_effects_change(self) -> None:
+        actions.trigger_change_effects(self._host_uuid, self)
 
     def _add_effect(self, effect_type: EffectId, ai_script_goal=None, armour_attack_quantity=None,
                     armour_attack_class=None, quantity=None, tribute_list=None, diplomacy=None,
@@ -251,7 +293,22 @@ class Trigger(AoE2Object):
         del self.conditions[condition_index]
 
     def get_content_as_string(self, include_trigger_definition=False) -> str:
-        return_string = ""
+        return "".join(self.iter_content_lines(include_trigger_definition))
+
+    def iter_content_lines(self, include_trigger_definition=False) -> Iterator[str]:
+        """
+        Streaming variant of ``get_content_as_string``.
+
+        Args:
+            include_trigger_definition (bool): If the trigger name should be included (with the content indented)
+
+        Returns:
+            A generator with the lines of the content (including line endings)
+        """
+        if include_trigger_definition:
+            yield f"\"{self.name}\" [Index: {self.trigger_id}]\n"
+            yield from add_tabs_to_lines(self.iter_content_lines(), 1)
+            return
 
         data_tba = {
             'enabled': self.enabled != 0,
@@ -278,29 +335,25 @@ class Trigger(AoE2Object):
             data_tba['mute_objectives'] = (self.mute_objectives != 0)
 
         for key, value in data_tba.items():
-            return_string += f"{key}: {value}\n"
+            yield from f"{key}: {value}\n".splitlines(keepends=True)
 
         if len(self.condition_order) > 0:
-            return_string += "conditions:\n"
+            yield "conditions:\n"
             for c_display_order, condition_id in enumerate(self.condition_order):
                 condition = self.conditions[condition_id]
 
-                return_string += f"\t{condition_dataset.condition_names[condition.condition_type]} " \
-                                 f"[Index: {condition_id}, Display: {c_display_order}]:\n"
-                return_string += add_tabs(condition.get_content_as_string(), 2)
+                yield f"\t{condition_dataset.condition_names[condition.condition_type]} " \
+                      f"[Index: {condition_id}, Display: {c_display_order}]:\n"
+                yield from add_tabs_to_lines(condition.iter_content_lines(), 2)
 
         if len(self.effect_order) > 0:
-            return_string += "effects:\n"
+            yield "effects:\n"
             for e_display_order, effect_id in enumerate(self.effect_order):
                 effect = self.effects[effect_id]
 
-                return_string += f"\t{effect_dataset.effect_names[effect.effect_type]}" \
-                                 f" [Index: {effect_id}, Display: {e_display_order}]:\n"
-                return_string += add_tabs(effect.get_content_as_string(), 2)
-
-        if include_trigger_definition:
-            return f"\"{self.name}\" [Index: {self.trigger_id}]\n" + add_tabs(return_string, 1)
-        return return_string
+                yield f"\t{effect_dataset.effect_names[effect.effect_type]}" \
+                      f" [Index: {effect_id}, Display: {e_display_order}]:\n"
+                yield from add_tabs_to_lines(effect.iter_content_lines(), 2)
 
     def __str__(self) -> str:
         return f"[Trigger] {self.get_content_as_string(include_trigger_definition=True)}"
@@ -49,12 +49,12 @@ class Unit(AoE2Object):
         self.x: float = x
         self.y: float = y
         self.z: float = z
-        self.reference_id: int = reference_id
+        self._reference_id: int = reference_id
         self.unit_const: int = unit_const
         self.status: int = status
         self.rotation: float = rotation
         self.initial_animation_frame: int = initial_animation_frame
-        self.garrisoned_in_id: int = garrisoned_in_id
+        self._garrisoned_in_id: int = garrisoned_in_id
 
     @property
     def player(self) -> PlayerId:
@@ -63,7 +63,27 @@ class Unit(AoE2Object):
     @player.setter
     def player(self, player: Union[int, PlayerId]):
         actions.unit_change_ownership(self._host_uuid, player, self)
-        self._player = player
+        self._player = PlayerId(player)
+
+    @property
+    def reference_id(self) -> int:
+        return self._reference_id
+
+    @reference_id.setter
+    def reference_id(self, reference_id: int):
+        previous_reference_id, self._reference_id = self._reference_id, reference_id
+        if previous_reference_id != reference_id:
+            actions.unit_change_reference_id(self._host_uuid, self, previous_reference_id)
+
+    @property
+    def garrisoned_in_id(self) -> int:
+        return self._garrisoned_in_id
+
+    @garrisoned_in_id.setter
+    def garrisoned_in_id(self, garrisoned_in_id: int):
+        previous_garrisoned_in_id, self._garrisoned_in_id = self._garrisoned_in_id, garrisoned_in_id
+        if previous_garrisoned_in_id != garrisoned_in_id:
+            actions.unit_change_garrison(self._host_uuid, self, previous_garrisoned_in_id)
 
     @property
     def tile(self) -> Tile:
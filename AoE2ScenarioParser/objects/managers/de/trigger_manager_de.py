@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Iterator
 
 from AoE2ScenarioParser.helper.helper import exclusive_if
 from AoE2ScenarioParser.objects.data_objects.trigger import Trigger
@@ -54,12 +54,13 @@ class TriggerManagerDE(TriggerManager):
             if variable.variable_id == variable_id or variable.name == variable_name:
                 return variable
 
-    def get_summary_as_string(self) -> str:
-        return_string = super().get_summary_as_string()
+    def iter_summary_lines(self) -> Iterator[str]:
+        yield from super().iter_summary_lines()
 
-        return_string += "\nVariables Summary:\n"
+        yield "\n"
+        yield "Variables Summary:\n"
         if len(self.variables) == 0:
-            return_string += "\t<< No Variables >>"
+            yield "\t<< No Variables >>"
 
         longest_variable_name = -1
         for variable in self.variables:
@@ -69,19 +70,15 @@ class TriggerManagerDE(TriggerManager):
         for index, variable in enumerate(self.variables):
             var_name = variable.name
             name_buffer = " " * (longest_variable_name - len(var_name))
-            return_string += f"\t{var_name}{name_buffer}[Index: {variable.variable_id}]\n"
+            yield f"\t{var_name}{name_buffer}[Index: {variable.variable_id}]\n"
 
-        return return_string
+    def iter_content_lines(self) -> Iterator[str]:
+        yield from super().iter_content_lines()
 
-    def get_content_as_string(self) -> str:
-        return_string = super().get_content_as_string()
-
-        return_string += "Variables:\n"
+        yield "Variables:\n"
 
         if len(self.variables) == 0:
-            return_string += "\t<<No Variables>>\n"
+            yield "\t<<No Variables>>\n"
 
         for variable in self.variables:
-            return_string += f"\t'{variable.name}' [Index: {variable.variable_id}]\n"
-
-        return return_string
+            yield f"\t'{variable.name}' [Index: {variable.variable_id}]\n"
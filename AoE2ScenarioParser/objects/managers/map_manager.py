@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import itertools
-from typing import List, Union, Tuple, Set, Optional
+from itertools import compress
+from typing import Callable, Iterator, List, Union, Tuple, Set, Optional, TYPE_CHECKING
 
 from AoE2ScenarioParser.helper import helper
 from AoE2ScenarioParser.helper.helper import xy_to_i
@@ -10,8 +11,14 @@ from AoE2ScenarioParser.helper.maffs import sign
 from AoE2ScenarioParser.helper.printers import warn
 from AoE2ScenarioParser.objects.aoe2_object import AoE2Object
 from AoE2ScenarioParser.objects.data_objects.terrain_tile import TerrainTile, reset_terrain_index
+from AoE2ScenarioParser.scenarios.scenario_store import getters
+from AoE2ScenarioParser.sections.dependencies.dependency import handle_retriever_dependency
 from AoE2ScenarioParser.sections.retrievers.retriever_object_link import RetrieverObjectLink
 
+if TYPE_CHECKING:
+    from AoE2ScenarioParser.objects.support.area import Area
+    from AoE2ScenarioParser.objects.support.selection import Selection
+
 
 class MapManager(AoE2Object):
     """Manager of the everything map related."""
@@ -34,6 +41,105 @@ class MapManager(AoE2Object):
         self._map_height = map_height
         self.terrain = terrain
 
+    def commit(self, local_link_list=None):
+        """
+        Commits all changes to the section & struct structure. The terrain is committed in bulk, only writing (and
+        copying, when shared with a forked scenario) the terrain structs of tiles that actually changed.
+        """
+        if local_link_list is None:
+            local_link_list = self._link_list
+
+        if any(link.name == 'terrain' for link in local_link_list):
+            self._commit_terrain()
+        super().commit([link for link in local_link_list if link.name != 'terrain'])
+
+    def _commit_terrain(self) -> None:
+        """Commit the terrain tiles to the terrain structs, skipping all tiles that are equal to their struct"""
+        link = next(link for link in self._link_list if link.name == 'terrain')
+        section = getters.get_sections(self._host_uuid)[link.section_name]
+        retriever_name = link.splitted_link[-1]
+        retriever = section.retriever_map[retriever_name]
+        struct_model = section.struct_models[retriever.datatype.var[len("struct:"):]]
+
+        RetrieverObjectLink.update_retriever_length(
+            retriever, struct_model, len(self.terrain), self._host_uuid, owner=section._owner
+        )
+
+        # Attribute names of the tile with the name of the retriever in the struct they're committed to
+        attributes = [
+            (tile_link.name, tile_link.splitted_link[-1]) for tile_link in TerrainTile._link_list if tile_link.link
+        ]
+        structs = retriever.data
+        for index, tile in enumerate(self.terrain):
+            tile._instance_number_history = [index]
+            retriever_map = structs[index].retriever_map
+            if all(retriever_map[name].data == getattr(tile, attr) for attr, name in attributes):
+                continue
+
+            retriever_map = section.get_editable_struct(retriever_name, index).retriever_map
+            for attr, name in attributes:
+                retriever_map[name].data = getattr(tile, attr)
+
+        if hasattr(retriever, 'on_commit'):
+            handle_retriever_dependency(retriever, "commit", section, self._host_uuid)
+
+    def paint(
+            self,
+            area: Area | Selection | bytearray,
+            terrain_id: int = None,
+            elevation: int = None,
+            layer: int = None
+    ) -> int:
+        """
+        Set the terrain, elevation and/or layer of all tiles in an area at once. Parameters left empty are not changed.
+
+        Args:
+            area: An area or selection (or a mask like the one returned by ``area.to_mask()``) selecting the tiles
+            terrain_id: The terrain to set
+            elevation: The elevation to set
+            layer: The terrain layer to set
+
+        Returns:
+            The amount of tiles painted
+
+        Raises:
+            ValueError: When the mask doesn't have the size of the map
+        """
+        values = [(attr, value) for attr, value in
+                  (('terrain_id', terrain_id), ('elevation', elevation), ('layer', layer)) if value is not None]
+
+        count = 0
+        for tile in self._masked_terrain(area):
+            for attr, value in values:
+                setattr(tile, attr, value)
+            count += 1
+        return count
+
+    def apply(self, func: Callable[[TerrainTile], None], area: Area | Selection | bytearray = None) -> None:
+        """
+        Call a function for every tile on the map (or every tile in an area).
+
+        Examples:
+
+            Lower all tiles on the map by one::
+
+                map_manager.apply(lambda tile: setattr(tile, 'elevation', max(0, tile.elevation - 1)))
+
+        Args:
+            func: The function to call. It receives the terrain tile as its only argument
+            area: An area or selection (or a mask like the one returned by ``area.to_mask()``) selecting the tiles.
+                When left empty, all tiles are used
+        """
+        for tile in (self.terrain if area is None else self._masked_terrain(area)):
+            func(tile)
+
+    def _masked_terrain(self, area: Area | Selection | bytearray) -> Iterator[TerrainTile]:
+        """Get an iterator over all terrain tiles selected by the given area, selection or mask"""
+        mask = area if isinstance(area, (bytes, bytearray)) else area.to_mask()
+        if len(mask) != len(self.terrain):
+            raise ValueError(f"The mask size ({len(mask)}) does not match the amount of tiles ({len(self.terrain)})")
+        return compress(self.terrain, mask)
+
     @property
     def terrain_2d(self) -> List[List[TerrainTile]]:
         return list(list_chuncks(self.terrain, self.map_size))
@@ -126,6 +232,9 @@ class MapManager(AoE2Object):
 
     @map_size.setter
     def map_size(self, new_size: int):
+        if new_size == self._map_width == self._map_height:
+            return
+
         old_size = self._map_width
         difference = new_size - old_size
 
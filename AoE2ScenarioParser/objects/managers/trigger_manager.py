@@ -1,21 +1,24 @@
 from __future__ import annotations
 
-import copy
+from contextlib import contextmanager
 from enum import IntEnum
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Union, Iterator, TextIO
 
 from AoE2ScenarioParser.datasets.effects import EffectId
 from AoE2ScenarioParser.datasets.players import PlayerId
 from AoE2ScenarioParser.helper import helper
 from AoE2ScenarioParser.helper.helper import value_is_valid
-from AoE2ScenarioParser.helper.list_functions import hash_list, list_changed, update_order_array
+from AoE2ScenarioParser.helper.list_functions import resize_order_array
 from AoE2ScenarioParser.helper.printers import warn
-from AoE2ScenarioParser.helper.string_manipulations import add_tabs
+from AoE2ScenarioParser.helper.string_manipulations import add_tabs_to_lines
 from AoE2ScenarioParser.objects.aoe2_object import AoE2Object
 from AoE2ScenarioParser.objects.data_objects.effect import Effect
 from AoE2ScenarioParser.objects.data_objects.trigger import Trigger
 from AoE2ScenarioParser.objects.support.enums.group_by import GroupBy
+from AoE2ScenarioParser.objects.support.tracked_list import TrackedList
+from AoE2ScenarioParser.objects.support.trigger_graph import TriggerGraph
 from AoE2ScenarioParser.objects.support.trigger_select import TriggerSelect, TS
+from AoE2ScenarioParser.scenarios.scenario_store import actions, getters
 from AoE2ScenarioParser.sections.retrievers.retriever_object_link import RetrieverObjectLink
 
 
@@ -34,7 +37,9 @@ class TriggerManager(AoE2Object):
                  ):
         super().__init__(**kwargs)
 
-        self._trigger_hash = hash_list(triggers)
+        self._batch_depth = 0
+        self._reorder_pending = False
+        self._activation_index: Optional[TriggerGraph] = None
         self.triggers: List[Trigger] = triggers
         self.trigger_display_order: List[int] = trigger_display_order
 
@@ -44,22 +49,68 @@ class TriggerManager(AoE2Object):
 
     @triggers.setter
     def triggers(self, value):
+        # The list is copied into a TrackedList, so changes to the given list afterwards don't reach the manager
         self._update_triggers_uuid(value)
-        self._trigger_hash = hash_list(value)
-        self._triggers = value
+        self._triggers = TrackedList(
+            value, on_length_change=self._on_triggers_length_change, on_change=self._on_triggers_change
+        )
         self.trigger_display_order = list(range(len(value)))
+        self._activation_index = None
 
     @property
     def trigger_display_order(self) -> List[int]:
-        if list_changed(self.triggers, self._trigger_hash):
-            update_order_array(self._trigger_display_order, len(self.triggers))
-            self._trigger_hash = hash_list(self.triggers)
         return self._trigger_display_order
 
     @trigger_display_order.setter
     def trigger_display_order(self, val):
         self._trigger_display_order = val
 
+    def _on_triggers_length_change(self, old_length: int, new_length: int) -> None:
+        resize_order_array(self._trigger_display_order, old_length, new_length)
+
+    def _on_triggers_change(self) -> None:
+        if self._activation_index is not None:
+            self._activation_index.update_triggers()
+
+    def __deepcopy__(self, memo):
+        result = super().__deepcopy__(memo)
+        result._triggers.on_length_change = result._on_triggers_length_change
+        result._triggers.on_change = result._on_triggers_change
+        return result
+
+    def _deepcopy_entry(self, k, v):
+        # The activation index refers to the (effects of the) triggers of this manager, the copy creates its own
+        if k == '_activation_index':
+            return None
+        return super()._deepcopy_entry(k, v)
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer the reordering of triggers until the end of the ``with`` block. Functions like ``move_triggers``,
+        ``reorder_triggers``, ``import_triggers`` and ``copy_trigger`` only update the display order within the block.
+        The triggers (and ``(de)activate trigger`` effects) are renumbered once when the (outermost) block exits.
+
+        Until then, trigger IDs keep pointing to the triggers they pointed to when the block was entered and new
+        triggers are given an ID at the end of the list. So, within the block, select triggers by their ID (or object)
+        and not by their display index.
+
+        Removing triggers is not deferred. ``remove_trigger`` renumbers all triggers immediately, also within a block.
+
+        Example:
+
+        >>> with trigger_manager.batch():
+        >>>     for i in range(100):
+        >>>         trigger_manager.copy_trigger(TS.trigger(source), append_after_source=True)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._reorder_pending:
+                self.reorder_triggers()
+
     def copy_trigger_per_player(self,
                                 from_player,
                                 trigger_select: Union[int, TriggerSelect],
@@ -161,7 +212,7 @@ class TriggerManager(AoE2Object):
             add_suffix=True
     ) -> Trigger:
         """
-        Creates an exact copy (deepcopy) of this trigger.
+        Creates an exact copy of this trigger.
 
         Args:
             trigger_select (Union[int, TriggerSelect]): An object used to identify which trigger to select.
@@ -173,17 +224,17 @@ class TriggerManager(AoE2Object):
         """
         trigger_index, display_index, trigger = self._validate_and_retrieve_trigger_info(trigger_select)
 
-        deepcopy_trigger = copy.deepcopy(trigger)
-        deepcopy_trigger.trigger_id = len(self.triggers)
+        trigger_copy = trigger.copy()
+        trigger_copy.trigger_id = len(self.triggers)
         if add_suffix:
-            deepcopy_trigger.name += " (copy)"
+            trigger_copy.name += " (copy)"
 
-        self.triggers.append(deepcopy_trigger)
+        self.triggers.append(trigger_copy)
 
         if append_after_source:
-            self.move_triggers([trigger_index, deepcopy_trigger.trigger_id], trigger_index)
+            self.move_triggers([trigger_index, trigger_copy.trigger_id], display_index)
 
-        return deepcopy_trigger
+        return trigger_copy
 
     def copy_trigger_tree_per_player(self,
                                      from_player,
@@ -227,8 +278,7 @@ class TriggerManager(AoE2Object):
 
         trigger_index, display_index, source_trigger = self._validate_and_retrieve_trigger_info(trigger_select)
 
-        known_node_indexes = [trigger_index]
-        self._find_trigger_tree_nodes_recursively(source_trigger, known_node_indexes)
+        known_node_indexes = self._find_trigger_tree_nodes(trigger_index)
 
         new_triggers = {}
         trigger_index_swap = {}
@@ -256,10 +306,12 @@ class TriggerManager(AoE2Object):
                 new_triggers.setdefault(player, []).append(trigger)
 
         # Set trigger_id's in activation effects to the new player copied trigger ID
+        activation_index = self._get_activation_index()
         for player, triggers in new_triggers.items():
             for trigger in triggers:
-                for effect in get_activation_effects(trigger):
-                    effect.trigger_id = trigger_index_swap[effect.trigger_id][player]
+                for effect in activation_index.outgoing_effects(trigger.trigger_id):
+                    if effect.trigger_id in trigger_index_swap:
+                        effect.trigger_id = trigger_index_swap[effect.trigger_id][player]
 
         # -------------- Group by logic -------------- #
         new_trigger_ids = []
@@ -306,20 +358,22 @@ class TriggerManager(AoE2Object):
         if min(trigger_ids) < 0:
             raise ValueError(f"Trigger IDs cannot be negative")
 
-        if insert_index >= len(self.trigger_display_order):
+        moved_ids = set(trigger_ids)
+        display_order = self.trigger_display_order
+        if insert_index >= len(display_order):
             # Add to the end of the list
-            new_trigger_id_order = [n for n in self.trigger_display_order if n not in trigger_ids]
+            new_trigger_id_order = [n for n in display_order if n not in moved_ids]
             new_trigger_id_order += trigger_ids
         else:
-            insert_num = self.trigger_display_order[insert_index]
-            new_trigger_id_order = [n for n in self.trigger_display_order if n not in trigger_ids or n == insert_num]
+            insert_num = display_order[insert_index]
+            new_trigger_id_order = [n for n in display_order if n not in moved_ids or n == insert_num]
 
             split_index = new_trigger_id_order.index(insert_num)
 
-            if insert_num in trigger_ids:
-                new_trigger_id_order.remove(insert_num)
+            if insert_num in moved_ids:
+                del new_trigger_id_order[split_index]
 
-            new_trigger_id_order = new_trigger_id_order[:split_index] + trigger_ids + new_trigger_id_order[split_index:]
+            new_trigger_id_order[split_index:split_index] = trigger_ids
         self.reorder_triggers(new_trigger_id_order)
 
     def reorder_triggers(self, new_id_order: List[int] = None):
@@ -336,6 +390,9 @@ class TriggerManager(AoE2Object):
         Keep in mind that all trigger IDs will get remapped with this function. So ``trigger_manager.triggers[4]`` might
         result in a different trigger after this function is called in comparison to before.
 
+        When used within ``trigger_manager.batch()``, only the display order is updated. The triggers are reordered when
+        the batch ends.
+
         Args:
             new_id_order: The new trigger order. Uses the current display order when left unused
         """
@@ -344,24 +401,37 @@ class TriggerManager(AoE2Object):
                 raise ValueError(f"Trigger IDs cannot be negative")
             self.trigger_display_order = new_id_order
 
+        if self._batch_depth > 0:
+            self._reorder_pending = True
+            return
+        self._apply_display_order()
+
+    def _apply_display_order(self) -> None:
+        """Reorder (and renumber) the triggers to the current display order in a single pass"""
+        self._reorder_pending = False
+
+        triggers = self.triggers
         new_triggers_list = []
         index_changes = {}
         for new_index, index in enumerate(self.trigger_display_order):
             try:
-                trigger = self.triggers[index]
+                trigger = triggers[index]
             except IndexError:
                 raise ValueError(f"The trigger ID {index} doesn't exist") from None
-            index_changes[trigger.trigger_id] = new_index
-
-            trigger.trigger_id = new_index
+            if trigger.trigger_id != new_index:
+                index_changes[trigger.trigger_id] = new_index
+                trigger.trigger_id = new_index
             new_triggers_list.append(trigger)
-        self.triggers = new_triggers_list
 
-        # Find and update all (de)activation effect trigger references
-        for trigger in self.triggers:
-            for effect in get_activation_effects(trigger):
-                if effect.trigger_id in index_changes:
-                    effect.trigger_id = index_changes[effect.trigger_id]
+        # The triggers themselves haven't changed, so they don't need to go through the triggers setter
+        triggers[:] = new_triggers_list
+        self.trigger_display_order = list(range(len(new_triggers_list)))
+
+        if not index_changes:
+            return
+
+        # Update the (de)activation effects pointing to the renumbered triggers
+        self._get_activation_index().remap_targets(index_changes)
 
     def copy_trigger_tree(self, trigger_select: Union[int, TriggerSelect]) -> List[Trigger]:
         """
@@ -375,8 +445,7 @@ class TriggerManager(AoE2Object):
         """
         trigger_index, display_index, trigger = self._validate_and_retrieve_trigger_info(trigger_select)
 
-        known_node_indexes = [trigger_index]
-        self._find_trigger_tree_nodes_recursively(trigger, known_node_indexes)
+        known_node_indexes = self._find_trigger_tree_nodes(trigger_index)
 
         new_triggers = []
         id_swap = {}
@@ -385,13 +454,11 @@ class TriggerManager(AoE2Object):
             new_triggers.append(trigger)
             id_swap[index] = trigger.trigger_id
 
+        activation_index = self._get_activation_index()
         for trigger in new_triggers:
-            activation_effects = [
-                effect for effect in trigger.effects if
-                effect.effect_type in [EffectId.ACTIVATE_TRIGGER, EffectId.DEACTIVATE_TRIGGER]
-            ]
-            for effect in activation_effects:
-                effect.trigger_id = id_swap[effect.trigger_id]
+            for effect in activation_index.outgoing_effects(trigger.trigger_id):
+                if effect.trigger_id in id_swap:
+                    effect.trigger_id = id_swap[effect.trigger_id]
 
         return new_triggers
 
@@ -493,6 +560,10 @@ class TriggerManager(AoE2Object):
         Returns:
             The newly added triggers (with the new IDs and activation links etc.)
         """
+        # The triggers (and their effects) are renumbered below, the scenario they came from needs a new index
+        for source_uuid in {trigger._host_uuid for trigger in triggers} - {self._host_uuid}:
+            actions.trigger_manager_reset_activation_index(source_uuid)
+
         index_changes = {}
 
         for offset, trigger in enumerate(triggers):
@@ -500,8 +571,11 @@ class TriggerManager(AoE2Object):
             index_changes[trigger.trigger_id] = trigger.trigger_id = new_index
 
         self._update_triggers_uuid(triggers)
+        self.triggers += triggers
+
+        activation_index = self._get_activation_index()
         for trigger in triggers:
-            for i, effect in enumerate(get_activation_effects(trigger)):
+            for i, effect in enumerate(activation_index.outgoing_effects(trigger.trigger_id)):
                 try:
                     effect.trigger_id = index_changes[effect.trigger_id]
                 except KeyError:
@@ -509,7 +583,6 @@ class TriggerManager(AoE2Object):
                          f"in the imported triggers. Effect will be reset")
                     effect.trigger_id = -1
 
-        self.triggers += triggers
         if index != -1:
             self.move_triggers([t.trigger_id for t in triggers], index)
         return triggers
@@ -529,21 +602,87 @@ class TriggerManager(AoE2Object):
     def remove_trigger(self, trigger_select: Union[int, TriggerSelect]) -> None:
         trigger_index, display_index, trigger = self._validate_and_retrieve_trigger_info(trigger_select)
 
+        display_order = [i - (i > trigger_index) for i in self.trigger_display_order if i != trigger_index]
         del self.triggers[trigger_index]
+        self.trigger_display_order = display_order
 
-        self.reorder_triggers()
+        # Removing a trigger shifts the IDs of all triggers after it, so this cannot be deferred when in a batch
+        self._apply_display_order()
 
-    def _find_trigger_tree_nodes_recursively(self, trigger, known_node_indexes: List[int]) -> None:
-        found_node_indexes = TriggerManager._find_trigger_tree_nodes(trigger)
-        unknown_node_indexes = [i for i in found_node_indexes if i not in known_node_indexes]
+    def get_activation_graph(self) -> TriggerGraph:
+        """
+        Get the index of all links between triggers created by ``(de)activate trigger`` effects. Can be used to find
+        all triggers reachable from a trigger, (activation) cycles or a topological order of all triggers.
 
-        if len(unknown_node_indexes) == 0:
-            return
+        The index of the trigger manager of a scenario is kept up to date when triggers are added, removed or
+        reordered and when effects are added, removed or changed. The index of a trigger manager that isn't part of a
+        scenario reflects the triggers at the time it was created, so get a new one after changing triggers.
+
+        Returns:
+            The trigger activation graph
+        """
+        return self._get_activation_index()
+
+    def _get_activation_index(self) -> TriggerGraph:
+        """
+        Get the index of (de)activation links. The index is built in one pass over all effects the first time it's
+        used. Afterwards it's kept up to date by the trigger manager and by the effect lists of triggers and the
+        ``effect_type`` and ``trigger_id`` properties of effects. These can only reach the trigger manager through the
+        scenario, so for trigger managers without one, a new index is built every time.
+        """
+        if self._activation_index is not None:
+            return self._activation_index
+
+        activation_index = TriggerGraph(self.triggers)
+        if getters.get_trigger_manager(self._host_uuid) is self:
+            self._activation_index = activation_index
+        return activation_index
+
+    def _update_trigger_effects(self, trigger: Trigger) -> None:
+        """Update the activation index (if it's in use) after effects were added to or removed from the trigger"""
+        if self._activation_index is not None:
+            self._activation_index.update_trigger_effects(trigger)
+
+    def _update_effect_type(self, effect: Effect) -> None:
+        """Update the activation index (if it's in use) after the type of the effect changed"""
+        if self._activation_index is not None:
+            self._activation_index.update_effect_type(effect)
+
+    def _update_effect_trigger_id(self, effect: Effect, previous_trigger_id: int) -> None:
+        """Update the activation index (if it's in use) after the trigger id of the effect changed"""
+        if self._activation_index is not None:
+            self._activation_index.update_effect_target(effect, previous_trigger_id)
+
+    def _find_trigger_tree_nodes(self, trigger_id: int) -> List[int]:
+        """
+        Find all triggers in the trigger tree of the given trigger using the activation index. The triggers found in a
+        trigger are added before the trigger trees of these triggers are searched (depth first).
 
-        known_node_indexes += unknown_node_indexes
+        Args:
+            trigger_id: The ID of the trigger to start from
 
-        for index in unknown_node_indexes:
-            self._find_trigger_tree_nodes_recursively(self.triggers[index], known_node_indexes)
+        Returns:
+            The IDs of all triggers in the tree, starting with the given ID
+        """
+        activation_index = self._get_activation_index()
+        known_node_indexes = [trigger_id]
+        known = {trigger_id}
+
+        def discover(index: int) -> Iterator[int]:
+            new_node_indexes = [i for i in activation_index.successors(index) if i not in known]
+            known.update(new_node_indexes)
+            known_node_indexes.extend(new_node_indexes)
+            return iter(new_node_indexes)
+
+        # Iterative instead of recursive to not hit the recursion limit with long trigger chains
+        stack = [discover(trigger_id)]
+        while stack:
+            for index in stack[-1]:
+                stack.append(discover(index))
+                break
+            else:
+                stack.pop()
+        return known_node_indexes
 
     def _validate_and_retrieve_trigger_info(self, trigger_select) -> (int, int, Trigger):
         if type(trigger_select) is int:
@@ -573,13 +712,24 @@ class TriggerManager(AoE2Object):
         return trigger_index, display_index, trigger
 
     def get_summary_as_string(self) -> str:
-        return_string = "\nTrigger Summary:\n"
+        return "".join(self.iter_summary_lines())
+
+    def iter_summary_lines(self) -> Iterator[str]:
+        """
+        Streaming variant of ``get_summary_as_string``.
+
+        Returns:
+            A generator with the lines of the summary (including line endings, except for the ``<< No ... >>`` lines,
+                like in ``get_summary_as_string``)
+        """
+        yield "\n"
+        yield "Trigger Summary:\n"
 
         triggers = self.triggers
         display_order = self.trigger_display_order
 
         if len(display_order) == 0:
-            return_string += "\t<< No Triggers >>"
+            yield "\t<< No Triggers >>"
 
         longest_trigger_name = -1
         longest_index_notation = -1
@@ -599,34 +749,56 @@ class TriggerManager(AoE2Object):
 
             name_buffer = longest_trigger_name - len(trigger_name)
             index_buffer = longest_index_notation - (helper.get_int_len(display) + helper.get_int_len(trigger_index))
-            return_string += "\t" + trigger_name + (" " * name_buffer)
-            return_string += f" [Index: {trigger_index}, Display: {display}] {' ' * index_buffer}"
+            yield f"\t{trigger_name}{' ' * name_buffer} [Index: {trigger_index}, Display: {display}] " \
+                  f"{' ' * index_buffer}\t(conditions: {len(trigger.conditions)},  effects: {len(trigger.effects)})\n"
 
-            return_string += "\t(conditions: " + str(len(trigger.conditions)) + ", "
-            return_string += " effects: " + str(len(trigger.effects)) + ")\n"
+    def write_summary(self, fp: TextIO) -> None:
+        """
+        Write the summary (``get_summary_as_string``) to a file without creating the entire string in memory.
 
-        return return_string
+        Args:
+            fp (TextIO): The (text) file object to write to
+        """
+        fp.writelines(self.iter_summary_lines())
 
     def get_content_as_string(self) -> str:
-        return_string = "\nTriggers:\n"
+        return "".join(self.iter_content_lines())
+
+    def iter_content_lines(self) -> Iterator[str]:
+        """
+        Streaming variant of ``get_content_as_string``.
+
+        Returns:
+            A generator with the lines of the content (including line endings)
+        """
+        yield "\n"
+        yield "Triggers:\n"
 
         if len(self.triggers) == 0:
-            return_string += "\t<<No triggers>>\n"
+            yield "\t<<No triggers>>\n"
 
-        for trigger_index in self.trigger_display_order:
-            return_string += self.get_trigger_as_string(trigger_index) + "\n"
+        for display_index, trigger_index in enumerate(self.trigger_display_order):
+            yield from self._iter_trigger_lines(trigger_index, display_index, self.triggers[trigger_index])
+            yield "\n"
 
-        return return_string
+    def write_content(self, fp: TextIO) -> None:
+        """
+        Write the content (``get_content_as_string``) to a file without creating the entire string in memory.
+
+        Args:
+            fp (TextIO): The (text) file object to write to
+        """
+        fp.writelines(self.iter_content_lines())
 
     def get_trigger_as_string(self, trigger_select: Union[int, TriggerSelect]) -> str:
         trigger_index, display_index, trigger = self._validate_and_retrieve_trigger_info(trigger_select)
 
-        return_string = "\t'" + trigger.name + "'"
-        return_string += " [Index: " + str(trigger_index) + ", Display: " + str(display_index) + "]" + ":\n"
+        return "".join(self._iter_trigger_lines(trigger_index, display_index, trigger))
 
-        return_string += add_tabs(trigger.get_content_as_string(include_trigger_definition=False), 2)
-
-        return return_string
+    @staticmethod
+    def _iter_trigger_lines(trigger_index: int, display_index: int, trigger: Trigger) -> Iterator[str]:
+        yield f"\t'{trigger.name}' [Index: {trigger_index}, Display: {display_index}]:\n"
+        yield from add_tabs_to_lines(trigger.iter_content_lines(include_trigger_definition=False), 2)
 
     @staticmethod
     def _find_alterable_ce(trigger, trigger_ce_lock) -> (List[int], List[int]):
@@ -650,13 +822,6 @@ class TriggerManager(AoE2Object):
 
         return alter_conditions, alter_effects
 
-    @staticmethod
-    def _find_trigger_tree_nodes(trigger: Trigger) -> List[int]:
-        return [
-            effect.trigger_id for effect in trigger.effects if
-            effect.effect_type in [EffectId.ACTIVATE_TRIGGER, EffectId.DEACTIVATE_TRIGGER]
-        ]
-
     def __str__(self) -> str:
         return self.get_content_as_string()
 
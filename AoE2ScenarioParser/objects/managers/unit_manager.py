@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import List, Union, Tuple
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union, Tuple
 
 from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.helper.helper import raise_if_not_int_subclass
+from AoE2ScenarioParser.helper.printers import warn
 from AoE2ScenarioParser.objects.aoe2_object import AoE2Object
 from AoE2ScenarioParser.objects.data_objects.unit import Unit
 from AoE2ScenarioParser.objects.support.tile import Tile
+from AoE2ScenarioParser.objects.support.unit_query import UnitQuery
 from AoE2ScenarioParser.objects.support.uuid_list import UuidList
 from AoE2ScenarioParser.sections.retrievers.retriever_object_link import RetrieverObjectLink
 
@@ -22,11 +26,31 @@ class UnitManager(AoE2Object):
         super().__init__(**kwargs)
 
         self.units = units
-        self.reference_id_generator = create_id_generator(next_unit_id)
+        self._next_reference_id: int = next_unit_id
 
     @property
-    def next_unit_id(self):
-        return self.get_new_reference_id()
+    def next_unit_id(self) -> int:
+        """
+        The reference ID the next unit will get. It's always higher than the reference IDs of all units in the scenario
+        and all IDs given out before. Used to validate ``next_unit_id_to_place`` when committing, without searching
+        through all units.
+        """
+        return max(self._next_reference_id, self._get_highest_reference_id() + 1)
+
+    @property
+    def reference_id_generator(self) -> Iterator[int]:
+        """
+        Deprecated: Use ``get_new_reference_id()`` instead.
+
+        A generator returning a new reference ID (starting from ``next_unit_id``) each time it's called with next.
+        """
+        warn("The attribute `unit_manager.reference_id_generator` is deprecated. "
+             "It will be removed in the future. Please use unit_manager.get_new_reference_id() instead.")
+        return self._create_reference_id_generator()
+
+    def _create_reference_id_generator(self) -> Iterator[int]:
+        while True:
+            yield self.get_new_reference_id()
 
     @property
     def units(self):
@@ -42,7 +66,31 @@ class UnitManager(AoE2Object):
         elif len(value) < 9:
             value.extend([[] for _ in range(9 - len(value))])
 
-        self._units = UuidList(self._host_uuid, value)
+        if isinstance(value, UuidList) and value.uuid == self._host_uuid:
+            self._units = value
+        else:
+            self._units = UuidList(self._host_uuid, value)
+
+        self._garrison_index: Optional[Dict[int, Dict[int, Unit]]] = None
+        self._garrison_indexed_units: Dict[int, Unit] = {}
+        """All units in the garrison index (by their ``id()``). Holds the units, so their ``id()`` can't be reused"""
+        self._highest_reference_id: Optional[int] = None
+
+    def _deepcopy_entry(self, k, v):
+        # The garrison index refers to the units of this manager, the copy creates its own
+        if k == '_garrison_index':
+            return None
+        if k == '_garrison_indexed_units':
+            return {}
+        return super()._deepcopy_entry(k, v)
+
+    def update_garrison_index(self):
+        """
+        Function to rebuild the index of garrisoned units. Useful when units are added to or removed from the unit lists
+        manually instead of using the functions of the unit manager.
+        """
+        self._garrison_index = None
+        self._get_garrison_index()
 
     def update_unit_player_values(self):
         """Function to update all player values in all units. Useful when units are moved manually (in mass)."""
@@ -102,8 +150,88 @@ class UnitManager(AoE2Object):
         )
 
         self.units[player].append(unit)
+        self._index_units([unit])
         return unit
 
+    def add_units(self,
+                  player: Union[int, PlayerId],
+                  unit_consts: Union[int, Sequence[int]],
+                  xs: Sequence[float],
+                  ys: Sequence[float],
+                  zs: Union[float, Sequence[float]] = 0,
+                  rotations: Union[float, Sequence[float]] = 0,
+                  garrisoned_in_ids: Union[int, Sequence[int]] = -1,
+                  animation_frames: Union[int, Sequence[int]] = 0,
+                  statuses: Union[int, Sequence[int]] = 2,
+                  reference_ids: Sequence[int] = None,
+                  ) -> List[Unit]:
+        """
+        Adds multiple units for one player to the scenario at once. The units are defined by columns: the n-th unit is
+        created from the n-th value of each sequence. Parameters accepting a single value use that value for all units.
+
+        This is a lot faster than calling ``add_unit`` for each unit. The reference IDs are reserved as one block and the
+        units are added to the player's unit list in one go.
+
+        Args:
+            player: The player the units belong to.
+            unit_consts: The unit constant for all units or a sequence with one constant per unit
+            xs: The x locations of the units in the scenario. Defines the amount of units
+            ys: The y locations of the units in the scenario
+            zs: The z (height) location(s) of the units
+            rotations: The rotation(s) of the units
+            garrisoned_in_ids: The reference_id(s) of other units these units are garrisoned in
+            animation_frames: The animation frame(s) of the units
+            statuses: Unknown - Always 2. See ``add_unit``
+            reference_ids: The reference IDs of the units. When left empty a block of new IDs is reserved
+
+        Returns:
+            The Units created
+
+        Raises:
+            ValueError: When the sequences don't all have the same length
+            TypeError: When a unit constant is not an int (subclass)
+        """
+        amount = len(xs)
+        columns = [
+            _column(name, value, amount) for name, value in (
+                ('unit_consts', unit_consts), ('xs', xs), ('ys', ys), ('zs', zs), ('rotations', rotations),
+                ('garrisoned_in_ids', garrisoned_in_ids), ('animation_frames', animation_frames),
+                ('statuses', statuses),
+            )
+        ]
+        if reference_ids is not None:
+            columns.append(_column('reference_ids', reference_ids, amount))
+        if amount == 0:
+            return []
+        raise_if_not_int_subclass(set(columns[0]))
+
+        # Only reserve IDs once all input is valid, so failed calls don't use up IDs
+        if reference_ids is None:
+            columns.append(self.get_new_reference_ids(amount))
+
+        # All units are copies of one unit, only the values from the columns differ
+        template = Unit(
+            player=player, x=0, y=0, z=0, reference_id=-1, unit_const=columns[0][0], status=2, rotation=0,
+            initial_animation_frame=0, garrisoned_in_id=-1, host_uuid=self._host_uuid
+        ).__dict__
+
+        units = []
+        for const, x, y, z, rotation, garrisoned_in_id, frame, status, reference_id in zip(*columns):
+            attributes = template.copy()
+            attributes['_instance_number_history'] = []
+            attributes['x'], attributes['y'], attributes['z'] = x, y, z
+            attributes['_reference_id'], attributes['unit_const'] = reference_id, const
+            attributes['status'], attributes['rotation'] = status, rotation
+            attributes['initial_animation_frame'], attributes['_garrisoned_in_id'] = frame, garrisoned_in_id
+
+            unit = Unit.__new__(Unit)
+            unit.__dict__ = attributes
+            units.append(unit)
+
+        self.units[player].extend(units)
+        self._index_units(units)
+        return units
+
     def get_player_units(self, player: Union[int, PlayerId]) -> List[Unit]:
         """
         Returns a list of UnitObjects for the given player.
@@ -121,6 +249,28 @@ class UnitManager(AoE2Object):
             units += player_units
         return units
 
+    def query(self) -> UnitQuery:
+        """
+        Create a query to filter units. Filters can be chained and are all checked in a single pass over the units
+        when the query is used. Only the unit lists of the selected players are visited.
+
+        Examples:
+
+            Get all archers of player 1 in an area::
+
+                archers = unit_manager.query().player(PlayerId.ONE).const_in([UnitInfo.ARCHER.ID]).in_area(area)
+                for archer in archers:
+                    ...
+
+            Count the trees that have not been rotated::
+
+                unit_manager.query().player(PlayerId.GAIA).const_in(tree_consts).where(lambda u: u.rotation == 0).count()
+
+        Returns:
+            A new query object over all units in the scenario
+        """
+        return UnitQuery(self.units)
+
     def filter_units_by_const(self,
                               unit_consts: List[int],
                               blacklist: bool = False,
@@ -138,9 +288,12 @@ class UnitManager(AoE2Object):
         Returns:
             A list of units
         """
+        unit_consts = set(unit_consts)
         if unit_list is None:
-            unit_list = self.get_all_units()
-        if player_list is not None:
+            unit_list = self.get_all_units() if player_list is None else \
+                [unit for player in dict.fromkeys(player_list) for unit in self.units[player]]
+        elif player_list is not None:
+            player_list = set(player_list)
             unit_list = [unit for unit in unit_list if unit.player in player_list]
 
         # Both return statements can be combined using: ((unit.unit_const in unit_consts) != blacklist)
@@ -200,11 +353,11 @@ class UnitManager(AoE2Object):
             y2 = tile2.y2
 
         if players is not None:
-            players = players
+            players = set(players)
         elif ignore_players is not None:
-            players = [p for p in PlayerId if p not in ignore_players]
+            players = {p for p in PlayerId if p not in ignore_players}
         else:
-            players = [p for p in PlayerId]
+            players = set(PlayerId)
 
         if unit_list is None:
             unit_list = self.get_all_units()
@@ -212,42 +365,142 @@ class UnitManager(AoE2Object):
         return [unit for unit in unit_list
                 if x1 <= unit.x <= x2 and y1 <= unit.y <= y2 and unit.player in players]
 
-    def change_ownership(self, unit: Unit, to_player: Union[int, PlayerId]) -> None:
+    def change_ownership(self, unit: Union[Unit, Iterable[Unit]], to_player: Union[int, PlayerId]) -> None:
+        """
+        Changes the ownership of a unit (or multiple units) to the given player. The units are appended to the unit list
+        of the given player in the given order.
+
+        When changing the ownership of many units, pass them all at once. The unit list of every player involved is
+        then only rebuilt once, instead of searching through it for every unit.
+
+        Args:
+            unit: The unit object (or multiple unit objects) which ownership will be changed
+            to_player: The player that'll get ownership over the unit(s) (using PlayerId enum)
+
+        Units that are not in the unit list of their ``player`` are searched for in the unit lists of all players. Units
+        that aren't in any unit list are ignored.
+        """
+        to_player = PlayerId(to_player)
+        units = [unit] if isinstance(unit, Unit) else list(unit)
+
+        units_per_player: Dict[PlayerId, Dict[int, Unit]] = {}
+        for unit_ in units:
+            if unit_.player != to_player:
+                units_per_player.setdefault(unit_.player, {})[id(unit_)] = unit_
+
+        moved_ids = set()
+        for player, player_units in units_per_player.items():
+            if len(player_units) == 1:
+                # A single unit is found faster by the (identity based) list.remove
+                unit_ = next(iter(player_units.values()))
+                try:
+                    self.units[player].remove(unit_)
+                    moved_ids.add(id(unit_))
+                except ValueError:
+                    pass
+            else:
+                removed = self._remove_from_player(player, lambda u: id(u) in player_units)
+                moved_ids.update(map(id, removed))
+
+        missing = {id(unit_): unit_ for units_ in units_per_player.values() for unit_ in units_.values()}
+        for unit_id in moved_ids:
+            missing.pop(unit_id)
+        if missing:
+            # The player of these units doesn't match the unit list they're in (for example when the unit lists have
+            # been edited directly). Search the lists of all other players for them instead
+            for player in PlayerId.all():
+                if player != to_player:
+                    removed = self._remove_from_player(player, lambda u: id(u) in missing)
+                    moved_ids.update(map(id, removed))
+
+        moved = []
+        for unit_ in units:
+            if id(unit_) in moved_ids:
+                moved_ids.remove(id(unit_))
+                unit_._player = to_player
+                moved.append(unit_)
+        self.units[to_player].extend(moved)
+
+    def get_garrisoned_units(self, container: Union[Unit, int]) -> List[Unit]:
+        """
+        Get the units garrisoned in a unit. Uses an index of all garrisons, so the units on the map are not searched.
+
+        Args:
+            container: The unit (or its reference id) to get the garrisoned units of
+
+        Returns:
+            The units garrisoned in the given unit
+        """
+        reference_id = container.reference_id if isinstance(container, Unit) else container
+        return list(self._get_garrison_index().get(reference_id, {}).values())
+
+    def get_garrisons(self) -> Dict[int, List[Unit]]:
+        """
+        Get all garrisons in the scenario. Please note that the unit a garrison belongs to might not exist (anymore).
+
+        Returns:
+            A dict with the reference id of the units with a garrison as keys and the garrisoned units as values
+        """
+        return {reference_id: list(units.values()) for reference_id, units in self._get_garrison_index().items()}
+
+    def move_garrison(self, source: Union[Unit, int], target: Union[Unit, int]) -> List[Unit]:
         """
-        Changes a unit's ownership to the given player.
+        Move all units garrisoned in one unit to another unit. Only the ``garrisoned_in_id`` of the units is changed.
 
         Args:
-            unit: The unit object which ownership will be changed
-            to_player: The player that'll get ownership over the unit (using PlayerId enum)
+            source: The unit (or its reference id) to move the garrisoned units from
+            target: The unit (or its reference id) to move the garrisoned units to. Use ``-1`` to ungarrison the units
+
+        Returns:
+            The units that have been moved
         """
-        for i, player_unit in enumerate(self.units[unit.player]):
-            if player_unit == unit:
-                del self.units[unit.player][i]
-                self.units[to_player].append(unit)
-                unit._player = PlayerId(to_player)
-                return
+        target_id = target.reference_id if isinstance(target, Unit) else target
+        units = self.get_garrisoned_units(source)
+        for unit in units:
+            unit.garrisoned_in_id = target_id
+        return units
 
     def get_new_reference_id(self) -> int:
         """
         Get a new ID each time the function is called. Starting from the current highest ID.
 
         Returns:
-            The newly generator ID
+            The newly generated ID
+        """
+        reference_id = self.next_unit_id
+        self._next_reference_id = reference_id + 1
+        return reference_id
+
+    def get_new_reference_ids(self, amount: int) -> range:
+        """
+        Reserve a contiguous block of new IDs at once. Starting from the current highest ID. None of the IDs is used by
+        a unit in the scenario or given out before.
+
+        Args:
+            amount: The amount of IDs to reserve
+
+        Returns:
+            The range of reserved IDs
         """
-        return next(self.reference_id_generator)
+        start = self.next_unit_id
+        self._next_reference_id = start + amount
+        return range(start, start + amount)
 
-    def find_highest_reference_id(self) -> int:
+    def find_highest_reference_id(self, rescan: bool = False) -> int:
         """
-        Find the highest ID in the map. Searches through all units for the highest ID.
+        Find the highest ID in the map. The highest ID is kept up to date when units are added or removed, or when the
+        reference ID of a unit changes. Only the first time (or when rescanning) all units are searched.
+
+        Args:
+            rescan: Search through all units again. Useful when units are added to the unit lists manually instead of
+                using the functions of the unit manager.
 
         Returns:
             The highest ID in the map
         """
-        highest_id = 0  # If no units, default to 0
-        for player in PlayerId.all():
-            for unit in self.units[player]:
-                highest_id = max(highest_id, unit.reference_id)
-        return highest_id
+        if rescan:
+            self._highest_reference_id = None
+        return max(0, self._get_highest_reference_id())  # If no units, default to 0
 
     def remove_unit(self, reference_id: int = None, unit: Unit = None) -> None:
         """
@@ -269,25 +522,169 @@ class UnitManager(AoE2Object):
                 for i, unit in enumerate(self.units[player]):
                     if unit.reference_id == reference_id:
                         del self.units[player][i]
+                        self._unindex_units([unit])
                         return
         elif unit is not None:
             self.units[unit.player].remove(unit)
+            self._unindex_units([unit])
+
+    def remove_units(self,
+                     predicate: Callable[[Unit], bool] = None,
+                     reference_ids: Iterable[int] = None,
+                     units: Iterable[Unit] = None,
+                     players: Iterable[Union[int, PlayerId]] = None) -> List[Unit]:
+        """
+        Removes multiple units at once. Use one of: ``predicate``, ``reference_ids`` or ``units``. The unit list of each
+        player is only rebuilt once (and only when units are removed from it), instead of searching through it for every
+        unit like when using ``remove_unit`` repeatedly.
+
+        Args:
+            predicate: A function which is called with each unit. Units for which it returns True are removed
+            reference_ids: The ids of the units to remove. Note that these are NOT unit constants
+            units: The Unit objects to remove
+            players: (Optional) The players to remove units from. If not used, all players are used
+
+        Returns:
+            The units that have been removed
+
+        Raises:
+            ValueError: When not exactly one of predicate, reference_ids and units is used
+        """
+        if sum(argument is not None for argument in (predicate, reference_ids, units)) != 1:
+            raise ValueError("Use exactly one of the predicate, reference_ids and units arguments.")
+
+        if reference_ids is not None:
+            reference_ids = set(reference_ids)
+            predicate = lambda unit: unit.reference_id in reference_ids
+        elif units is not None:
+            unit_ids = {id(unit) for unit in units}
+            predicate = lambda unit: id(unit) in unit_ids
+
+        removed = []
+        for player in (PlayerId.all() if players is None else dict.fromkeys(players)):
+            removed += self._remove_from_player(player, predicate)
+        self._unindex_units(removed)
+        return removed
 
     def remove_eye_candy(self) -> None:
-        eye_candy_ids = [1351, 1352, 1353, 1354, 1355, 1358, 1359, 1360, 1361, 1362, 1363, 1364, 1365, 1366]
-        self.units[0] = [gaia_unit for gaia_unit in self.units[0] if gaia_unit.unit_const not in eye_candy_ids]
+        eye_candy_ids = {1351, 1352, 1353, 1354, 1355, 1358, 1359, 1360, 1361, 1362, 1363, 1364, 1365, 1366}
+        self.remove_units(lambda gaia_unit: gaia_unit.unit_const in eye_candy_ids, players=[PlayerId.GAIA])
 
+    def _remove_from_player(self, player: Union[int, PlayerId], predicate: Callable[[Unit], bool]) -> List[Unit]:
+        """
+        Remove the units matching the predicate from the unit list of a player. The list is rebuilt (in place) once
+        and only when units have been removed.
+
+        Args:
+            player: The player to remove the units from
+            predicate: The function deciding which units to remove
 
-def create_id_generator(start_id: int):
+        Returns:
+            The removed units
+        """
+        kept, removed = [], []
+        for unit in self.units[player]:
+            (removed if predicate(unit) else kept).append(unit)
+        if removed:
+            self.units[player][:] = kept
+        return removed
+
+    def _get_highest_reference_id(self) -> int:
+        """Get the highest reference ID of all units (-1 when there are no units). Only searches the first time"""
+        if self._highest_reference_id is None:
+            self._highest_reference_id = max(
+                (unit.reference_id for player_units in self.units for unit in player_units), default=-1
+            )
+        return self._highest_reference_id
+
+    def _update_reference_id(self, unit: Unit, previous_reference_id: int) -> None:
+        """Update the highest reference ID after the reference ID of the unit changed"""
+        if self._highest_reference_id is None:
+            return
+        if unit.reference_id > self._highest_reference_id:
+            self._highest_reference_id = unit.reference_id
+        elif previous_reference_id == self._highest_reference_id:
+            self._highest_reference_id = None
+
+    def _index_units(self, units: Iterable[Unit]) -> None:
+        """Add the given units to the garrison index and the highest reference ID"""
+        self._index_garrisons(units)
+        if self._highest_reference_id is not None:
+            for unit in units:
+                if unit.reference_id > self._highest_reference_id:
+                    self._highest_reference_id = unit.reference_id
+
+    def _unindex_units(self, units: Sequence[Unit]) -> None:
+        """Remove the given units from the garrison index and the highest reference ID"""
+        self._unindex_garrisons(units)
+        if self._highest_reference_id is not None and \
+                any(unit.reference_id >= self._highest_reference_id for unit in units):
+            self._highest_reference_id = None  # Searched again when needed
+
+    def _get_garrison_index(self) -> Dict[int, Dict[int, Unit]]:
+        """
+        Get the index of garrisoned units: the reference id of the units with a garrison mapped to the garrisoned units
+        (by their ``id()``). The index is built in one pass over all units the first time it's used. Afterwards it's
+        kept up to date by the unit manager and by the ``garrisoned_in_id`` property of the units.
+        """
+        if self._garrison_index is None:
+            self._garrison_index = {}
+            self._garrison_indexed_units = {}
+            for player_units in self.units:
+                self._index_garrisons(player_units)
+        return self._garrison_index
+
+    def _index_garrisons(self, units: Iterable[Unit]) -> None:
+        """Add the given units to the garrison index (if it's in use)"""
+        if self._garrison_index is None:
+            return
+        for unit in units:
+            self._garrison_indexed_units[id(unit)] = unit
+            if unit.garrisoned_in_id != -1:
+                self._garrison_index.setdefault(unit.garrisoned_in_id, {})[id(unit)] = unit
+
+    def _unindex_garrisons(self, units: Iterable[Unit]) -> None:
+        """Remove the given units from the garrison index (if it's in use)"""
+        if self._garrison_index is None:
+            return
+        for unit in units:
+            self._garrison_indexed_units.pop(id(unit), None)
+            self._remove_from_garrison(unit, unit.garrisoned_in_id)
+
+    def _update_garrison(self, unit: Unit, previous_garrisoned_in_id: int) -> None:
+        """Move the unit in the garrison index after its ``garrisoned_in_id`` changed"""
+        if self._garrison_index is None or self._garrison_indexed_units.get(id(unit)) is not unit:
+            return
+        self._remove_from_garrison(unit, previous_garrisoned_in_id)
+        if unit.garrisoned_in_id != -1:
+            self._garrison_index.setdefault(unit.garrisoned_in_id, {})[id(unit)] = unit
+
+    def _remove_from_garrison(self, unit: Unit, garrisoned_in_id: int) -> None:
+        """Remove the unit from the garrison with the given id in the garrison index"""
+        garrison = self._garrison_index.get(garrisoned_in_id)
+        if garrison is not None:
+            garrison.pop(id(unit), None)
+            if not garrison:
+                del self._garrison_index[garrisoned_in_id]
+
+
+def _column(name: str, value: Union[Any, Sequence[Any]], length: int) -> Sequence[Any]:
     """
-    Create generator for increasing value
+    Get a column (sequence) of values for bulk functions. Single values are repeated.
 
     Args:
-        start_id (int): The id to start returning
+        name: The name of the parameter (used in the error message)
+        value: A single value or a sequence of values
+        length: The length the column should have
 
     Returns:
-        A generator which will return a +1 ID value for each time called with next.
+        A sequence of the given length
+
+    Raises:
+        ValueError: When the given sequence does not have the given length
     """
-    while True:
-        yield start_id
-        start_id += 1
+    if not hasattr(value, '__len__'):
+        return list(repeat(value, length))
+    if len(value) != length:
+        raise ValueError(f"The length of '{name}' ({len(value)}) does not match the amount of units ({length})")
+    return value
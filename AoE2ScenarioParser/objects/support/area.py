@@ -3,18 +3,21 @@ from __future__ import annotations
 import copy
 import math
 from enum import Enum
-from typing import Dict, TYPE_CHECKING, List, Tuple
+from itertools import compress
+from typing import Callable, Dict, Iterator, TYPE_CHECKING, List, Tuple
 from uuid import UUID
 
 from ordered_set import OrderedSet
 
-from AoE2ScenarioParser.helper.helper import xy_to_i, validate_coords
+from AoE2ScenarioParser.helper.helper import validate_coords
+from AoE2ScenarioParser.helper.mask_functions import label_chunks
+from AoE2ScenarioParser.objects.support.map_bound import MapBound
+from AoE2ScenarioParser.objects.support.selection import Selection
 from AoE2ScenarioParser.objects.support.tile import Tile
 from AoE2ScenarioParser.scenarios.scenario_store import getters
 
 if TYPE_CHECKING:
     from AoE2ScenarioParser.objects.data_objects.terrain_tile import TerrainTile
-    from AoE2ScenarioParser.scenarios.aoe2_scenario import AoE2Scenario
 
 
 class AreaState(Enum):
@@ -52,10 +55,10 @@ class AreaAttr(Enum):
     BLOCK_SIZE_Y = "block_size_y"
 
 
-class Area:
+class Area(MapBound):
     # Stored here so it won't be defined by each function call but also not to clutter the module scope.
-    _recursion_steps = [Tile(0, -1), Tile(1, 0), Tile(0, 1), Tile(-1, 0)]
-    """Values used for recursion steps"""
+    _invert_table = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+    """Translation table used to invert rows of a mask"""
 
     def __init__(self, map_size: int = None, uuid: UUID = None) -> None:
         """
@@ -67,13 +70,7 @@ class Area:
             map_size: The size of the map this area object will handle
             uuid: The UUID of the scenario this area belongs to
         """
-        if map_size is None and uuid is None:
-            raise ValueError("Cannot create area object without knowing the map size or a UUID from a scenario.")
-        super().__init__()
-
-        self.uuid: UUID = uuid
-        if uuid is None:
-            self._map_size_value = map_size - 1
+        super().__init__(map_size=map_size, uuid=uuid)
 
         self.state: AreaState = AreaState.FULL
         self.inverted: bool = False
@@ -100,26 +97,17 @@ class Area:
     def from_uuid(cls, uuid: UUID) -> Area:
         return cls(uuid=uuid)
 
-    @property
-    def _map_size(self) -> int:
-        if self.uuid is not None:
-            return getters.get_map_size(self.uuid) - 1
-        else:
-            return self._map_size_value
+    def __or__(self, other: Area | Selection) -> Selection:
+        """Combine with another area or selection into a selection containing the tiles selected by either"""
+        return Selection.combine('|', self, other)
 
-    def associate_scenario(self, scenario: AoE2Scenario) -> None:
-        """
-        Associate area with scenario. Saves scenario UUID in this area object.
+    def __and__(self, other: Area | Selection) -> Selection:
+        """Combine with another area or selection into a selection containing the tiles selected by both"""
+        return Selection.combine('&', self, other)
 
-        Args:
-            scenario: The scenario to associate with
-        """
-        self.uuid = scenario.uuid
-
-    def _force_association(self):
-        """Raise ValueError if UUID is not set"""
-        if self.uuid is None:
-            raise ValueError("Area object not associated with scenario. Cannot request terrain information")
+    def __sub__(self, other: Area | Selection) -> Selection:
+        """Combine with another area or selection into a selection without the tiles selected by the other"""
+        return Selection.combine('-', self, other)
 
     # ============================ Conversion functions ============================
 
@@ -143,10 +131,36 @@ class Area:
                     ...,   (4,5), (5,5)
                 ]
         """
-        tiles = OrderedSet(
-            Tile(x, y) for y in self.get_range_y() for x in self.get_range_x() if self.is_within_selection(x, y)
+        mask = self.to_mask()
+        if as_terrain:
+            return self._mask_to_terrain_tiles(mask)
+
+        map_width = self._map_size + 1
+        range_x = self.get_range_x()
+        return OrderedSet(
+            Tile(x, y)
+            for y in self.get_range_y()
+            for x in compress(range_x, mask[y * map_width + self.x1:y * map_width + self.x2 + 1])
         )
-        return self._tiles_to_terrain_tiles(tiles) if as_terrain else tiles
+
+    def to_mask(self) -> bytearray:
+        """
+        Converts the selection to a mask of the entire map. The mask contains one byte per tile in the same order as the
+        terrain list of the map manager (``index = y * map_width + x``). Selected tiles are ``1``, all others are ``0``.
+
+        The mask is created row by row. Each selection state (and inversion) results in a few different rows which are
+        copied into the mask, so no tile is checked individually.
+
+        Returns:
+            A bytearray with a length of ``map_width * map_width``
+        """
+        map_width = self._map_size + 1
+        mask = bytearray(map_width * map_width)
+
+        for y, row in zip(self.get_range_y(), self._get_mask_rows()):
+            start = y * map_width + self.x1
+            mask[start:start + len(row)] = row
+        return mask
 
     def to_chunks(
             self,
@@ -168,19 +182,11 @@ class Area:
         Returns:
             A list of OrderedSets of Tiles ((x, y) named tuple) of the selection.
         """
-        tiles = self.to_coords()
-
         # Shortcut for states that CANNOT be more than one chunk
         if self.state in AreaState.unchunkables():
-            return [tiles]
-
-        chunks = []
-        while len(tiles):
-            chunk = self._get_chunk(tiles[0], tiles, separate_by_id)
-            tiles.difference_update(chunk)
+            return [self.to_coords(as_terrain)]
 
-            chunks.append(self._tiles_to_terrain_tiles(chunk) if as_terrain else chunk)
-        return chunks
+        return [self._indices_to_tiles(chunk, as_terrain) for chunk in self._label_chunks(separate_by_id)]
 
     def to_dict(self, prefix: str ="area_") -> Dict[str, int]:
         """
@@ -658,54 +664,129 @@ class Area:
             for coord in args
         ]
 
-    def _tiles_to_terrain_tiles(self, tiles: OrderedSet[Tile]) -> OrderedSet['TerrainTile']:
+    def _get_mask_rows(self) -> Iterator[bytes]:
         """
-        Converts the selection to an OrderedSet of terrain tile objects from the map manager.
+        Generates the rows of the selection (from y1 to y2). Each row contains one byte per x coordinate within the
+        selection (from x1 to x2). Selected tiles are ``1``, all others are ``0``.
+
+        Raises:
+            ValueError: if the area is in the lines state without a valid axis
+        """
+        range_x, range_y = self.get_range_x(), self.get_range_y()
+        full, empty = b'\x01' * len(range_x), bytes(len(range_x))
+
+        def row_from(predicate: Callable[[int], bool]) -> bytes:
+            return bytes(map(predicate, range_x))
+
+        if self.state == AreaState.EDGE:
+            row = row_from(lambda x: 0 <= x - self.x1 < self.line_width_x or 0 <= self.x2 - x < self.line_width_x)
+            rows = (full if 0 <= y - self.y1 < self.line_width_y or 0 <= self.y2 - y < self.line_width_y else row
+                    for y in range_y)
+        elif self.state == AreaState.GRID:
+            step_x, step_y = self.block_size_x + self.gap_size_x, self.block_size_y + self.gap_size_y
+            row = row_from(lambda x: (x - self.x1) % step_x < self.block_size_x)
+            rows = (row if (y - self.y1) % step_y < self.block_size_y else empty for y in range_y)
+        elif self.state == AreaState.LINES:
+            if self.axis == "x":
+                step_y = self.gap_size_y + self.line_width_y
+                rows = (full if (y - self.y1) % step_y < self.line_width_y else empty for y in range_y)
+            elif self.axis == "y":
+                step_x = self.gap_size_x + self.line_width_x
+                row = row_from(lambda x: (x - self.x1) % step_x < self.line_width_x)
+                rows = (row for _ in range_y)
+            else:
+                raise ValueError("Invalid axis value. Should be either x or y")
+        elif self.state == AreaState.CORNERS:
+            row = row_from(lambda x: self.x1 <= x < self.x1 + self.corner_size_x or
+                                     self.x2 - self.corner_size_x < x <= self.x2)
+            rows = (row if self.y1 <= y < self.y1 + self.corner_size_y or self.y2 - self.corner_size_y < y <= self.y2
+                    else empty for y in range_y)
+        else:
+            rows = (full for _ in range_y)
+
+        if self.inverted:
+            return (row.translate(Area._invert_table) for row in rows)
+        return rows
+
+    def _mask_to_terrain_tiles(self, mask: bytearray) -> OrderedSet['TerrainTile']:
+        """
+        Converts a mask to an OrderedSet of terrain tile objects from the map manager.
         Can only be used if the area has been associated with a scenario.
 
         Returns:
-            An OrderedSet of terrain tiles from the map manager based on the selection.
+            An OrderedSet of terrain tiles from the map manager based on the mask.
         """
         self._force_association()
         terrain = getters.get_terrain(self.uuid)
-        map_size = self._map_size
-        return OrderedSet(terrain[xy_to_i(x, y, map_size + 1)] for (x, y) in tiles)
+        return OrderedSet(compress(terrain, mask))
 
-    def _get_chunk(self, tile: Tile, tiles: OrderedSet[Tile], use_chunk_ids: bool) -> OrderedSet[Tile]:
+    def _label_chunks(self, use_chunk_ids: bool) -> List[List[int]]:
         """
-        Finds all tiles within the chunk of the given tile. Separation is based on if the tiles are touching combined
-        with if the tiles have the same chunk ID if use_chunk_ids is True
+        Splits the selection into chunks. Tiles are in the same chunk when they're connected through tiles sharing an
+        edge, and, if use_chunk_ids is True, all have the same chunk ID.
 
         Args:
-            tile: The tile to find all other tiles within the chunk from
-            tiles: A set with tiles to choose from
             use_chunk_ids: If chunk IDs should be taken into consideration when splitting chunks. If set to False,
                 chunks are split based on if they touch each other.
 
         Returns:
-            A sorted OrderedSet with all tiles within the found chunk
+            A list of chunks, each chunk being a list of map indices (``y * map_width + x``)
         """
-        queue, found = [tile], OrderedSet([tile])
+        return label_chunks(
+            self.to_mask(), self._map_size + 1, self.x1, self.y1, self.x2, self.y2,
+            chunk_id=self._get_chunk_id_function() if use_chunk_ids else None
+        )
 
-        i = 0
-        while i < len(queue):
-            tile = queue[i]
-            chunk_id = self._get_chunk_id(tile) if use_chunk_ids else -1
+    def _get_chunk_id_function(self) -> Callable[[int, int], int]:
+        """
+        Get a function which calculates the chunk ID of a tile (x, y) within the selection for the current state and
+        configs. See ``_get_chunk_id`` for more information about chunk IDs.
+
+        Returns:
+            A function accepting the x and y coordinate of a tile within the selection, returning the chunk ID
 
-            for step in Area._recursion_steps:  # Adjacent tiles (y-, x+, y+, x-)
-                nt = Tile(tile.x + step.x, tile.y + step.y)
+        Raises:
+            ValueError: if the area configuration isn't supported by this function (can be raised by the returned
+                function).
+        """
+        x1, y1, x2, y2 = self.x1, self.y1, self.x2, self.y2
 
-                if use_chunk_ids and self._get_chunk_id(nt) != chunk_id:
-                    continue
-                if nt in found:
-                    continue
-                if nt in tiles:
-                    found.append(nt)
-                    queue.append(nt)
-            i += 1
-        map_size = self._map_size
+        if self.state in AreaState.unchunkables():
+            return lambda x, y: 0
 
-        return OrderedSet(sorted(found, key=lambda t: t.y * map_size + t.x))
+        elif self.state == AreaState.GRID:
+            if self.inverted:
+                return lambda x, y: 0
+            step_x, step_y = self.block_size_x + self.gap_size_x, self.block_size_y + self.gap_size_y
+            per_row = math.ceil(self.get_height() / step_x)
+            return lambda x, y: (x - x1) // step_x + (y - y1) // step_y * per_row
+
+        elif self.state == AreaState.LINES:
+            if self.axis == "x":
+                step_y = self.line_width_y + self.gap_size_y
+                return lambda x, y: (y - y1) // step_y
+            elif self.axis == "y":
+                step_x = self.line_width_x + self.gap_size_x
+                return lambda x, y: (x - x1) // step_x
+
+        elif self.state == AreaState.CORNERS:
+            corner_x, corner_y = self.corner_size_x, self.corner_size_y
+
+            def corner_id(x: int, y: int) -> int:
+                # 0 Left, 1 Top, 2 Right, 3 Bottom
+                left, right = x1 <= x < x1 + corner_x, x2 - corner_x < x <= x2
+                top, bottom = y1 <= y < y1 + corner_y, y2 - corner_y < y <= y2
+                if left and top:
+                    return 0
+                if right and top:
+                    return 1
+                if right and bottom:
+                    return 2
+                if left and bottom:
+                    return 3
+                raise _invalid_chunk_id_configuration()
+            return corner_id
+        raise _invalid_chunk_id_configuration()
 
     def _get_chunk_id(self, tile: Tile) -> int:
         """
@@ -725,32 +806,9 @@ class Area:
         """
         if not self.is_within_selection(tile=tile):
             return -1
+        return self._get_chunk_id_function()(tile.x, tile.y)
 
-        if self.state in AreaState.unchunkables():
-            return 0
 
-        elif self.state == AreaState.GRID:
-            if self.inverted:
-                return 0
-            per_row = math.ceil(self.get_height() / (self.block_size_x + self.gap_size_x))
-            return (tile.x - self.x1) // (self.block_size_x + self.gap_size_x) + \
-                   (tile.y - self.y1) // (self.block_size_y + self.gap_size_y) * per_row
-
-        elif self.state == AreaState.LINES:
-            if self.axis == "x":
-                return (tile.y - self.y1) // (self.line_width_y + self.gap_size_y)
-            elif self.axis == "y":
-                return (tile.x - self.x1) // (self.line_width_x + self.gap_size_x)
-
-        elif self.state == AreaState.CORNERS:
-            # 0 Left, 1 Top, 2 Right, 3 Bottom
-            if self.x1 <= tile.x < self.x1 + self.corner_size_x and self.y1 <= tile.y < self.y1 + self.corner_size_y:
-                return 0
-            if self.x2 - self.corner_size_x < tile.x <= self.x2 and self.y1 <= tile.y < self.y1 + self.corner_size_y:
-                return 1
-            if self.x2 - self.corner_size_x < tile.x <= self.x2 and self.y2 - self.corner_size_y < tile.y <= self.y2:
-                return 2
-            if self.x1 <= tile.x < self.x1 + self.corner_size_x and self.y2 - self.corner_size_y < tile.y <= self.y2:
-                return 3
-        raise ValueError(f"Invalid area configuration for getting the Chunk ID. If you believe this is an error, "
-                         f"please raise an issue on github or in the Discord server")
+def _invalid_chunk_id_configuration() -> ValueError:
+    return ValueError(f"Invalid area configuration for getting the Chunk ID. If you believe this is an error, "
+                      f"please raise an issue on github or in the Discord server")
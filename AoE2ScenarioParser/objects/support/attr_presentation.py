@@ -10,6 +10,7 @@ from AoE2ScenarioParser.datasets.trigger_lists import DiplomacyState, Operation,
     ButtonLocation, PanelLocation, TimeUnit, VisibilityState, DifficultyLevel, TechnologyState, Comparison, \
     ObjectAttribute, Attribute, ObjectType, ObjectClass, TerrainRestrictions, HeroStatusFlag, BlastLevel, \
     SmartProjectile, DamageClass, Hotkey, ColorMood, ObjectState, ActionType
+from AoE2ScenarioParser.helper.exceptions import ScenarioNotFoundError
 from AoE2ScenarioParser.helper.helper import get_enum_from_unit_const
 from AoE2ScenarioParser.helper.list_functions import listify
 from AoE2ScenarioParser.helper.pretty_format import pretty_format_name
@@ -188,7 +189,7 @@ def transform_value_by_representation(representation, value, uuid):
                 suffix_original_value = False
         else:
             raise ValueError(f"Unknown representation: '{representation}'")
-    except KeyError:
+    except (KeyError, ScenarioNotFoundError):  # Scenario not found: The object is from a scenario that's been closed
         value_representation, format_value_repr = unknown
 
     if format_value_repr:
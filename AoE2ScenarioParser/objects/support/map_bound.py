@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Iterable, TYPE_CHECKING
+from uuid import UUID
+
+from ordered_set import OrderedSet
+
+from AoE2ScenarioParser.objects.support.tile import Tile
+from AoE2ScenarioParser.scenarios.scenario_store import getters
+
+if TYPE_CHECKING:
+    from AoE2ScenarioParser.objects.data_objects.terrain_tile import TerrainTile
+    from AoE2ScenarioParser.scenarios.aoe2_scenario import AoE2Scenario
+
+
+class MapBound:
+    def __init__(self, map_size: int = None, uuid: UUID = None) -> None:
+        """
+        Base for objects selecting tiles on the map of a specific size (``Area`` and ``Selection``). The map size is
+        either given directly or taken from the scenario the object is associated with.
+
+        **Please note**: Setting a ``uuid`` will always overwrite the ``map_size`` attribute, even if it's not ``None``.
+
+        Args:
+            map_size: The size of the map this object will handle
+            uuid: The UUID of the scenario this object belongs to
+        """
+        if map_size is None and uuid is None:
+            raise ValueError(
+                f"Cannot create {type(self).__name__.lower()} object without knowing the map size or a UUID from a "
+                f"scenario."
+            )
+
+        self.uuid: UUID = uuid
+        if uuid is None:
+            self._map_size_value = map_size - 1
+
+    @property
+    def _map_size(self) -> int:
+        if self.uuid is not None:
+            return getters.get_map_size(self.uuid) - 1
+        else:
+            return self._map_size_value
+
+    def associate_scenario(self, scenario: AoE2Scenario) -> None:
+        """
+        Associate this object with a scenario. Saves the scenario UUID in this object.
+
+        Args:
+            scenario: The scenario to associate with
+        """
+        self.uuid = scenario.uuid
+
+    def _force_association(self):
+        """Raise ValueError if UUID is not set"""
+        if self.uuid is None:
+            raise ValueError(
+                f"{type(self).__name__} object not associated with scenario. Cannot request terrain information"
+            )
+
+    def _indices_to_tiles(self, indices: Iterable[int], as_terrain: bool) -> OrderedSet[Tile | 'TerrainTile']:
+        """
+        Converts map indices (``y * map_width + x``) to an OrderedSet of Tile objects or terrain tile objects from the
+        map manager. Terrain tiles can only be used if this object has been associated with a scenario.
+
+        Args:
+            indices: The map indices to convert
+            as_terrain: If the indices should be converted to terrain tiles instead of Tile objects
+
+        Returns:
+            An OrderedSet of Tiles or terrain tiles in the order of the given indices
+        """
+        if as_terrain:
+            self._force_association()
+            terrain = getters.get_terrain(self.uuid)
+            return OrderedSet(terrain[i] for i in indices)
+
+        map_width = self._map_size + 1
+        return OrderedSet(Tile(i % map_width, i // map_width) for i in indices)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import operator
+from itertools import compress
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING, Tuple, Union
+from uuid import UUID
+
+from ordered_set import OrderedSet
+
+from AoE2ScenarioParser.helper.mask_functions import label_chunks
+from AoE2ScenarioParser.objects.support.map_bound import MapBound
+from AoE2ScenarioParser.objects.support.tile import Tile
+
+if TYPE_CHECKING:
+    from AoE2ScenarioParser.objects.data_objects.terrain_tile import TerrainTile
+    from AoE2ScenarioParser.objects.support.area import Area
+
+_operators: Dict[str, Tuple[Callable[[int, int], int], Callable[[bool, bool], bool]]] = {
+    '|': (operator.or_, operator.or_),
+    '&': (operator.and_, operator.and_),
+    '-': (lambda a, b: a & ~b, lambda a, b: a and not b),
+}
+"""The functions per operator to combine masks (as int) and to combine single tiles (as bool)"""
+
+
+class Selection(MapBound):
+    def __init__(self, map_size: int = None, uuid: UUID = None) -> None:
+        """
+        Combination of areas (and/or other selections) on the map. Created by combining ``Area`` objects using ``|``
+        (union), ``&`` (intersection) and ``-`` (difference). Creating an empty selection is possible (using the map size
+        or UUID) to start combining from.
+
+        A selection is evaluated lazily. The areas it's created from are only converted to a mask when the selection is
+        used, so changes made to these areas (after combining them) are included.
+
+        **Please note**: Setting a ``uuid`` will always overwrite the ``map_size`` attribute, even if it's not ``None``.
+
+        Examples:
+
+            Select a square without the center and with the edge of another square::
+
+                selection = area1 - area2.copy().shrink(2) | area3.use_only_edge()
+                tiles = selection.to_coords()
+
+        Args:
+            map_size: The size of the map this selection will handle
+            uuid: The UUID of the scenario this selection belongs to
+        """
+        super().__init__(map_size=map_size, uuid=uuid)
+
+        self._operator: Optional[str] = None
+        self._operands: Tuple[Union[Area, Selection], ...] = ()
+
+    @classmethod
+    def combine(cls, operator_: str, left: Union[Area, Selection], right: Union[Area, Selection]) -> Selection:
+        """
+        Create a selection combining two areas or selections.
+
+        Args:
+            operator_: The operator to combine them with. One of: ``|`` (union), ``&`` (intersection) or ``-``
+                (difference)
+            left: The left operand
+            right: The right operand
+
+        Returns:
+            The new selection
+
+        Raises:
+            ValueError: When the operator is unknown or the operands don't have the same map size
+        """
+        if operator_ not in _operators:
+            raise ValueError(f"Unknown selection operator: '{operator_}'. Use one of: {list(_operators)}")
+        if left._map_size != right._map_size:
+            raise ValueError("Cannot combine selections of maps with different sizes")
+
+        uuid = left.uuid if left.uuid is not None else right.uuid
+        selection = cls(map_size=left._map_size + 1, uuid=uuid)
+        selection._operator = operator_
+        selection._operands = (left, right)
+        return selection
+
+    def __or__(self, other: Union[Area, Selection]) -> Selection:
+        return Selection.combine('|', self, other)
+
+    def __and__(self, other: Union[Area, Selection]) -> Selection:
+        return Selection.combine('&', self, other)
+
+    def __sub__(self, other: Union[Area, Selection]) -> Selection:
+        return Selection.combine('-', self, other)
+
+    # ============================ Conversion functions ============================
+
+    def to_mask(self) -> bytearray:
+        """
+        Converts the selection to a mask of the entire map. The mask contains one byte per tile in the same order as the
+        terrain list of the map manager (``index = y * map_width + x``). Selected tiles are ``1``, all others are ``0``.
+
+        Returns:
+            A bytearray with a length of ``map_width * map_width``
+        """
+        map_width = self._map_size + 1
+        return bytearray(self._evaluate().to_bytes(map_width * map_width, 'big'))
+
+    def to_coords(self, as_terrain: bool = False) -> OrderedSet[Tile | 'TerrainTile']:
+        """
+        Converts the selection to an OrderedSet of (x, y) coordinates
+
+        Args:
+            as_terrain: If the returning coordinates should be Tile objects or Terrain Tiles. If True the coordinates
+                are returned as TerrainTiles.
+
+        Returns:
+            An OrderedSet of Tiles ((x, y) named tuple) of the selection.
+        """
+        mask = self.to_mask()
+        return self._indices_to_tiles(compress(range(len(mask)), mask), as_terrain)
+
+    def to_chunks(
+            self,
+            as_terrain: bool = False,
+            separate_by_id: bool = True
+    ) -> List[OrderedSet[Tile | 'TerrainTile']]:
+        """
+        Converts the selection to a list of OrderedSets with Tile NamedTuples with (x, y) coordinates.
+        The separation between chunks is based on if they're connected to each other.
+        So the tiles must share an edge (i.e. they should be non-diagonal).
+
+        Args:
+            as_terrain: If the returning coordinates should be Tile objects or Terrain Tiles. If True the coordinates
+                are returned as TerrainTiles.
+            separate_by_id: Take chunk ids into account when separating chunks. The chunk id of a tile is the chunk id
+                it has in the first area (from left to right) that selects it. When this is true, separate 'chunks'
+                will not be combined into one when they touch each other. For example, combining two line patterns
+                with gap_size=0 when this is False, this will result in one 'chunk' as the lines touch each other.
+
+        Returns:
+            A list of OrderedSets of Tiles ((x, y) named tuple) of the selection.
+        """
+        map_size = self._map_size
+        chunks = label_chunks(
+            self.to_mask(), map_size + 1, 0, 0, map_size, map_size,
+            chunk_id=self._get_chunk_id_function() if separate_by_id else None
+        )
+        return [self._indices_to_tiles(chunk, as_terrain) for chunk in chunks]
+
+    # ============================ Test against ... functions ============================
+
+    def is_within_selection(self, x: int = -1, y: int = -1, tile: Tile = None) -> bool:
+        """
+        If a given (x,y) location is within the selection.
+
+        Args:
+            x: The X coordinate
+            y: The Y coordinate
+            tile: A Tile object, replacing the x & y coordinates
+
+        Returns:
+            True if (x,y) is within the selection, False otherwise
+        """
+        if tile is not None:
+            x, y = tile
+
+        if self._operator is None:
+            return False
+        left, right = self._operands
+        return _operators[self._operator][1](left.is_within_selection(x, y), right.is_within_selection(x, y))
+
+    # ============================ Support functions ============================
+
+    def _evaluate(self) -> int:
+        """
+        Evaluates the selection to a single mask represented as int (one byte per tile, either ``0x00`` or ``0x01``).
+        This way bitwise operators combine the masks of all operands for all tiles at once.
+        """
+        if self._operator is None:
+            return 0
+        left, right = (
+            operand._evaluate() if isinstance(operand, Selection) else int.from_bytes(operand.to_mask(), 'big')
+            for operand in self._operands
+        )
+        return _operators[self._operator][0](left, right)
+
+    def _get_areas(self) -> List[Area]:
+        """Returns all areas this selection is created from (including those of nested selections) from left to right"""
+        return [
+            area
+            for operand in self._operands
+            for area in (operand._get_areas() if isinstance(operand, Selection) else [operand])
+        ]
+
+    def _get_chunk_id_function(self) -> Callable[[int, int], int]:
+        """
+        Returns a function which gives the chunk ID of a selected tile. This is the chunk ID the tile has in the first
+        area (from left to right) that selects it.
+
+        Returns:
+            A function accepting the x and y coordinate of a tile within the selection, returning the chunk ID
+        """
+        areas = [(area.is_within_selection, area._get_chunk_id_function()) for area in self._get_areas()]
+
+        def chunk_id(x: int, y: int) -> int:
+            for is_within_selection, area_chunk_id in areas:
+                if is_within_selection(x, y):
+                    return area_chunk_id(x, y)
+            return 0
+        return chunk_id
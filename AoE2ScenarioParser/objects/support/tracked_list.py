@@ -0,0 +1,114 @@
+from copy import deepcopy
+from typing import Callable, Iterable, Optional, Sequence, TypeVar, Union
+
+from typing_extensions import SupportsIndex
+
+T = TypeVar('T')
+
+LengthChangeCallback = Callable[[int, int], None]
+ChangeCallback = Callable[[], None]
+
+
+class TrackedList(list):
+    """
+    List which calls a callback whenever a mutation changes its length. Used to keep arrays depending on the length of
+    a list (like the display order arrays of triggers, conditions and effects) up to date without checking the list for
+    changes on every access.
+
+    The ``on_length_change`` callback is called with the old and the new length of the list. The ``on_change`` callback
+    is called (without arguments) after every mutation, including the ones replacing or reordering elements in place.
+    """
+
+    def __init__(
+            self,
+            seq: Sequence[T] = (),
+            on_length_change: Optional[LengthChangeCallback] = None,
+            on_change: Optional[ChangeCallback] = None
+    ) -> None:
+        super().__init__(seq)
+        self.on_length_change = on_length_change
+        self.on_change = on_change
+
+    def _changed(self, old_length: int) -> None:
+        new_length = len(self)
+        if self.on_length_change is not None and old_length != new_length:
+            self.on_length_change(old_length, new_length)
+        if self.on_change is not None:
+            self.on_change()
+
+    def append(self, __object: T) -> None:
+        """Append object to the end of the list."""
+        old_length = len(self)
+        super().append(__object)
+        self._changed(old_length)
+
+    def extend(self, __iterable: Iterable[T]) -> None:
+        """Extend list by appending elements from the iterable."""
+        old_length = len(self)
+        super().extend(__iterable)
+        self._changed(old_length)
+
+    def insert(self, __index: int, __object: T) -> None:
+        """Insert object before index"""
+        old_length = len(self)
+        super().insert(__index, __object)
+        self._changed(old_length)
+
+    def pop(self, __index: SupportsIndex = -1) -> T:
+        """Remove and return item at index (default last)."""
+        old_length = len(self)
+        value = super().pop(__index)
+        self._changed(old_length)
+        return value
+
+    def remove(self, __value: T) -> None:
+        """Remove first occurrence of value."""
+        old_length = len(self)
+        super().remove(__value)
+        self._changed(old_length)
+
+    def clear(self) -> None:
+        """Remove all items from list."""
+        old_length = len(self)
+        super().clear()
+        self._changed(old_length)
+
+    def __setitem__(self, i: SupportsIndex, o: Union[T, Iterable[T]]) -> None:
+        old_length = len(self)
+        super().__setitem__(i, o)
+        self._changed(old_length)
+
+    def __delitem__(self, i: Union[SupportsIndex, slice]) -> None:
+        old_length = len(self)
+        super().__delitem__(i)
+        self._changed(old_length)
+
+    def __iadd__(self, other: Iterable[T]):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n: int):
+        old_length = len(self)
+        super().__imul__(n)
+        self._changed(old_length)
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sort the list in ascending order and return None."""
+        super().sort(*args, **kwargs)
+        self._changed(len(self))
+
+    def reverse(self) -> None:
+        """Reverse *IN PLACE*."""
+        super().reverse()
+        self._changed(len(self))
+
+    def __deepcopy__(self, memo):
+        """The callbacks are not copied. The owner of the copy is responsible for setting new ones"""
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for k, v in self.__dict__.items():
+            setattr(result, k, None if k in ('on_length_change', 'on_change') else deepcopy(v, memo))
+        list.extend(result, (deepcopy(e, memo) for e in self))
+        return result
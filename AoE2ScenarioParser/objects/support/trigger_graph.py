@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import operator
+from collections import deque
+from typing import Dict, Iterable, List, Set, Union
+
+from AoE2ScenarioParser.datasets.effects import EffectId
+from AoE2ScenarioParser.objects.data_objects.effect import Effect
+from AoE2ScenarioParser.objects.data_objects.trigger import Trigger
+
+_ACTIVATION_EFFECT_TYPES = (EffectId.ACTIVATE_TRIGGER, EffectId.DEACTIVATE_TRIGGER)
+
+
+class TriggerGraph:
+    def __init__(self, triggers: List[Trigger]):
+        """
+        Index of the links between triggers created by ``(de)activate trigger`` effects. The index is created in a
+        single pass over all effects. Nodes are trigger IDs (``trigger.trigger_id``). Effects pointing to a trigger that
+        doesn't exist (like ``-1``) are not included in the edges.
+
+        Triggers are indexed by object (and effects are indexed by the trigger they're in), so renumbering triggers
+        only requires the effects pointing to the renumbered triggers to be updated (see: ``remap_targets``).
+
+        Usually created and kept up to date by the trigger manager: ``trigger_manager.get_activation_graph()``
+
+        Args:
+            triggers (List[Trigger]): The trigger list to create the graph for. Triggers added to or removed from this
+                list are indexed using ``update_triggers``
+        """
+        self._triggers = triggers
+        self._indexed_triggers: List[Trigger] = list(triggers)
+        """The trigger list at the moment it was last indexed"""
+        self._trigger_effects: Dict[int, List[Effect]] = {}
+        """All effects per trigger (by ``id(trigger)``) at the moment the trigger was indexed"""
+        self._effect_triggers: Dict[int, Trigger] = {}
+        """The trigger of every indexed effect (by ``id(effect)``)"""
+        self._outgoing: Dict[int, Dict[int, Effect]] = {}
+        """The (de)activation effects (by ``id(effect)``) per trigger they're in (by ``id(trigger)``)"""
+        self._incoming: Dict[int, Dict[int, Effect]] = {}
+        """The (de)activation effects (by ``id(effect)``) per trigger ID they're pointing to"""
+
+        for trigger in triggers:
+            self._add_trigger(trigger)
+
+    @property
+    def trigger_count(self) -> int:
+        return len(self._triggers)
+
+    # ============================ Index maintenance ============================
+
+    def update_triggers(self) -> None:
+        """
+        Index the triggers added to and unindex the triggers removed from (or replaced in) the trigger list. Triggers
+        are usually appended, so when all previously indexed triggers are still in place, only the new triggers at the
+        end of the list are indexed.
+        """
+        triggers, previous = self._triggers, self._indexed_triggers
+        self._indexed_triggers = list(triggers)
+        if len(triggers) >= len(previous) and all(map(operator.is_, triggers, previous)):
+            for trigger in triggers[len(previous):]:
+                if id(trigger) not in self._trigger_effects:
+                    self._add_trigger(trigger)
+            return
+
+        indexed = self._trigger_effects
+        current = {id(trigger): trigger for trigger in triggers}
+        for trigger_key in [key for key in indexed if key not in current]:
+            self._remove_trigger(trigger_key)
+        for trigger_key, trigger in current.items():
+            if trigger_key not in indexed:
+                self._add_trigger(trigger)
+
+    def update_trigger_effects(self, trigger: Trigger) -> None:
+        """Index the effects of the trigger again after effects were added to or removed from it"""
+        if id(trigger) in self._trigger_effects:
+            self._remove_trigger(id(trigger))
+            self._add_trigger(trigger)
+
+    def update_effect_type(self, effect: Effect) -> None:
+        """Index the effects of the trigger of the effect again after the type of the effect changed"""
+        trigger = self._effect_triggers.get(id(effect))
+        if trigger is not None:
+            self.update_trigger_effects(trigger)
+
+    def update_effect_target(self, effect: Effect, previous_trigger_id: int) -> None:
+        """Move the effect in the index after the trigger ID it's pointing to changed"""
+        trigger = self._effect_triggers.get(id(effect))
+        if trigger is None or id(effect) not in self._outgoing[id(trigger)]:
+            return
+        self._remove_incoming(effect, previous_trigger_id)
+        self._incoming.setdefault(effect.trigger_id, {})[id(effect)] = effect
+
+    def remap_targets(self, trigger_id_changes: Dict[int, int]) -> None:
+        """
+        Point the (de)activation effects to the new IDs of triggers that were renumbered. Only the effects pointing to
+        one of the renumbered triggers are changed.
+
+        Args:
+            trigger_id_changes: The old trigger IDs mapped to the new trigger IDs
+        """
+        moved = {
+            old_id: self._incoming.pop(old_id) for old_id in trigger_id_changes if old_id in self._incoming
+        }
+        for old_id, effects in moved.items():
+            new_id = trigger_id_changes[old_id]
+            for effect in effects.values():
+                # Bypass the @property, the index is updated here in bulk
+                effect._trigger_id = new_id
+            self._incoming.setdefault(new_id, {}).update(effects)
+
+    def _add_trigger(self, trigger: Trigger) -> None:
+        effects = list(trigger.effects)
+        self._trigger_effects[id(trigger)] = effects
+        outgoing = self._outgoing[id(trigger)] = {}
+        for effect in effects:
+            self._effect_triggers[id(effect)] = trigger
+            if effect.effect_type in _ACTIVATION_EFFECT_TYPES:
+                outgoing[id(effect)] = effect
+                self._incoming.setdefault(effect.trigger_id, {})[id(effect)] = effect
+
+    def _remove_trigger(self, trigger_key: int) -> None:
+        for effect in self._trigger_effects.pop(trigger_key):
+            self._effect_triggers.pop(id(effect), None)
+        for effect in self._outgoing.pop(trigger_key).values():
+            self._remove_incoming(effect, effect.trigger_id)
+
+    def _remove_incoming(self, effect: Effect, trigger_id: int) -> None:
+        incoming = self._incoming.get(trigger_id)
+        if incoming is not None:
+            incoming.pop(id(effect), None)
+            if not incoming:
+                del self._incoming[trigger_id]
+
+    # ============================ Queries ============================
+
+    def outgoing_effects(self, trigger_id: int) -> List[Effect]:
+        """The (de)activation effects in the given trigger (in the order of its effects)"""
+        return list(self._outgoing.get(id(self._triggers[trigger_id]), {}).values())
+
+    def incoming_effects(self, trigger_id: int) -> List[Effect]:
+        """The (de)activation effects pointing to the given trigger"""
+        return list(self._incoming.get(trigger_id, {}).values())
+
+    def successors(self, trigger_id: int) -> List[int]:
+        """The IDs of the triggers (de)activated by the given trigger (in the order of its effects)"""
+        count = self.trigger_count
+        return [
+            target for target in dict.fromkeys(effect.trigger_id for effect in self.outgoing_effects(trigger_id))
+            if target is not None and 0 <= target < count
+        ]
+
+    def predecessors(self, trigger_id: int) -> List[int]:
+        """The IDs of the triggers that (de)activate the given trigger (sorted)"""
+        if not 0 <= trigger_id < self.trigger_count:
+            return []
+        return sorted({self._effect_triggers[id(effect)].trigger_id for effect in self.incoming_effects(trigger_id)})
+
+    def reachable(self, trigger_ids: Union[int, Iterable[int]]) -> List[int]:
+        """
+        Get all triggers that can be reached from the given trigger(s) through (de)activation effects.
+
+        Args:
+            trigger_ids (Union[int, Iterable[int]]): The trigger ID or IDs to start from
+
+        Returns:
+            The IDs of all reachable triggers (including the given ones) in breadth first order
+        """
+        if isinstance(trigger_ids, int):
+            trigger_ids = [trigger_ids]
+
+        result = list(dict.fromkeys(trigger_ids))
+        visited: Set[int] = set(result)
+        queue = deque(result)
+        while queue:
+            for target in self.successors(queue.popleft()):
+                if target not in visited:
+                    visited.add(target)
+                    result.append(target)
+                    queue.append(target)
+        return result
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """
+        Get the strongly connected components of the graph. Triggers in the same component can all (indirectly)
+        (de)activate each other. Uses an iterative version of Tarjan's algorithm.
+
+        Returns:
+            A list of components (sorted lists of trigger IDs). Components are ordered topologically, so a component
+                never (de)activates a component before it.
+        """
+        outgoing = [self.successors(node) for node in range(self.trigger_count)]
+        counter = 0
+        index: Dict[int, int] = {}
+        low: Dict[int, int] = {}
+        stack: List[int] = []
+        on_stack: Set[int] = set()
+        components: List[List[int]] = []
+
+        for root in range(self.trigger_count):
+            if root in index:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(outgoing[root]))]
+
+            while work:
+                node, targets = work[-1]
+                for target in targets:
+                    if target not in index:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(outgoing[target])))
+                        break
+                    elif target in on_stack:
+                        low[node] = min(low[node], index[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(component))
+
+        # Tarjan's algorithm finds the components in reverse topological order
+        components.reverse()
+        return components
+
+    def topological_order(self) -> List[int]:
+        """
+        Get an order of all triggers in which every trigger comes before the triggers it (de)activates. Triggers
+        (de)activating themselves are allowed.
+
+        Returns:
+            A list of all trigger IDs
+
+        Raises:
+            ValueError: When triggers (de)activate each other in a cycle. Use ``strongly_connected_components`` to find
+                these triggers.
+        """
+        outgoing = [
+            [target for target in self.successors(node) if target != node] for node in range(self.trigger_count)
+        ]
+        in_degree = [0] * self.trigger_count
+        for targets in outgoing:
+            for target in targets:
+                in_degree[target] += 1
+        queue = deque(node for node in range(self.trigger_count) if in_degree[node] == 0)
+
+        result = []
+        while queue:
+            node = queue.popleft()
+            result.append(node)
+            for target in outgoing[node]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
+
+        if len(result) != self.trigger_count:
+            cycle_nodes = [node for node, degree in enumerate(in_degree) if degree > 0]
+            raise ValueError(f"Triggers form an activation cycle. Triggers in or after a cycle: {cycle_nodes}")
+        return result
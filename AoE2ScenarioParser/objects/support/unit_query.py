@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Iterable, Iterator, List, Optional, Set, TYPE_CHECKING, Union
+
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.objects.data_objects.unit import Unit
+
+if TYPE_CHECKING:
+    from AoE2ScenarioParser.objects.support.area import Area
+    from AoE2ScenarioParser.objects.support.selection import Selection
+
+
+class UnitQuery:
+    def __init__(self, units: List[List[Unit]]):
+        """
+        Query to filter units. Uses method chaining for ease of use. All filters are combined and checked in a single
+        pass over the units when the query is used (iterated, counted etc.). Only the unit lists of the selected players
+        are visited.
+
+        Usually created using: ``unit_manager.query()``
+
+        Examples:
+
+            Count all villagers of player one and two in an area::
+
+                unit_manager.query().player(PlayerId.ONE, PlayerId.TWO).const_in(villager_consts).in_area(area).count()
+
+        Args:
+            units: The unit lists per player (like ``unit_manager.units``)
+        """
+        self._units = units
+        self._players: Optional[List[int]] = None
+        self._consts: Optional[Set[int]] = None
+        self._consts_blacklist: bool = False
+        self._mask: Optional[bytearray] = None
+        self._map_width: int = 0
+        self._predicates: List[Callable[[Unit], bool]] = []
+
+    # ============================ Filters ============================
+
+    def player(self, *players: Union[int, PlayerId]) -> UnitQuery:
+        """
+        Only select units from the given players. Can be used multiple times, the selected players are narrowed down.
+
+        Args:
+            *players: The players to select the units from
+
+        Returns:
+            This query object
+        """
+        if self._players is None:
+            self._players = list(dict.fromkeys(players))
+        else:
+            self._players = [p for p in self._players if p in set(players)]
+        return self
+
+    def const_in(self, unit_consts: Iterable[int]) -> UnitQuery:
+        """
+        Only select units with one of the given unit constants.
+
+        Args:
+            unit_consts: The unit constants to select
+
+        Returns:
+            This query object
+        """
+        return self._add_const_filter(set(unit_consts), blacklist=False)
+
+    def const_not_in(self, unit_consts: Iterable[int]) -> UnitQuery:
+        """
+        Only select units without any of the given unit constants.
+
+        Args:
+            unit_consts: The unit constants to ignore
+
+        Returns:
+            This query object
+        """
+        return self._add_const_filter(set(unit_consts), blacklist=True)
+
+    def in_area(self, area: Union[Area, Selection, bytearray]) -> UnitQuery:
+        """
+        Only select units on the tiles selected by the given area. A unit is on the tile its (x, y) location is in.
+
+        Args:
+            area: An area or selection (or a mask like the one returned by ``area.to_mask()``)
+
+        Returns:
+            This query object
+
+        Raises:
+            ValueError: When combined with an earlier area of a different map size
+        """
+        mask = area if isinstance(area, (bytes, bytearray)) else area.to_mask()
+        if self._mask is not None:
+            if len(mask) != len(self._mask):
+                raise ValueError("Cannot combine areas of maps with different sizes")
+            combined = int.from_bytes(self._mask, 'big') & int.from_bytes(mask, 'big')
+            mask = bytearray(combined.to_bytes(len(mask), 'big'))
+        self._mask = mask
+        self._map_width = math.isqrt(len(mask))
+        return self
+
+    def where(self, predicate: Callable[[Unit], bool]) -> UnitQuery:
+        """
+        Only select units for which the given function returns True.
+
+        Args:
+            predicate: The function to call with each unit (that passed the other filters)
+
+        Returns:
+            This query object
+        """
+        self._predicates.append(predicate)
+        return self
+
+    # ============================ Results ============================
+
+    def __iter__(self) -> Iterator[Unit]:
+        """Lazily iterate over all units matching the query"""
+        players = range(len(self._units)) if self._players is None else self._players
+        consts, blacklist = self._consts, self._consts_blacklist
+        mask, width = self._mask, self._map_width
+        predicates = self._predicates
+
+        for player in players:
+            for unit in self._units[player]:
+                if consts is not None and (unit.unit_const in consts) == blacklist:
+                    continue
+                if mask is not None:
+                    x, y = int(unit.x), int(unit.y)
+                    if not (0 <= x < width and 0 <= y < width and mask[y * width + x]):
+                        continue
+                if predicates and not all(predicate(unit) for predicate in predicates):
+                    continue
+                yield unit
+
+    def to_list(self) -> List[Unit]:
+        """Get all units matching the query as list"""
+        return list(self)
+
+    def count(self) -> int:
+        """Count the units matching the query"""
+        return sum(1 for _ in self)
+
+    def first(self) -> Optional[Unit]:
+        """Get the first unit matching the query. None if no unit matches"""
+        return next(iter(self), None)
+
+    def exists(self) -> bool:
+        """If any unit matches the query"""
+        return self.first() is not None
+
+    # ============================ Support functions ============================
+
+    def _add_const_filter(self, unit_consts: Set[int], blacklist: bool) -> UnitQuery:
+        """Combine the given constants with the existing constant filter (if any)"""
+        if self._consts is None:
+            self._consts, self._consts_blacklist = unit_consts, blacklist
+        elif self._consts_blacklist and blacklist:
+            self._consts = self._consts | unit_consts
+        elif self._consts_blacklist:
+            self._consts, self._consts_blacklist = unit_consts - self._consts, False
+        elif blacklist:
+            self._consts = self._consts - unit_consts
+        else:
+            self._consts = self._consts & unit_consts
+        return self
@@ -1,19 +1,34 @@
-from typing import Iterable, Sequence, Union, TypeVar
+from typing import Iterable, Sequence, Union, TypeVar, Optional
 from uuid import UUID
 
 from typing_extensions import SupportsIndex
 
+from AoE2ScenarioParser.objects.support.tracked_list import TrackedList, LengthChangeCallback, ChangeCallback
+
 T = TypeVar('T')
 
 
-class UuidList(list):
-    def __init__(self, uuid: UUID, seq: Sequence[T] = ()) -> None:
+class UuidList(TrackedList):
+    """
+    List which sets the ``host_uuid`` of all objects added to it. Nested iterables are converted to ``UuidList``s.
+
+    Ownership is only propagated to the elements that are added, so adding ``k`` elements costs ``O(k)``. Nested
+    ``UuidList``s with the same UUID are added as-is. ``UuidList``s from another scenario are copied, so the list of the
+    other scenario isn't changed (or shared).
+    """
+
+    def __init__(
+            self,
+            uuid: UUID,
+            seq: Sequence[T] = (),
+            on_length_change: Optional[LengthChangeCallback] = None,
+            on_change: Optional[ChangeCallback] = None
+    ) -> None:
         self._uuid = uuid
 
-        if seq:
-            seq = self._iter_to_uuid_list(seq, ignore_root_iter=True)
-            self._update(seq)
-        super().__init__(seq)
+        super().__init__(
+            self._adopt_all(seq) if seq else seq, on_length_change=on_length_change, on_change=on_change
+        )
 
     @property
     def uuid(self):
@@ -21,26 +36,26 @@ class UuidList(list):
 
     @uuid.setter
     def uuid(self, value):
+        if value == self._uuid:
+            return
         self._uuid = value
-        self._update(self)
+        for element in self:
+            if isinstance(element, UuidList):
+                element.uuid = value
+            else:
+                element._host_uuid = value
 
     def append(self, __object: T) -> None:
         """Append object to the end of the list."""
-        __object = self._iter_to_uuid_list(__object)
-        self._update(__object)
-        super().append(__object)
+        super().append(self._adopt(__object))
 
     def extend(self, __iterable: Iterable[T]) -> None:
         """Extend list by appending elements from the iterable."""
-        __iterable = self._iter_to_uuid_list(__iterable, ignore_root_iter=True)
-        self._update(__iterable)
-        super().extend(__iterable)
+        super().extend(self._adopt_all(__iterable))
 
     def insert(self, __index: int, __object: T) -> None:
         """Insert object before index"""
-        __object = self._iter_to_uuid_list(__object)
-        self._update(__object)
-        super().insert(__index, __object)
+        super().insert(__index, self._adopt(__object))
 
     def __setitem__(self, i: SupportsIndex, o: Union[T, Iterable[T]]) -> None:
         """
@@ -50,37 +65,26 @@ class UuidList(list):
             i: The index or slice object
             o: The object to set or iterable with objects when slicing is used
         """
-        o = self._iter_to_uuid_list(o, ignore_root_iter=isinstance(i, slice))
-        self._update(o)
-        super().__setitem__(i, o)
-
-    def _iter_to_uuid_list(self, iterable: Union[T, Iterable[T]], ignore_root_iter=False) -> Union[T, Iterable[T]]:
-        if ignore_root_iter:
-            return list(map(self._iter_to_uuid_list, iterable))
-
-        if not issubclass(iterable.__class__, Iterable):
-            return iterable
-        return UuidList(
-            uuid=self.uuid,
-            seq=iterable
-        )
+        super().__setitem__(i, self._adopt_all(o) if isinstance(i, slice) else self._adopt(o))
+
+    def _adopt_all(self, iterable: Iterable[T]) -> list:
+        """Adopt all entries from the given iterable. Returns a list with the (possibly converted) entries"""
+        return list(map(self._adopt, iterable))
 
-    def _update(self, o: Union[T, Iterable[T]]):
-        """Checks if `o` is an iterable and calls function on each entry or on `o` if it's not an iterable"""
-        if issubclass(o.__class__, Iterable):
-            for element in o:
-                if isinstance(element, UuidList):
-                    element.uuid = self.uuid
-                    continue
-                self._update_object(element)
-        else:
-            self._update_object(o)
-
-    def _update_object(self, o: T):
+    def _adopt(self, o: Union[T, Iterable[T]]) -> Union[T, 'UuidList']:
         """
-        Update the UUID of the object
+        Set the UUID of the given object to the UUID of this list. ``UuidList``s with the same UUID are used as-is,
+        other iterables (including ``UuidList``s with another UUID) are converted to a new ``UuidList``.
 
         Args:
-            o (T): an object to update
+            o: The object or iterable to adopt
+
+        Returns:
+            The object itself or the ``UuidList`` representing the given iterable
         """
-        o._host_uuid = self.uuid
+        if isinstance(o, UuidList) and o.uuid == self._uuid:
+            return o
+        if hasattr(type(o), '__iter__'):
+            return UuidList(self._uuid, o)
+        o._host_uuid = self._uuid
+        return o
@@ -1,34 +1,63 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
+
 from AoE2ScenarioParser.objects.managers.de.map_manager_de import MapManagerDE
 from AoE2ScenarioParser.objects.managers.de.trigger_manager_de import TriggerManagerDE
 from AoE2ScenarioParser.objects.managers.de.unit_manager_de import UnitManagerDE
 from AoE2ScenarioParser.objects.managers.de.xs_manager_de import XsManagerDE
 from AoE2ScenarioParser.objects.managers.player_manager import PlayerManager
 from AoE2ScenarioParser.scenarios.aoe2_scenario import AoE2Scenario
+from AoE2ScenarioParser.scenarios.support.scenario_diff import ScenarioDiff, ScenarioHashTree
+from AoE2ScenarioParser.scenarios.support.scenario_validation import ScenarioValidation
 
 
 class AoE2DEScenario(AoE2Scenario):
     @property
     def trigger_manager(self) -> TriggerManagerDE:
-        return self._object_manager.managers['Trigger']
+        return self._get_manager('Trigger')
 
     @property
     def unit_manager(self) -> UnitManagerDE:
-        return self._object_manager.managers['Unit']
+        return self._get_manager('Unit')
 
     @property
     def map_manager(self) -> MapManagerDE:
-        return self._object_manager.managers['Map']
+        return self._get_manager('Map')
 
     @property
     def xs_manager(self) -> XsManagerDE:
-        return self._object_manager.managers['Xs']
+        return self._get_manager('Xs')
 
     @property
     def player_manager(self) -> PlayerManager:
-        return self._object_manager.managers['Player']
+        return self._get_manager('Player')
 
     @classmethod
     def from_file(cls, filename, game_version="DE") -> AoE2DEScenario:
         return super().from_file(filename, game_version)
+
+    @classmethod
+    async def from_file_async(
+            cls, filename, game_version="DE", executor: Executor = None, print_status: bool = None
+    ) -> AoE2DEScenario:
+        return await super().from_file_async(filename, game_version, executor, print_status)
+
+    @classmethod
+    def from_default(cls, scenario_version, map_size=None, game_version="DE") -> AoE2DEScenario:
+        return super().from_default(scenario_version, game_version, map_size)
+
+    @classmethod
+    def validate_file(cls, filename, game_version="DE") -> ScenarioValidation:
+        return super().validate_file(filename, game_version)
+
+    @classmethod
+    def hash_file(cls, filename, game_version="DE") -> ScenarioHashTree:
+        return super().hash_file(filename, game_version)
+
+    @classmethod
+    def diff_files(cls, filename, other_filename, game_version="DE") -> ScenarioDiff:
+        return super().diff_files(filename, other_filename, game_version)
+
+    def fork(self) -> AoE2DEScenario:
+        return super().fork()
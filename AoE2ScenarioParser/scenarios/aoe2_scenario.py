@@ -1,17 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
 import json
+import os
+import threading
 import uuid
 import zlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Union, Dict
+from typing import Union, Dict, List, Tuple, Optional
 
 import AoE2ScenarioParser.datasets.conditions as conditions
 import AoE2ScenarioParser.datasets.effects as effects
 from AoE2ScenarioParser import settings
 from AoE2ScenarioParser.helper.exceptions import InvalidScenarioStructureError, UnknownScenarioStructureError, \
-    UnknownStructureError
+    UnknownStructureError, ScenarioNotFoundError, InvalidScenarioDataError
 from AoE2ScenarioParser.helper.incremental_generator import IncrementalGenerator
-from AoE2ScenarioParser.helper.printers import s_print
-from AoE2ScenarioParser.helper.string_manipulations import create_textual_hex
+from AoE2ScenarioParser.helper.printers import s_print, status_updates
+from AoE2ScenarioParser.helper.string_manipulations import create_textual_hex, create_textual_hex_lines
 from AoE2ScenarioParser.helper.version_check import python_version_check
 from AoE2ScenarioParser.objects.aoe2_object_manager import AoE2ObjectManager
 from AoE2ScenarioParser.objects.managers.map_manager import MapManager
@@ -19,29 +27,42 @@ from AoE2ScenarioParser.objects.managers.player_manager import PlayerManager
 from AoE2ScenarioParser.objects.managers.trigger_manager import TriggerManager
 from AoE2ScenarioParser.objects.managers.unit_manager import UnitManager
 from AoE2ScenarioParser.scenarios.support.object_factory import ObjectFactory
+from AoE2ScenarioParser.scenarios.support.scenario_diff import ScenarioBytes, ScenarioDiff, ScenarioHashTree, \
+    diff_scenario_bytes, hash_scenario_bytes
+from AoE2ScenarioParser.scenarios.support.scenario_validation import ScenarioValidation, ValidationIssue
 from AoE2ScenarioParser.scenarios.scenario_store import store
-from AoE2ScenarioParser.sections.aoe2_file_section import AoE2FileSection
+from AoE2ScenarioParser.sections.aoe2_file_section import AoE2FileSection, SectionName
+from AoE2ScenarioParser.sections.structure_scanner import ScannedSection, StructureScanner
+
+_COMPRESSION_BLOCK_SIZE = 128 * 1024
+"""The size of the blocks the content is split into when compressing (to compress them on multiple threads)"""
+_COMPRESSION_DICTIONARY_SIZE = 32 * 1024
+"""The amount of bytes before a block used as dictionary (the maximum distance deflate can reference back)"""
+_compression_executors: Dict[Tuple[int, int], ThreadPoolExecutor] = {}
+"""The executors used to compress blocks, by process ID and amount of threads. Created when first used"""
+_compression_executors_lock = threading.Lock()
 
 
 class AoE2Scenario:
     @property
     def trigger_manager(self) -> TriggerManager:
-        return self._object_manager.managers['Trigger']
+        return self._get_manager('Trigger')
 
     @property
     def unit_manager(self) -> UnitManager:
-        return self._object_manager.managers['Unit']
+        return self._get_manager('Unit')
 
     @property
     def map_manager(self) -> MapManager:
-        return self._object_manager.managers['Map']
+        return self._get_manager('Map')
 
     @property
     def player_manager(self) -> PlayerManager:
-        return self._object_manager.managers['Player']
+        return self._get_manager('Player')
 
     def __init__(self, source_location):
         self.source_location = source_location
+        self.closed = False
 
         self.read_mode = None
         self.scenario_version = "???"
@@ -69,33 +90,295 @@ class AoE2Scenario:
         igenerator = IncrementalGenerator.from_file(filename)
         s_print("Reading scenario file finished successfully.", final=True)
 
+        scenario = cls._from_file_header(filename, game_version, igenerator)
+        scenario._load_content_sections(decompress_bytes(igenerator.get_remaining_bytes()))
+        scenario._finish_from_file()
+
+        return scenario
+
+    @classmethod
+    async def from_file_async(
+            cls, filename, game_version, executor: Executor = None, print_status: bool = None
+    ) -> AoE2Scenario:
+        """
+        Read a scenario without blocking the event loop. Works the same as ``from_file``.
+
+        The file is read on the default executor of the loop. Decompressing is done using the given executor, which
+        can be a ``ThreadPoolExecutor`` or a ``ProcessPoolExecutor``. The sections and objects are created in a thread,
+        as they can't be moved between processes: on the given executor or on the default executor of the loop when
+        a ``ProcessPoolExecutor`` is given.
+
+        Args:
+            filename (str): The path to the scenario file
+            game_version (str): The game version of the scenario
+            executor (Executor): The executor to decompress (and parse) the scenario with. When left empty, the default
+                executor of the loop is used
+            print_status (bool): If status updates should be printed while reading. When left empty,
+                ``settings.PRINT_STATUS_UPDATES`` is used. Use ``False`` to keep concurrent reads from printing
+                through each other
+
+        Returns:
+            The read scenario
+        """
+        loop = asyncio.get_running_loop()
+        thread_executor = _get_thread_executor(executor)
+
+        with status_updates(print_status):
+            python_version_check()
+
+            s_print(f"\nReading file: '{filename}'", final=True, color="magenta")
+            s_print("Reading scenario file...")
+            igenerator = await loop.run_in_executor(None, IncrementalGenerator.from_file, filename)
+            s_print("Reading scenario file finished successfully.", final=True)
+
+            scenario = await _run_in_thread(thread_executor, cls._from_file_header, filename, game_version, igenerator)
+            try:
+                data = await loop.run_in_executor(executor, decompress_bytes, igenerator.get_remaining_bytes())
+                await _run_in_thread(thread_executor, scenario._load_content_sections, data)
+                await _run_in_thread(thread_executor, scenario._finish_from_file)
+            except BaseException:
+                scenario.close()
+                raise
+
+        return scenario
+
+    @classmethod
+    def _from_file_header(cls, filename, game_version, igenerator: IncrementalGenerator) -> AoE2Scenario:
+        """
+        Create a scenario from a file and load its structure and header. The scenario is closed (and removed from the
+        store) when this fails.
+        """
         scenario = cls(filename)
-        scenario.read_mode = "from_file"
-        scenario.game_version = game_version
-        scenario.scenario_version = get_file_version(igenerator)
+        try:
+            scenario.read_mode = "from_file"
+            scenario.game_version = game_version
+            scenario.scenario_version = get_file_version(igenerator)
+
+            # Log game and scenario version
+            s_print("\n############### Attributes ###############", final=True, color="blue")
+            s_print(f">>> Game version: '{scenario.game_version}'", final=True, color="blue")
+            s_print(f">>> Scenario version: {scenario.scenario_version}", final=True, color="blue")
+            s_print("##########################################", final=True, color="blue")
+
+            s_print(f"\nLoading scenario structure...")
+            initialise_version_dependencies(scenario.game_version, scenario.scenario_version)
+            scenario._load_structure()
+            s_print(f"Loading scenario structure finished successfully.", final=True)
+
+            s_print("Parsing scenario file...", final=True)
+            scenario._load_header_section(igenerator)
+        except BaseException:
+            scenario.close()
+            raise
+        return scenario
+
+    def _finish_from_file(self) -> None:
+        s_print(f"Parsing scenario file finished successfully.", final=True)
 
-        # Log game and scenario version
-        s_print("\n############### Attributes ###############", final=True, color="blue")
-        s_print(f">>> Game version: '{scenario.game_version}'", final=True, color="blue")
-        s_print(f">>> Scenario version: {scenario.scenario_version}", final=True, color="blue")
-        s_print("##########################################", final=True, color="blue")
+        self._object_manager = AoE2ObjectManager(self.uuid)
+        self._object_manager.setup()
+
+    @classmethod
+    def from_default(cls, scenario_version, game_version, map_size=None):
+        """
+        Create a scenario from the default values in the structure of the given version. No file is read or parsed.
+
+        Args:
+            scenario_version (str): The scenario version to create the scenario with. For example: "1.45"
+            game_version (str): The game version to create the scenario with
+            map_size (int): The size of the map. When left empty, the default map size from the structure is used
+
+        Returns:
+            The created scenario
+        """
+        python_version_check()
+
+        s_print(f"\nCreating scenario from defaults...", final=True, color="magenta")
+        scenario = cls(None)
+        scenario.read_mode = "from_default"
+        scenario.game_version = game_version
+        scenario.scenario_version = scenario_version
 
         s_print(f"\nLoading scenario structure...")
         initialise_version_dependencies(scenario.game_version, scenario.scenario_version)
         scenario._load_structure()
         s_print(f"Loading scenario structure finished successfully.", final=True)
 
-        # scenario._initialize(igenerator)
-        s_print("Parsing scenario file...", final=True)
-        scenario._load_header_section(igenerator)
-        scenario._load_content_sections(igenerator)
-        s_print(f"Parsing scenario file finished successfully.", final=True)
+        s_print("Creating sections from defaults...", final=True)
+        for section_name, structure in scenario.structure.items():
+            s_print(f"\t🔄 Creating {section_name}...", color="yellow")
+            section = AoE2FileSection.from_structure(section_name, structure, scenario.uuid)
+            if section_name == SectionName.MAP.value and map_size is not None:
+                # Set before filling so the terrain is created with the right size right away
+                section.retriever_map['map_width'].default_value = map_size
+                section.retriever_map['map_height'].default_value = map_size
+
+            scenario._add_to_sections(section)
+            section.set_data_to_default()
+            s_print(f"\t✔ {section_name}", final=True, color="green")
+        scenario.sections[SectionName.FILE_HEADER.value].version = scenario_version
+        s_print(f"Creating sections from defaults finished successfully.", final=True)
 
         scenario._object_manager = AoE2ObjectManager(scenario.uuid)
         scenario._object_manager.setup()
 
         return scenario
 
+    @classmethod
+    def validate_file(cls, filename, game_version) -> ScenarioValidation:
+        """
+        Check if a scenario file matches the structure of its version without loading it. The bytes are walked through
+        following the structure: lengths, repeats from dependencies and the decodability of strings are checked. No
+        sections or objects are created, which makes this a lot faster than reading the scenario.
+
+        Validation stops at the first problem in the (decompressed) data, as the positions of everything after it are
+        unknown.
+
+        Args:
+            filename (str): The path to the scenario file
+            game_version (str): The game version of the scenario
+
+        Returns:
+            The result of the validation, including the problem found (if any) with its offset and location
+        """
+        file_content = IncrementalGenerator.from_file(filename).file_content
+        try:
+            scenario_version, structure = _get_scenario_structure(file_content, game_version)
+        except (UnicodeDecodeError, UnknownScenarioStructureError) as e:
+            issue = ValidationIssue(None, "", 0, f"Unable to determine the scenario version: {e}")
+            return ScenarioValidation(None, [issue], {}, 0)
+
+        issues: List[ValidationIssue] = []
+        sections: Dict[str, ScannedSection] = {}
+        trailing_bytes = 0
+        try:
+            data = _scan_scenario_bytes(file_content, scenario_version, structure, sections).data
+            last_section = list(sections.values())[-1]
+            trailing_bytes = last_section.trailing_bytes + len(data) - last_section.end
+        except zlib.error as e:
+            offset = sections[SectionName.FILE_HEADER.value].end
+            issues.append(ValidationIssue(None, "", offset, f"Unable to decompress the scenario data: {e}"))
+        except InvalidScenarioDataError as e:
+            issues.append(ValidationIssue(e.section, e.path, e.offset, e.message))
+
+        section_ranges = {name: (section.start, section.end) for name, section in sections.items()}
+        return ScenarioValidation(scenario_version, issues, section_ranges, trailing_bytes)
+
+    @classmethod
+    def hash_file(cls, filename, game_version) -> ScenarioHashTree:
+        """
+        Hash every section of a scenario file and every struct directly within them (like every trigger and the units
+        of every player) without loading it. Hash trees can be stored and compared using ``changed_sections()``.
+
+        Args:
+            filename (str): The path to the scenario file
+            game_version (str): The game version of the scenario
+
+        Returns:
+            The hash tree of the scenario
+
+        Raises:
+            InvalidScenarioDataError: When the file doesn't match the structure of its version
+        """
+        return hash_scenario_bytes(_read_scenario_bytes(filename, game_version))
+
+    @classmethod
+    def diff_files(cls, filename, other_filename, game_version) -> ScenarioDiff:
+        """
+        Get the differences between two scenario files without loading them. The hash trees of both files are compared
+        and only the sections and structs that differ are decoded. Triggers (and their effects and conditions) are
+        compared by index, units by their owner and reference ID and changed tiles are combined into regions. When the
+        reference IDs of the units of a player aren't unique, the units of that player are compared by index instead.
+
+        Args:
+            filename (str): The path to the scenario file to compare from
+            other_filename (str): The path to the scenario file to compare to
+            game_version (str): The game version of the scenarios
+
+        Returns:
+            The differences between the two scenarios
+
+        Raises:
+            InvalidScenarioDataError: When a file doesn't match the structure of its version
+            ValueError: When the scenarios don't have the same scenario version
+        """
+        return diff_scenario_bytes(
+            _read_scenario_bytes(filename, game_version),
+            _read_scenario_bytes(other_filename, game_version)
+        )
+
+    def fork(self) -> AoE2Scenario:
+        """
+        Create a copy of this scenario with its own UUID. The changes made through the managers are committed first.
+
+        The sections of both scenarios share their (struct) data copy-on-write, so forking is much cheaper than reading
+        the scenario again. Structs are copied when a manager commits to them. Changes made directly to structs inside
+        ``scenario.sections`` bypass this mechanism and can be visible in both scenarios.
+
+        Returns:
+            The forked scenario
+        """
+        self._raise_if_closed()
+        s_print(f"\nForking scenario...", final=True, color="magenta")
+        self._object_manager.reconstruct()
+
+        fork = self.__class__(self.source_location)
+        fork.read_mode = self.read_mode
+        fork.game_version = self.game_version
+        fork.scenario_version = self.scenario_version
+        fork.structure = self.structure
+
+        # Both scenarios get a new owner token. All existing structs are now shared and copied before being edited
+        fork_owner, self_owner = object(), object()
+        for section in self.sections.values():
+            fork._add_to_sections(section.copy(fork.uuid, owner=fork_owner))
+            section._owner = self_owner
+
+        fork._object_manager = AoE2ObjectManager(fork.uuid)
+        fork._object_manager.setup()
+
+        s_print(f"Forking scenario finished successfully.", final=True)
+        return fork
+
+    def close(self) -> None:
+        """
+        Release the scenario. The scenario is removed from the scenario store and its sections and managers are
+        dropped, so they can be garbage collected even while objects from the scenario are still referenced.
+
+        Using the managers of the scenario (or objects that need information from it) afterwards raises a
+        ``ScenarioNotFoundError``. Calling this function more than once does nothing.
+
+        A scenario can also be used as a context manager, which closes the scenario when exiting the block::
+
+            with AoE2DEScenario.from_file(filename) as scenario:
+                ...
+        """
+        if self.closed:
+            return
+        store.unregister_scenario(self)
+        self.closed = True
+
+        self.structure = {}
+        self.sections = {}
+        self._object_manager = None
+        self._file = None
+        self._file_header = None
+        self._decompressed_file_data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _get_manager(self, name: str):
+        self._raise_if_closed()
+        return self._object_manager.managers[name]
+
+    def _raise_if_closed(self) -> None:
+        if self.closed:
+            raise ScenarioNotFoundError(f"Scenario with UUID '{self.uuid}' has been closed")
+
     def _load_structure(self):
         if self.game_version == "???" or self.scenario_version == "???":
             raise ValueError("Both game and scenario version need to be set to load structure")
@@ -105,8 +388,8 @@ class AoE2Scenario:
         header = self._create_and_load_section('FileHeader', raw_file_igenerator)
         self._add_to_sections(header)
 
-    def _load_content_sections(self, raw_file_igenerator: IncrementalGenerator):
-        self._decompressed_file_data = decompress_bytes(raw_file_igenerator.get_remaining_bytes())
+    def _load_content_sections(self, decompressed_file_data: bytes):
+        self._decompressed_file_data = decompressed_file_data
 
         data_igenerator = IncrementalGenerator(name='Scenario Data', file_content=self._decompressed_file_data)
 
@@ -145,16 +428,62 @@ class AoE2Scenario:
             skip_reconstruction (bool): If reconstruction should be skipped. If true, this will ignore all changes made
                 using the managers (For example all changes made using trigger_manager).
         """
+        self._raise_if_closed()
         self._write_from_structure(filename, skip_reconstruction)
 
+    async def write_to_file_async(
+            self, filename, skip_reconstruction=False, executor: Executor = None, print_status: bool = None
+    ) -> None:
+        """
+        Write the scenario to a new file without blocking the event loop. Works the same as ``write_to_file``.
+
+        The changes made using the managers are reconstructed in a thread (the given executor or the default executor
+        of the loop when a ``ProcessPoolExecutor`` is given). Compressing is done using the given executor and the file
+        is written on the default executor of the loop. Do not edit the scenario until writing has finished.
+
+        Args:
+            filename (str): The location to write the file to
+            skip_reconstruction (bool): If reconstruction should be skipped. If true, this will ignore all changes made
+                using the managers (For example all changes made using trigger_manager).
+            executor (Executor): The executor to compress (and reconstruct) the scenario with. When left empty, the
+                default executor of the loop is used
+            print_status (bool): If status updates should be printed while writing. When left empty,
+                ``settings.PRINT_STATUS_UPDATES`` is used
+        """
+        self._raise_if_closed()
+        loop = asyncio.get_running_loop()
+
+        with status_updates(print_status):
+            header, content = await _run_in_thread(
+                _get_thread_executor(executor), self._get_file_parts, filename, skip_reconstruction
+            )
+            compressed = await loop.run_in_executor(executor, compress_bytes, content)
+            await loop.run_in_executor(None, _write_file, filename, header + compressed)
+
+            s_print("File writing finished successfully.", final=True)
+            s_print(f"File successfully written to: '{filename}'", color="magenta", final=True)
+
     def _write_from_structure(self, filename, skip_reconstruction=False):
+        header, content = self._get_file_parts(filename, skip_reconstruction)
+        _write_file(filename, header + compress_bytes(content))
+
+        s_print("File writing finished successfully.", final=True)
+        s_print(f"File successfully written to: '{filename}'", color="magenta", final=True)
+
+    def _get_file_parts(self, filename, skip_reconstruction=False) -> Tuple[bytes, bytes]:
+        """
+        Get the bytes of the scenario to write to the given file.
+
+        Returns:
+            The bytes of the header and the (uncompressed) bytes of all other sections
+        """
         if not settings.DISABLE_ERROR_ON_OVERWRITING_SOURCE and self.source_location == filename:
             raise ValueError("Overwriting the source scenario file is disallowed. This behaviour can be enabled in the settings file.")
         if not skip_reconstruction:
             self._object_manager.reconstruct()
 
         s_print("\nFile writing from structure started...", final=True)
-        binary = _get_file_section_data(self.sections.get('FileHeader'))
+        header = _get_file_section_data(self.sections.get('FileHeader'))
 
         binary_list_to_be_compressed = []
         for file_part in self.sections.values():
@@ -162,16 +491,30 @@ class AoE2Scenario:
                 continue
             binary_list_to_be_compressed.append(_get_file_section_data(file_part))
 
-        compressed = compress_bytes(b''.join(binary_list_to_be_compressed))
+        return header, b''.join(binary_list_to_be_compressed)
 
-        with open(filename, 'wb') as f:
-            f.write(binary + compressed)
-
-        s_print("File writing finished successfully.", final=True)
-        s_print(f"File successfully written to: '{filename}'", color="magenta", final=True)
+    def write_error_file(
+            self,
+            filename="error_file.txt",
+            trail_generator=None,
+            sections: List[str] = None,
+            byte_range: Tuple[int, int] = None
+    ):
+        """
+        Write the byte structure of the (read) scenario to a file. Written section by section, so the file is never
+        created in memory as a whole.
 
-    def write_error_file(self, filename="error_file.txt", trail_generator=None):
-        self._debug_byte_structure_to_file(filename=filename, trail_generator=trail_generator)
+        Args:
+            filename (str): The file to write to
+            trail_generator (IncrementalGenerator): A generator with the remaining (unparsed) bytes to add at the end
+            sections (List[str]): The names of the sections to include. All sections are included when left unused
+            byte_range (Tuple[int, int]): When set, only include retrievers (and trail bytes) with bytes in this range
+                (start inclusive, end exclusive). For the ``FileHeader`` section, offsets are positions in the file.
+                For all other sections (and the trail), offsets are positions in the decompressed data.
+        """
+        self._debug_byte_structure_to_file(
+            filename=filename, trail_generator=trail_generator, sections=sections, byte_range=byte_range
+        )
 
     """ #############################################
     ################ Debug functions ################
@@ -199,28 +542,52 @@ class AoE2Scenario:
         file.close()
         print("File writing finished successfully.")
 
-    def _debug_byte_structure_to_file(self, filename, trail_generator: IncrementalGenerator = None, commit=False):
+    def _debug_byte_structure_to_file(
+            self,
+            filename,
+            trail_generator: IncrementalGenerator = None,
+            commit=False,
+            sections: List[str] = None,
+            byte_range: Tuple[int, int] = None
+    ):
         """ Used for debugging - Writes structure from read file to the filesystem in a easily readable manner. """
         if commit and hasattr(self, '_object_manager'):
             self._object_manager.reconstruct()
 
         s_print("\nWriting structure to file...", final=True)
         with open(filename, 'w', encoding=settings.MAIN_CHARSET) as f:
-            result = []
+            # The FileHeader is not compressed, offsets of all other sections are positions in the decompressed data
+            offset = 0
             for section in self.sections.values():
+                is_file_header = section.name == SectionName.FILE_HEADER.value
+
+                if sections is not None and section.name not in sections:
+                    if byte_range is not None and not is_file_header:
+                        offset += len(section.get_data_as_bytes())
+                    continue
+
                 s_print(f"\t🔄 Writing {section.name}...")
-                result.append(section.get_byte_structure_as_string())
+                parts = section.iter_byte_structure(byte_range, 0 if is_file_header else offset)
+                try:
+                    while True:
+                        f.write(next(parts))
+                except StopIteration as stop:  # The generator returns the offset after the section
+                    if not is_file_header:
+                        offset = stop.value
                 s_print(f"\t✔ {section.name}", final=True)
 
             if trail_generator is not None:
                 s_print("\tWriting trail...")
+                trail_offset = trail_generator.progress
                 trail = trail_generator.get_remaining_bytes()
+                if byte_range is not None:
+                    start = max(byte_range[0] - trail_offset, 0)
+                    trail = trail[start:max(byte_range[1] - trail_offset, start)]
 
-                result.append(f"\n\n{'#' * 27} TRAIL ({len(trail)})\n\n")
-                result.append(create_textual_hex(trail.hex(), space_distance=2, enter_distance=24))
+                f.write(f"\n\n{'#' * 27} TRAIL ({len(trail)})\n\n")
+                f.write("\n".join(create_textual_hex_lines(trail, bytes_per_line=8)))
                 s_print("\tWriting trail finished successfully.", final=True)
 
-            f.write(''.join(result))
         s_print("Writing structure to file finished successfully.", final=True)
 
 
@@ -261,6 +628,93 @@ def _get_file_section_data(file_section: AoE2FileSection):
     return value
 
 
+def _read_scenario_bytes(filename, game_version) -> ScenarioBytes:
+    """Read a scenario file and find the location of all sections (and the retrievers and structs within them)"""
+    file_content = IncrementalGenerator.from_file(filename).file_content
+    scenario_version, structure = _get_scenario_structure(file_content, game_version)
+    return _scan_scenario_bytes(file_content, scenario_version, structure, ranges=True)
+
+
+def _get_scenario_structure(file_content: bytes, game_version: str) -> Tuple[str, dict]:
+    """
+    Get the scenario version and the structure of that version from the bytes of a scenario file
+
+    Raises:
+        UnicodeDecodeError: When the scenario version cannot be decoded
+        UnknownScenarioStructureError: When the scenario version is not supported
+    """
+    scenario_version = file_content[:4].decode('ASCII')
+    return scenario_version, get_structure(game_version, scenario_version)
+
+
+def _scan_scenario_bytes(
+        file_content: bytes,
+        scenario_version: str,
+        structure: dict,
+        sections: Dict[str, ScannedSection] = None,
+        ranges: bool = False
+) -> ScenarioBytes:
+    """
+    Find the location of all sections in the bytes of a scenario file by decompressing the data after the file header
+    and scanning every section after each other.
+
+    Args:
+        file_content: The bytes of the scenario file
+        scenario_version: The scenario version of the file
+        structure: The structure of the scenario version
+        sections: The dict to add the sections to while scanning. When an error is raised, it contains all sections that
+            were scanned before the problem
+        ranges: If the location of every retriever and struct directly within the sections should be included
+
+    Returns:
+        The bytes of the scenario together with the location of its sections
+
+    Raises:
+        zlib.error: When the data after the file header cannot be decompressed
+        InvalidScenarioDataError: When the data doesn't match the structure of its version. The ``section`` attribute
+            is set to the name of the section the problem was found in
+    """
+    scanner = StructureScanner(structure)
+    sections = {} if sections is None else sections
+
+    def scan_section(section_name: str, data: bytes, offset: int) -> ScannedSection:
+        try:
+            sections[section_name] = scanner.scan_section(section_name, data, offset, ranges)
+        except InvalidScenarioDataError as e:
+            e.section = section_name
+            raise
+        return sections[section_name]
+
+    header = scan_section(SectionName.FILE_HEADER.value, file_content, 0)
+    data = decompress_bytes(file_content[header.end:])
+
+    offset = 0
+    for section_name in structure.keys():
+        if section_name != SectionName.FILE_HEADER.value:
+            offset = scan_section(section_name, data, offset).end
+
+    return ScenarioBytes(scenario_version, structure, file_content, data, sections)
+
+
+def _write_file(filename, content: bytes) -> None:
+    with open(filename, 'wb') as f:
+        f.write(content)
+
+
+def _get_thread_executor(executor: Optional[Executor]) -> Optional[Executor]:
+    """
+    The executor to create sections and objects with. These cannot be moved between processes, so the default executor
+    of the loop (None) is used instead of a process pool.
+    """
+    return None if isinstance(executor, ProcessPoolExecutor) else executor
+
+
+def _run_in_thread(executor: Optional[Executor], func, *args) -> asyncio.Future:
+    """Run a function using a (thread) executor in a copy of the current context, so status print settings apply"""
+    context = contextvars.copy_context()
+    return asyncio.get_running_loop().run_in_executor(executor, functools.partial(context.run, func, *args))
+
+
 def get_file_version(generator: IncrementalGenerator):
     """Get first 4 bytes of a file, which contains the version of the scenario"""
     return generator.get_bytes(4, update_progress=False).decode('ASCII')
@@ -270,11 +724,71 @@ def decompress_bytes(file_content):
     return zlib.decompress(file_content, -zlib.MAX_WBITS)
 
 
-def compress_bytes(file_content):
-    # https://stackoverflow.com/questions/3122145/zlib-error-error-3-while-decompressing-incorrect-header-check/22310760#22310760
-    deflate_obj = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
-    compressed = deflate_obj.compress(file_content) + deflate_obj.flush()
-    return compressed
+def compress_bytes(file_content, threads: int = None):
+    """
+    Compress the given bytes to a raw deflate stream.
+
+    Content larger than a single block is split into blocks which are compressed on multiple threads (zlib releases the
+    GIL while compressing). Like pigz, every block is primed with the last 32 KiB of the block before it and ended with
+    a sync flush, so the compressed blocks together form one valid deflate stream. The blocks are the same regardless of
+    the amount of threads, so the output doesn't depend on the amount of CPU cores.
+
+    Args:
+        file_content: The bytes to compress
+        threads: The amount of threads to use. Defaults to ``settings.COMPRESSION_THREADS``
+
+    Returns:
+        The compressed bytes
+    """
+    if len(file_content) <= _COMPRESSION_BLOCK_SIZE:
+        # https://stackoverflow.com/questions/3122145/zlib-error-error-3-while-decompressing-incorrect-header-check/22310760#22310760
+        deflate_obj = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressed = deflate_obj.compress(file_content) + deflate_obj.flush()
+        return compressed
+
+    if threads is None:
+        threads = settings.COMPRESSION_THREADS or os.cpu_count() or 1
+
+    content = memoryview(file_content)
+    starts = range(0, len(content), _COMPRESSION_BLOCK_SIZE)
+    map_ = _get_compression_executor(threads).map if threads > 1 else map
+    return b''.join(map_(lambda start: _compress_block(content, start), starts))
+
+
+def _get_compression_executor(threads: int) -> ThreadPoolExecutor:
+    """
+    Get the executor to compress blocks with. Executors are shared between calls and created per process, as the
+    threads of an executor aren't copied when the process is forked.
+    """
+    key = (os.getpid(), threads)
+    with _compression_executors_lock:
+        executor = _compression_executors.get(key)
+        if executor is None:
+            executor = _compression_executors[key] = ThreadPoolExecutor(threads, thread_name_prefix='compress')
+        return executor
+
+
+def _compress_block(content: memoryview, start: int) -> bytes:
+    """
+    Compress a single block of the content for ``compress_bytes``. The 32 KiB in front of the block are used as
+    dictionary so references into the previous block are still possible.
+
+    Args:
+        content: The entire content that is being compressed
+        start: The index of the first byte of the block
+
+    Returns:
+        The compressed block. Ended with a sync flush, or with the end of the stream for the last block
+    """
+    end = start + _COMPRESSION_BLOCK_SIZE
+    if start == 0:
+        deflate_obj = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    else:
+        dictionary = content[max(0, start - _COMPRESSION_DICTIONARY_SIZE):start]
+        deflate_obj = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+
+    compressed = deflate_obj.compress(content[start:end])
+    return compressed + deflate_obj.flush(zlib.Z_FINISH if end >= len(content) else zlib.Z_SYNC_FLUSH)
 
 
 def get_version_directory_path() -> Path:
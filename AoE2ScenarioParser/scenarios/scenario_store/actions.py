@@ -5,6 +5,8 @@ from AoE2ScenarioParser.datasets.players import PlayerId
 from AoE2ScenarioParser.scenarios.scenario_store import store
 
 if TYPE_CHECKING:
+    from AoE2ScenarioParser.objects.data_objects.effect import Effect
+    from AoE2ScenarioParser.objects.data_objects.trigger import Trigger
     from AoE2ScenarioParser.objects.data_objects.unit import Unit
 
 
@@ -27,14 +29,92 @@ def unit_change_ownership(uuid: UUID, player: Union[int, PlayerId], *args) -> No
         player (Union[int, PlayerId]): The player to transfer the units to.
         args: Unit object or List of unit objects
     """
-    def transfer_unit(scenario_, unit_, player_):
-        scenario_.unit_manager.units[unit_.player].remove(unit_)
-        scenario_.unit_manager.units[player_].append(unit_)
-
-    scenario = store.get_scenario(uuid)
-    for units in args:
-        if isinstance(units, List):
-            for unit in units:
-                transfer_unit(scenario, unit, player)
+    units = []
+    for arg in args:
+        if isinstance(arg, List):
+            units.extend(arg)
         else:
-            transfer_unit(scenario, units, player)
+            units.append(arg)
+
+    store.get_scenario(uuid).unit_manager.change_ownership(units, player)
+
+
+def unit_change_garrison(uuid: UUID, unit: 'Unit', previous_garrisoned_in_id: int) -> None:
+    """
+    Update the garrison index of the unit manager after the unit's garrison changed.
+
+    Args:
+        uuid (UUID): The UUID of the scenario
+        unit (Unit): The unit which garrison changed
+        previous_garrisoned_in_id (int): The reference id of the unit the unit was garrisoned in before the change
+    """
+    scenario = store.find_scenario(uuid)
+    if scenario is not None:
+        scenario.unit_manager._update_garrison(unit, previous_garrisoned_in_id)
+
+
+def unit_change_reference_id(uuid: UUID, unit: 'Unit', previous_reference_id: int) -> None:
+    """
+    Update the highest reference id known by the unit manager after the reference id of the unit changed.
+
+    Args:
+        uuid (UUID): The UUID of the scenario
+        unit (Unit): The unit which reference id changed
+        previous_reference_id (int): The reference id of the unit before the change
+    """
+    scenario = store.find_scenario(uuid)
+    if scenario is not None:
+        scenario.unit_manager._update_reference_id(unit, previous_reference_id)
+
+
+def trigger_change_effects(uuid: UUID, trigger: 'Trigger') -> None:
+    """
+    Update the activation index of the trigger manager after effects were added to or removed from the trigger.
+
+    Args:
+        uuid (UUID): The UUID of the scenario
+        trigger (Trigger): The trigger which effects changed
+    """
+    scenario = store.find_scenario(uuid)
+    if scenario is not None:
+        scenario.trigger_manager._update_trigger_effects(trigger)
+
+
+def effect_change_type(uuid: UUID, effect: 'Effect') -> None:
+    """
+    Update the activation index of the trigger manager after the type of the effect changed.
+
+    Args:
+        uuid (UUID): The UUID of the scenario
+        effect (Effect): The effect which type changed
+    """
+    scenario = store.find_scenario(uuid)
+    if scenario is not None:
+        scenario.trigger_manager._update_effect_type(effect)
+
+
+def effect_change_trigger_id(uuid: UUID, effect: 'Effect', previous_trigger_id: int) -> None:
+    """
+    Update the activation index of the trigger manager after the trigger id of the effect changed.
+
+    Args:
+        uuid (UUID): The UUID of the scenario
+        effect (Effect): The effect which trigger id changed
+        previous_trigger_id (int): The trigger id of the effect before the change
+    """
+    scenario = store.find_scenario(uuid)
+    if scenario is not None:
+        scenario.trigger_manager._update_effect_trigger_id(effect, previous_trigger_id)
+
+
+def trigger_manager_reset_activation_index(uuid: UUID) -> None:
+    """
+    Drop the activation index of the trigger manager after its triggers were changed by another scenario (like when
+    they're imported into another scenario). The index is rebuilt the next time it's used.
+
+    Args:
+        uuid (UUID): The UUID of the scenario
+    """
+    scenario = store.find_scenario(uuid)
+    if scenario is not None:
+        scenario.trigger_manager._activation_index = None
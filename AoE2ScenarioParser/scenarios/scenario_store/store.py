@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING, Dict, Optional
 from uuid import UUID
 
+from AoE2ScenarioParser.helper.exceptions import ScenarioNotFoundError
+
 if TYPE_CHECKING:
     from AoE2ScenarioParser.scenarios.aoe2_scenario import AoE2Scenario
     from AoE2ScenarioParser.scenarios.aoe2_de_scenario import AoE2DEScenario
@@ -17,10 +19,32 @@ def get_scenario(uuid: UUID) -> Optional['AoE2Scenario']:
 
     Returns:
         The scenario based on it's uuid
+
+    Raises:
+        ScenarioNotFoundError: When no scenario with the given UUID is registered (anymore)
     """
     if uuid == "<<NO_HOST_UUID>>":
         return None
-    return _scenarios[uuid]
+    try:
+        return _scenarios[uuid]
+    except KeyError:
+        raise ScenarioNotFoundError(
+            f"No scenario with UUID '{uuid}' is registered. The scenario might have been closed."
+        ) from None
+
+
+def find_scenario(uuid: UUID) -> Optional['AoE2Scenario']:
+    """
+    Get scenario through uuid without raising when it isn't registered. Used to keep (indexes of) managers up to date
+    from objects which can outlive their scenario. Not intended to be called outside of the store itself.
+
+    Args:
+        uuid (UUID): The UUID of the scenario
+
+    Returns:
+        The scenario based on it's uuid or None if no scenario with the given UUID is registered (anymore)
+    """
+    return _scenarios.get(uuid)
 
 
 def register_scenario(scenario: 'AoE2Scenario') -> None:
@@ -33,3 +57,15 @@ def register_scenario(scenario: 'AoE2Scenario') -> None:
     if scenario.uuid in _scenarios:
         raise ValueError("Scenario with that UUID already present")
     _scenarios[scenario.uuid] = scenario
+
+
+def unregister_scenario(scenario: 'AoE2Scenario') -> None:
+    """
+    Remove a scenario from the store. Objects of the scenario can no longer retrieve information through the store
+    afterwards. Unregistering a scenario that isn't registered does nothing.
+
+    Args:
+        scenario (AoE2DEScenario): The scenario to unregister
+    """
+    if _scenarios.get(scenario.uuid) is scenario:
+        del _scenarios[scenario.uuid]
@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from AoE2ScenarioParser.objects.support.area import Area
+from AoE2ScenarioParser.objects.support.selection import Selection
 
 
 class ObjectFactory:
@@ -12,3 +13,7 @@ class ObjectFactory:
     def area(self) -> Area:
         """Return an area map linked to the corresponding scenario"""
         return Area(uuid=self.uuid)
+
+    def selection(self) -> Selection:
+        """Return an empty selection linked to the corresponding scenario. Combine it with areas using ``|``"""
+        return Selection(uuid=self.uuid)
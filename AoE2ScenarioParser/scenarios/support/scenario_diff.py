@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+import hashlib
+from enum import Enum
+from itertools import zip_longest
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.helper import bytes_parser
+from AoE2ScenarioParser.helper.incremental_generator import IncrementalGenerator
+from AoE2ScenarioParser.sections.aoe2_file_section import AoE2FileSection, SectionName
+from AoE2ScenarioParser.sections.aoe2_struct_model import AoE2StructModel
+from AoE2ScenarioParser.sections.retrievers.retriever import Retriever
+from AoE2ScenarioParser.sections.structure_scanner import ScannedSection, StructureScanner
+
+_END_OF_FILE_MARK = "__END_OF_FILE_MARK__"
+
+
+class ScenarioBytes(NamedTuple):
+    """The bytes of a scenario file together with the location of its sections (see: ``StructureScanner``)"""
+    scenario_version: str
+    structure: Dict[str, dict]
+    file_content: bytes
+    data: bytes
+    """The decompressed data (everything after the ``FileHeader``)"""
+    sections: Dict[str, ScannedSection]
+
+    def get_bytes(self, section_name: str, start: int, end: int) -> bytes:
+        """Get bytes of a section. The offsets are positions in the data the section was scanned in"""
+        source = self.file_content if section_name == SectionName.FILE_HEADER.value else self.data
+        return source[start:end]
+
+
+class SectionHash(NamedTuple):
+    digest: bytes
+    """The hash of all bytes of the section"""
+    structs: Dict[str, List[bytes]]
+    """The hash of every struct per (struct) retriever directly within the section"""
+
+
+class ScenarioHashTree(NamedTuple):
+    """The hashes of all sections of a scenario and of the structs directly within them"""
+    scenario_version: str
+    sections: Dict[str, SectionHash]
+
+    def changed_sections(self, other: ScenarioHashTree) -> List[str]:
+        """
+        Get the names of the sections with different content in the other hash tree.
+
+        Args:
+            other: The hash tree to compare with
+
+        Returns:
+            The names of the changed sections in the order of the structure
+        """
+        names = list(self.sections) + [name for name in other.sections if name not in self.sections]
+        return [
+            name for name in names
+            if name not in self.sections or name not in other.sections
+            or self.sections[name].digest != other.sections[name].digest
+        ]
+
+
+class DiffStatus(Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+class ValueChange(NamedTuple):
+    path: str
+    """The path to the value. Like: ``Map.map_color_mood`` or ``effect_data[2].message``"""
+    old: Any
+    new: Any
+
+
+class StructChange(NamedTuple):
+    """A changed struct in a list of structs (like an effect in a trigger)"""
+    index: int
+    status: DiffStatus
+    changes: List[ValueChange]
+
+
+class TriggerChange(NamedTuple):
+    index: int
+    status: DiffStatus
+    name: str
+    changes: List[ValueChange]
+    """The changed attributes of the trigger itself"""
+    effects: List[StructChange]
+    conditions: List[StructChange]
+
+
+class UnitChange(NamedTuple):
+    """A unit added, removed or changed, identified by its owner and reference ID"""
+    player: PlayerId
+    reference_id: int
+    status: DiffStatus
+    changes: List[ValueChange]
+    index: Optional[int] = None
+    """
+    The index of the unit in the units of its owner. Only set when the units of the owner are compared by index, which
+    happens when the reference IDs of the units of the owner aren't unique
+    """
+
+
+class TerrainRegion(NamedTuple):
+    """A rectangle of changed tiles (all coordinates inclusive)"""
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+
+
+class ScenarioDiff(NamedTuple):
+    """The differences between two scenario files (see: ``AoE2Scenario.diff_files``)"""
+    sections: List[str]
+    """The names of the changed sections"""
+    values: List[ValueChange]
+    """Changed values which aren't part of the triggers, units or terrain"""
+    triggers: List[TriggerChange]
+    units: List[UnitChange]
+    terrain: List[TerrainRegion]
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.sections) == 0
+
+
+def hash_scenario_bytes(scenario_bytes: ScenarioBytes) -> ScenarioHashTree:
+    """
+    Hash every section of a scenario and every struct directly within them from their raw bytes.
+
+    Args:
+        scenario_bytes: The scanned scenario (with the ranges of the retrievers and structs)
+
+    Returns:
+        The hash tree of the scenario
+    """
+    sections = {}
+    for name, section in scenario_bytes.sections.items():
+        is_header = name == SectionName.FILE_HEADER.value
+        source = memoryview(scenario_bytes.file_content if is_header else scenario_bytes.data)
+        sections[name] = SectionHash(
+            digest=_digest(source[section.start:section.end]),
+            structs={
+                retriever_name: [_digest(source[start:end]) for start, end in ranges]
+                for retriever_name, ranges in section.structs.items()
+            }
+        )
+    return ScenarioHashTree(scenario_bytes.scenario_version, sections)
+
+
+def diff_scenario_bytes(old: ScenarioBytes, new: ScenarioBytes) -> ScenarioDiff:
+    """
+    Compare the hash trees of two scenarios and decode only the changed parts into a diff.
+
+    Args:
+        old: The scanned scenario to compare from
+        new: The scanned scenario to compare to
+
+    Returns:
+        The differences between the two scenarios
+
+    Raises:
+        ValueError: When the scenarios don't have the same scenario version
+    """
+    if old.scenario_version != new.scenario_version:
+        raise ValueError(
+            f"Unable to diff scenarios with different versions ({old.scenario_version} & {new.scenario_version})"
+        )
+    return _ScenarioDiffer(old, new).diff()
+
+
+class _ScenarioDiffer:
+    def __init__(self, old: ScenarioBytes, new: ScenarioBytes):
+        self.old = old
+        self.new = new
+        self.old_hashes = hash_scenario_bytes(old)
+        self.new_hashes = hash_scenario_bytes(new)
+        self.result = ScenarioDiff([], [], [], [], [])
+        self._models: Dict[str, AoE2StructModel] = {}
+        self._scanner = StructureScanner(old.structure)
+
+    def diff(self) -> ScenarioDiff:
+        for section_name in self.old_hashes.changed_sections(self.new_hashes):
+            self.result.sections.append(section_name)
+            self._diff_section(section_name)
+        return self.result
+
+    def _diff_section(self, section_name: str) -> None:
+        structure = self.old.structure[section_name]
+        old_section, new_section = self.old.sections[section_name], self.new.sections[section_name]
+
+        for name, attributes in structure['retrievers'].items():
+            if name == _END_OF_FILE_MARK:
+                continue
+
+            if name in old_section.structs:
+                changed = _changed_indices(
+                    self.old_hashes.sections[section_name].structs[name],
+                    self.new_hashes.sections[section_name].structs[name]
+                )
+                if changed:
+                    struct_name = attributes['type'][7:]
+                    self._diff_structs(section_name, name, struct_name, structure['structs'][struct_name], changed)
+                continue
+
+            old_range, new_range = old_section.retrievers[name], new_section.retrievers[name]
+            old_bytes = self.old.get_bytes(section_name, old_range.start, old_range.end)
+            new_bytes = self.new.get_bytes(section_name, new_range.start, new_range.end)
+            if old_bytes != new_bytes:
+                self.result.values.append(ValueChange(
+                    f"{section_name}.{name}",
+                    _decode_retriever(name, attributes, old_range.repeat, old_bytes),
+                    _decode_retriever(name, attributes, new_range.repeat, new_bytes),
+                ))
+
+    def _diff_structs(
+            self, section_name: str, retriever_name: str, struct_name: str, struct_structure: dict, changed: List[int]
+    ) -> None:
+        """Decode the changed structs of a (struct) retriever and add their differences to the result"""
+        def decode(scenario_bytes: ScenarioBytes, index: int) -> Optional[AoE2FileSection]:
+            ranges = scenario_bytes.sections[section_name].structs[retriever_name]
+            if index >= len(ranges):
+                return None
+            start, end = ranges[index]
+            struct_bytes = scenario_bytes.get_bytes(section_name, start, end)
+            return self._decode_struct(struct_name, struct_structure, struct_bytes)
+
+        if (section_name, retriever_name) == (SectionName.MAP.value, 'terrain_data'):
+            return self._diff_terrain(changed)
+        if (section_name, retriever_name) == (SectionName.UNITS.value, 'players_units'):
+            for index in changed:
+                self._diff_player_units(index, struct_name, struct_structure)
+            return
+
+        for index in changed:
+            old_struct, new_struct = decode(self.old, index), decode(self.new, index)
+
+            if (section_name, retriever_name) == (SectionName.TRIGGERS.value, 'trigger_data'):
+                self.result.triggers.append(_diff_trigger(index, old_struct, new_struct))
+            elif old_struct is None or new_struct is None:
+                self.result.values.append(
+                    ValueChange(f"{section_name}.{retriever_name}[{index}]", _values(old_struct), _values(new_struct))
+                )
+            else:
+                self.result.values.extend(
+                    _diff_values(old_struct, new_struct, prefix=f"{section_name}.{retriever_name}[{index}].")
+                )
+
+    def _diff_terrain(self, changed: List[int]) -> None:
+        """Add the regions of the changed tiles to the result"""
+        map_section = SectionName.MAP.value
+        old_size, new_size = [
+            _decode_section_value(scenario_bytes, map_section, 'map_width') for scenario_bytes in (self.old, self.new)
+        ]
+
+        if old_size != new_size:
+            self.result.terrain.append(TerrainRegion(0, 0, new_size - 1, new_size - 1))
+        else:
+            self.result.terrain.extend(_changed_regions(changed, new_size))
+
+    def _diff_player_units(self, index: int, struct_name: str, struct_structure: dict) -> None:
+        """
+        Compare the units of a player by their reference ID. When the reference IDs of the units of the player aren't
+        unique (in either scenario), the units are compared by their index instead. Only units with different bytes are
+        decoded
+        """
+        unit_struct_name = struct_structure['retrievers']['units']['type'][7:]
+        unit_structure = struct_structure['structs'][unit_struct_name]
+        old_units, new_units = [
+            self._get_unit_bytes(scenario_bytes, index, struct_name, struct_structure, unit_struct_name)
+            for scenario_bytes in (self.old, self.new)
+        ]
+
+        def diff_unit(old_unit_bytes: bytes, new_unit_bytes: bytes) -> List[ValueChange]:
+            return _diff_values(
+                self._decode_struct(unit_struct_name, unit_structure, old_unit_bytes),
+                self._decode_struct(unit_struct_name, unit_structure, new_unit_bytes),
+            )
+
+        player = PlayerId(index)
+        old_by_id, new_by_id = dict(old_units), dict(new_units)
+        if len(old_by_id) != len(old_units) or len(new_by_id) != len(new_units):
+            for unit_index, (old_unit, new_unit) in enumerate(zip_longest(old_units, new_units)):
+                if old_unit is None:
+                    self.result.units.append(UnitChange(player, new_unit[0], DiffStatus.ADDED, [], unit_index))
+                elif new_unit is None:
+                    self.result.units.append(UnitChange(player, old_unit[0], DiffStatus.REMOVED, [], unit_index))
+                elif old_unit[1] != new_unit[1]:
+                    changes = diff_unit(old_unit[1], new_unit[1])
+                    self.result.units.append(UnitChange(player, new_unit[0], DiffStatus.CHANGED, changes, unit_index))
+            return
+
+        for reference_id, unit_bytes in old_units:
+            new_unit_bytes = new_by_id.get(reference_id)
+            if new_unit_bytes is None:
+                self.result.units.append(UnitChange(player, reference_id, DiffStatus.REMOVED, []))
+            elif new_unit_bytes != unit_bytes:
+                changes = diff_unit(unit_bytes, new_unit_bytes)
+                self.result.units.append(UnitChange(player, reference_id, DiffStatus.CHANGED, changes))
+        for reference_id, _ in new_units:
+            if reference_id not in old_by_id:
+                self.result.units.append(UnitChange(player, reference_id, DiffStatus.ADDED, []))
+
+    def _get_unit_bytes(
+            self,
+            scenario_bytes: ScenarioBytes,
+            index: int,
+            struct_name: str,
+            struct_structure: dict,
+            unit_struct_name: str
+    ) -> List[Tuple[int, bytes]]:
+        """The reference ID and bytes of every unit of a player (in order)"""
+        players_units = scenario_bytes.sections[SectionName.UNITS.value].structs['players_units']
+        if index >= len(players_units):
+            return []
+
+        data = scenario_bytes.data
+        player_units = self._scanner.scan_struct(struct_name, struct_structure, data, players_units[index][0], True)
+        unit_ranges = player_units.structs['units']
+        if not unit_ranges:
+            return []
+
+        # The location of the reference ID is the same in every unit
+        first_unit = self._scanner.scan_struct(
+            unit_struct_name, struct_structure['structs'][unit_struct_name], data, unit_ranges[0][0], True
+        )
+        id_start = first_unit.retrievers['reference_id'].start - first_unit.start
+        id_end = first_unit.retrievers['reference_id'].end - first_unit.start
+        return [
+            (int.from_bytes(data[start + id_start:start + id_end], 'little', signed=True), data[start:end])
+            for start, end in unit_ranges
+        ]
+
+    def _decode_struct(self, struct_name: str, struct_structure: dict, struct_bytes: bytes) -> AoE2FileSection:
+        """Decode the bytes of a single struct"""
+        model = self._models.get(struct_name)
+        if model is None:
+            model = self._models[struct_name] = AoE2StructModel.from_structure(struct_name, struct_structure)
+
+        struct = AoE2FileSection.from_model(model, host_uuid=None)
+        struct.set_data_from_generator(IncrementalGenerator(struct_name, struct_bytes))
+        return struct
+
+
+def _digest(content) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _changed_indices(old_hashes: List[bytes], new_hashes: List[bytes]) -> List[int]:
+    """The indices of the structs that were changed, added or removed. Structs are compared by their index"""
+    changed = [index for index, (old, new) in enumerate(zip(old_hashes, new_hashes)) if old != new]
+    changed.extend(range(min(len(old_hashes), len(new_hashes)), max(len(old_hashes), len(new_hashes))))
+    return changed
+
+
+def _changed_regions(changed: List[int], map_size: int) -> List[TerrainRegion]:
+    """
+    Combine changed tiles into rectangles. Consecutive changed tiles in a row form a run, runs with the same columns
+    in consecutive rows are combined.
+    """
+    runs: Dict[int, List[List[int]]] = {}
+    for index in changed:
+        x, y = index % map_size, index // map_size
+        row = runs.setdefault(y, [])
+        if row and row[-1][1] == x - 1:
+            row[-1][1] = x
+        else:
+            row.append([x, x])
+
+    regions: List[TerrainRegion] = []
+    open_regions: Dict[tuple, int] = {}
+    for y in sorted(runs):
+        next_open_regions = {}
+        for x1, x2 in runs[y]:
+            index = open_regions.get((x1, x2))
+            if index is not None and regions[index].y2 == y - 1:
+                regions[index] = regions[index]._replace(y2=y)
+            else:
+                index = len(regions)
+                regions.append(TerrainRegion(x1, y, x2, y))
+            next_open_regions[(x1, x2)] = index
+        open_regions = next_open_regions
+    return regions
+
+
+def _diff_trigger(index: int, old: Optional[AoE2FileSection], new: Optional[AoE2FileSection]) -> TriggerChange:
+    if old is None or new is None:
+        status = DiffStatus.ADDED if old is None else DiffStatus.REMOVED
+        return TriggerChange(index, status, (new or old).trigger_name, [], [], [])
+
+    return TriggerChange(
+        index=index,
+        status=DiffStatus.CHANGED,
+        name=new.trigger_name,
+        changes=_diff_values(old, new, exclude=('effect_data', 'condition_data')),
+        effects=_diff_struct_lists(old.effect_data, new.effect_data),
+        conditions=_diff_struct_lists(old.condition_data, new.condition_data),
+    )
+
+
+def _diff_struct_lists(old: List[AoE2FileSection], new: List[AoE2FileSection]) -> List[StructChange]:
+    changes = []
+    for index, (old_struct, new_struct) in enumerate(zip_longest(old, new)):
+        if old_struct is None:
+            changes.append(StructChange(index, DiffStatus.ADDED, []))
+        elif new_struct is None:
+            changes.append(StructChange(index, DiffStatus.REMOVED, []))
+        else:
+            struct_changes = _diff_values(old_struct, new_struct)
+            if struct_changes:
+                changes.append(StructChange(index, DiffStatus.CHANGED, struct_changes))
+    return changes
+
+
+def _diff_values(old: AoE2FileSection, new: AoE2FileSection, prefix: str = "", exclude=()) -> List[ValueChange]:
+    """Compare the values of two structs (recursively)"""
+    changes = []
+    for name, retriever in old.retriever_map.items():
+        if name in exclude:
+            continue
+        new_retriever = new.retriever_map[name]
+
+        if retriever.datatype.type == "struct":
+            for index, (old_struct, new_struct) in enumerate(zip_longest(retriever.data, new_retriever.data)):
+                if old_struct is None or new_struct is None:
+                    changes.append(ValueChange(f"{prefix}{name}[{index}]", _values(old_struct), _values(new_struct)))
+                else:
+                    changes.extend(_diff_values(old_struct, new_struct, prefix=f"{prefix}{name}[{index}]."))
+        elif retriever.data != new_retriever.data:
+            changes.append(ValueChange(f"{prefix}{name}", retriever.data, new_retriever.data))
+    return changes
+
+
+def _values(struct: Optional[AoE2FileSection]) -> Optional[Dict[str, Any]]:
+    """All values of a struct as a dict (recursively)"""
+    if struct is None:
+        return None
+    return {
+        name: [_values(s) for s in retriever.data] if retriever.datatype.type == "struct" else retriever.data
+        for name, retriever in struct.retriever_map.items()
+    }
+
+
+def _decode_retriever(name: str, attributes: dict, repeat: int, retriever_bytes: bytes) -> Any:
+    """Decode the bytes of a single (non struct) retriever"""
+    retriever = Retriever.from_structure(name, attributes)
+    retriever.datatype.repeat = repeat
+    igenerator = IncrementalGenerator(name, retriever_bytes)
+    retriever.set_data_from_bytes(bytes_parser.retrieve_bytes(igenerator, retriever))
+    return retriever.data
+
+
+def _decode_section_value(scenario_bytes: ScenarioBytes, section_name: str, name: str) -> Any:
+    """Decode a single (non struct) retriever directly within a section"""
+    scanned = scenario_bytes.sections[section_name].retrievers[name]
+    return _decode_retriever(
+        name,
+        scenario_bytes.structure[section_name]['retrievers'][name],
+        scanned.repeat,
+        scenario_bytes.get_bytes(section_name, scanned.start, scanned.end)
+    )
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class ValidationIssue(NamedTuple):
+    """A problem found while validating a scenario file"""
+    section: Optional[str]
+    """The name of the section the problem was found in. None when the problem isn't related to a section"""
+    path: str
+    """The path to the retriever within the section. Like: ``trigger_data[3].effect_data[0].message``"""
+    offset: int
+    """
+    The offset of the byte where the problem was found. For the ``FileHeader`` section, offsets are positions in the
+    file. For all other sections, offsets are positions in the decompressed data. -1 when unknown
+    """
+    message: str
+
+    def __str__(self):
+        location = f"{self.section}.{self.path}" if self.section and self.path else (self.section or self.path)
+        return f"{self.message}" + (f" (at offset {self.offset} in '{location}')" if location else "")
+
+
+class ScenarioValidation(NamedTuple):
+    """The result of validating a scenario file (see: ``AoE2Scenario.validate_file``)"""
+    scenario_version: Optional[str]
+    issues: List[ValidationIssue]
+    sections: Dict[str, Tuple[int, int]]
+    """The (start, end) offsets of all sections that were found to be valid"""
+    trailing_bytes: int
+    """The amount of bytes found after the end of the last section"""
+
+    @property
+    def is_valid(self) -> bool:
+        return len(self.issues) == 0
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from copy import deepcopy
 from enum import Enum
-from typing import Dict
+from typing import Dict, Generator, Tuple
 
 from AoE2ScenarioParser.helper import bytes_parser
 from AoE2ScenarioParser.helper.incremental_generator import IncrementalGenerator
 from AoE2ScenarioParser.helper.list_functions import listify
 from AoE2ScenarioParser.helper.pretty_format import pretty_format_list, pretty_format_dict
-from AoE2ScenarioParser.helper.string_manipulations import create_textual_hex, insert_char, add_suffix_chars, q_str
+from AoE2ScenarioParser.helper.string_manipulations import create_textual_hex_lines, insert_char, add_suffix_chars, \
+    q_str
 from AoE2ScenarioParser.sections.aoe2_struct_model import AoE2StructModel, model_dict_from_structure
 from AoE2ScenarioParser.sections.dependencies.dependency import handle_retriever_dependency
 from AoE2ScenarioParser.sections.retrievers.retriever import Retriever, duplicate_retriever_map, reset_retriever_map
@@ -36,9 +37,11 @@ class SectionName(Enum):
 
 
 class AoE2FileSection:
-    def __init__(self, name, retriever_map, host_uuid, struct_models=None, level=SectionLevel.TOP_LEVEL):
+    def __init__(self, name, retriever_map, host_uuid, struct_models=None, level=SectionLevel.TOP_LEVEL, owner=None):
         if struct_models is None:
             struct_models = {}
+        if owner is None:
+            owner = object()
 
         self.name: str = name
         self.retriever_map: Dict[str, 'Retriever'] = retriever_map
@@ -46,9 +49,12 @@ class AoE2FileSection:
         self.byte_length: int = -1
         self.struct_models: Dict[str, AoE2StructModel] = struct_models
         self.level: SectionLevel = level
+        # Token of the section tree this section belongs to. Structs with another owner than the section containing them
+        # are shared with another tree (see: AoE2Scenario.fork()) and are copied before they're edited.
+        self._owner = owner
 
     @classmethod
-    def from_model(cls, model, host_uuid, set_defaults=False) -> AoE2FileSection:
+    def from_model(cls, model, host_uuid, set_defaults=False, owner=None) -> AoE2FileSection:
         """
         Create a copy (what was called struct before) from a model.
 
@@ -56,6 +62,7 @@ class AoE2FileSection:
             model (AoE2StructModel): The model to copy from
             host_uuid (UUID): String representing host scenario
             set_defaults (bool): If retrievers need to be set to the default values
+            owner (object): The owner token of the section this struct will be placed in
 
         Returns:
             An AoE2FileSection instance based on the model
@@ -69,7 +76,8 @@ class AoE2FileSection:
             retriever_map=duplicate_rmap,
             host_uuid=host_uuid,
             struct_models=model.structs,
-            level=SectionLevel.STRUCT
+            level=SectionLevel.STRUCT,
+            owner=owner
         )
 
     @classmethod
@@ -81,6 +89,45 @@ class AoE2FileSection:
         structs = model_dict_from_structure(structure)
         return cls(section_name, retriever_map, host_uuid, structs)
 
+    def copy(self, host_uuid, owner=None) -> AoE2FileSection:
+        """
+        Create a copy-on-write copy of this section. The retrievers are duplicated but the structs within them are
+        shared with this section until they're edited through ``get_editable_struct``.
+
+        Args:
+            host_uuid (UUID): The UUID of the scenario the copy belongs to
+            owner (object): The owner token for the copy. When left empty, a new token is created
+
+        Returns:
+            The copied section
+        """
+        return AoE2FileSection(
+            name=self.name,
+            retriever_map={name: retriever.duplicate(copy_data=True) for name, retriever in self.retriever_map.items()},
+            host_uuid=host_uuid,
+            struct_models=self.struct_models,
+            level=self.level,
+            owner=owner
+        )
+
+    def get_editable_struct(self, retriever_name, index) -> AoE2FileSection:
+        """
+        Get a struct from this section that is safe to edit. If the struct is shared with another section tree, it's
+        copied (and replaced in this section) first.
+
+        Args:
+            retriever_name (str): The name of the (struct) retriever
+            index (int): The index of the struct in the retriever data
+
+        Returns:
+            The struct owned by this section tree
+        """
+        structs = self.retriever_map[retriever_name].data
+        struct = structs[index]
+        if struct._owner is not self._owner:
+            struct = structs[index] = struct.copy(self._host_uuid, owner=self._owner)
+        return struct
+
     def get_data_as_bytes(self):
         result = []
         retriever: Retriever
@@ -121,6 +168,28 @@ class AoE2FileSection:
 
         self.byte_length = total_length
 
+    def set_data_to_default(self) -> None:
+        """
+        Fill data from all retrievers (and structs, recursively) with the default values from the structure.
+        Construct dependencies are handled the same way as when parsing, so the amount of structs and values match the
+        values they depend on.
+        """
+        for retriever in self.retriever_map.values():
+            handle_retriever_dependency(retriever, "construct", self, self._host_uuid)
+            if retriever.datatype.type == "struct":
+                struct_name = retriever.datatype.get_struct_name()
+                model = self.struct_models.get(struct_name)
+                if model is None:
+                    raise ValueError(f"Model '{struct_name}' not found. Likely not defined in structure.")
+
+                retriever.data = []
+                for _ in range(retriever.datatype.repeat):
+                    struct = AoE2FileSection.from_model(model, host_uuid=self._host_uuid, owner=self._owner)
+                    struct.set_data_to_default()
+                    retriever.data.append(struct)
+            else:
+                retriever.set_data_to_default(match_repeat=True)
+
     def _fill_retriever_with_bytes(self, retriever, retrieved_bytes):
         try:
             retriever.set_data_from_bytes(retrieved_bytes)
@@ -132,7 +201,7 @@ class AoE2FileSection:
             raise e
 
     def _create_struct(self, model: AoE2StructModel, igenerator) -> AoE2FileSection:
-        struct = AoE2FileSection.from_model(model, host_uuid=self._host_uuid)
+        struct = AoE2FileSection.from_model(model, host_uuid=self._host_uuid, owner=self._owner)
 
         try:
             struct.set_data_from_generator(igenerator)
@@ -201,28 +270,50 @@ class AoE2FileSection:
             return "############ " + self.name + " ############  [STRUCT]"
 
     def get_byte_structure_as_string(self):
-        byte_structure = "\n" + self.get_header_string()
+        return "".join(self.iter_byte_structure())
 
-        for key, retriever in self.retriever_map.items():
-            byte_structure += "\n"
+    def iter_byte_structure(self, byte_range: Tuple[int, int] = None, offset: int = 0) -> Generator[str, None, int]:
+        """
+        Streaming variant of ``get_byte_structure_as_string``. Generates the byte structure in (small) parts so it can
+        be written to a file without creating the entire string in memory.
+
+        Args:
+            byte_range (Tuple[int, int]): When set, only retrievers with bytes in this range (start inclusive, end
+                exclusive) are included. Structs and sections without any of these retrievers are left out entirely
+            offset (int): The offset of the first byte of this section. Used to compare against ``byte_range``
 
+        Returns:
+            A generator with the parts of the byte structure. The generator returns the offset after the last byte of
+            this section (the value of the ``StopIteration``, or the result of ``yield from``)
+        """
+        # When limited to a byte range, headers are only written when something in the range is written
+        pending_header = "\n" + self.get_header_string()
+        if byte_range is None:
+            yield pending_header
+            pending_header = ""
+
+        for key, retriever in self.retriever_map.items():
             listed_retriever_data = listify(retriever.data)
-            struct_header_set = False
-            for struct in listed_retriever_data:
-                if isinstance(struct, AoE2FileSection):
-                    if not struct_header_set:
-                        byte_structure += f"\n{'#' * 27} {key} ({retriever.datatype.to_simple_string()})"
-                        struct_header_set = True
-                    byte_structure += struct.get_byte_structure_as_string()
-            # Struct Header was set. Retriever was struct, data retrieved using recursion. Next retriever.
-            if struct_header_set:
-                byte_structure += f"{'#' * 27} End of: {key} ({retriever.datatype.to_simple_string()})\n"
+            if any(isinstance(struct, AoE2FileSection) for struct in listed_retriever_data):
+                struct_header = f"\n\n{'#' * 27} {key} ({retriever.datatype.to_simple_string()})"
+                for struct in listed_retriever_data:
+                    offset, prefixed = yield from _prefix_first_part(
+                        struct.iter_byte_structure(byte_range, offset), pending_header + struct_header
+                    )
+                    if prefixed:
+                        pending_header = struct_header = ""
+                # Struct Header was set. Retriever was struct, data retrieved using recursion. Next retriever.
+                if not struct_header:
+                    yield f"{'#' * 27} End of: {key} ({retriever.datatype.to_simple_string()})\n"
                 continue
 
-            retriever_data_bytes = retriever.get_data_as_bytes().hex()
-            retriever_hex = create_textual_hex(retriever_data_bytes, space_distance=2, enter_distance=24)
+            retriever_data_bytes = retriever.get_data_as_bytes()
+            start = offset
+            offset += len(retriever_data_bytes)
+            if byte_range is not None and not (start < byte_range[1] and offset > byte_range[0]):
+                continue
 
-            split_hex = retriever_hex.split("\n")
+            split_hex = create_textual_hex_lines(retriever_data_bytes, bytes_per_line=8)
             split_hex_length = len(split_hex)
 
             retriever_short_string: str = retriever.get_short_str()
@@ -243,9 +334,12 @@ class AoE2FileSection:
                 data_part = data_lines[i] if i < split_data_length else ""
                 combined_strings.append(add_suffix_chars(hex_part, " ", 28) + data_part)
 
-            byte_structure += "\n".join(combined_strings)
+            yield pending_header + "\n" + "\n".join(combined_strings)
+            pending_header = ""
 
-        return byte_structure + "\n"
+        if not pending_header:
+            yield "\n"
+        return offset
 
     def __str__(self):
         represent = self.name + ": \n"
@@ -273,3 +367,23 @@ class AoE2FileSection:
 
     def __repr__(self):
         return f"<AoE2FileSection> {self.name}"
+
+
+def _prefix_first_part(parts: Generator[str, None, int], prefix: str) -> Generator[str, None, Tuple[int, bool]]:
+    """
+    Yield the parts of a byte structure with the prefix in front of the first part (if there are any parts).
+
+    Returns:
+        A generator with the parts. The generator returns the offset returned by the given parts and if the prefix has
+        been used
+    """
+    prefixed = False
+    while True:
+        try:
+            part = next(parts)
+        except StopIteration as stop:
+            return stop.value, prefixed
+        if not prefixed:
+            part = prefix + part
+            prefixed = True
+        yield part
@@ -42,8 +42,9 @@ def handle_retriever_dependency(retriever: Retriever, state, section, host_uuid:
 
 def execute_dependency_eval(retriever_event, section, host_uuid):
     eval_code = retriever_event.dependency_eval.eval_code
-    eval_locals = retriever_event.dependency_eval.eval_locals
     targets = retriever_event.dependency_target.targets
+    # The dependencies are shared between retrievers (and scenarios), so every evaluation gets its own locals
+    eval_locals = dict(retriever_event.dependency_eval.eval_locals)
 
     values = []
     for target in targets:
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import pickle
 from typing import Dict
 
 from AoE2ScenarioParser.helper import bytes_parser, string_manipulations
-from AoE2ScenarioParser.helper.bytes_conversions import parse_bytes_to_val, parse_val_to_bytes
+from AoE2ScenarioParser.helper.bytes_conversions import parse_bytes_to_val, parse_val_to_bytes, bytes_to_fixed_chars
 from AoE2ScenarioParser.helper.list_functions import listify
 from AoE2ScenarioParser.helper.pretty_format import pretty_format_list
 from AoE2ScenarioParser.sections.dependencies.dependency_action import DependencyAction
@@ -102,18 +101,66 @@ class Retriever:
             self._print_value_update(old_value, value)
         self._data = value
 
-    def set_data_to_default(self):
-        if self.datatype.type == "data":
-            data = bytes.fromhex(self.default_value)
-        elif type(self.default_value) is list:
-            data = self.default_value.copy()
-            assert data is not self.default_value
+    def set_data_to_default(self, match_repeat: bool = False) -> None:
+        """
+        Set the data of this retriever to its default value from the structure.
+
+        Args:
+            match_repeat: If the amount of values should match the datatype repeat. Missing values are filled with the
+                empty value of the datatype. The data is then presented the same way as parsed data would be (a list
+                or a single value).
+        """
+        default = self.default_value
+        if type(default) is list:
+            data = [self._parse_default_value(value) for value in default]
         else:
-            data = self.default_value
+            data = self._parse_default_value(default)
+
+        if match_repeat:
+            repeat = self.datatype.repeat
+            values = data if type(default) is list else [data] * repeat
+            if len(values) != repeat:
+                values = (values + [self._parse_default_value(None)] * repeat)[:repeat]
+            data = bytes_parser.vorl(self, values)
 
         self.data = data
 
-    def duplicate(self):
+    def _parse_default_value(self, value):
+        """
+        Parse a single default value from the structure to the type the data of this retriever has when parsed.
+        Values without a default are set to the empty value of the datatype.
+        """
+        var_type, var_len = self.datatype.type_and_length
+
+        if var_type == "u" or var_type == "s":
+            return int(value) if value is not None else 0
+        elif var_type == "f":
+            return float(value) if value is not None else 0.0
+        elif var_type == "data":
+            return bytes.fromhex(value) if type(value) is str else b"\x00" * var_len
+        elif var_type == "c":
+            # Fixed length strings can be defined as the hex representation of all characters
+            if type(value) is str and len(value) == var_len * 2:
+                try:
+                    return bytes_to_fixed_chars(bytes.fromhex(value))
+                except ValueError:
+                    pass
+            return value if value is not None else ""
+        elif var_type == "str":
+            return value if value is not None else ""
+        return value
+
+    def duplicate(self, copy_data=False):
+        """
+        Create a new retriever with the same properties and dependencies as this one.
+
+        Args:
+            copy_data (bool): If the data should be copied to the new retriever too. Lists are copied shallowly, so
+                structs within them are shared with this retriever.
+
+        Returns:
+            The new retriever
+        """
         retriever = Retriever(
             name=self.name,
             default_value=self.default_value,
@@ -122,8 +169,11 @@ class Retriever:
             log_value=self.log_value
         )
         for attr in attributes:
-            if hasattr(self, attr):
-                setattr(retriever, attr, getattr(self, attr))
+            dependency = getattr(self, attr, None)
+            if dependency is not None:
+                setattr(retriever, attr, dependency)
+        if copy_data:
+            retriever._data = self._data.copy() if type(self._data) is list else self._data
         return retriever
 
     @classmethod
@@ -185,7 +235,17 @@ class Retriever:
 
 
 def duplicate_retriever_map(retriever_map: Dict[str, Retriever]) -> Dict[str, Retriever]:
-    return pickle.loads(pickle.dumps(retriever_map))
+    """
+    Duplicate all retrievers in the given map (without their data). This is a lot faster than copying the entire map
+    (using pickle) as the dependencies of the retrievers are loaded from the structure once and can be shared.
+
+    Args:
+        retriever_map: The retriever map to duplicate
+
+    Returns:
+        A new retriever map with the duplicated retrievers
+    """
+    return {name: retriever.duplicate() for name, retriever in retriever_map.items()}
 
 
 def reset_retriever_map(retriever_map: Dict[str, Retriever]) -> None:
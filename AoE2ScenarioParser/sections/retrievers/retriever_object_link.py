@@ -71,7 +71,8 @@ class RetrieverObjectLink:
 
             if self.process_as_object:
                 return self.process_object_list(value, number_hist, host_uuid)
-            return value
+            # Lists are copied so objects don't share (and edit) the list within the sections
+            return value.copy() if type(value) is list else value
 
     def process_object_list(self, value_list, instance_number_history, host_uuid):
         object_list = []
@@ -105,13 +106,64 @@ class RetrieverObjectLink:
             self._commit_special_unit_case(host_uuid, value)
             return
 
+        # Find the retriever without copying shared structs. They're only copied when the value actually changes
+        file_section, retriever = self._get_retriever(section, number_hist, host_uuid, editable=False)
+        if retriever is None:
+            return
+
+        changed = False
+        if self.process_as_object:
+            struct_datatype = retriever.datatype.var
+
+            prefix = "struct:"
+            if not struct_datatype.startswith(prefix):
+                raise ValueError(
+                    f"process_as_object isn't defined properly. Expected: '{prefix}...', got: '{struct_datatype}'"
+                )
+
+            if retriever.data is None or len(retriever.data) != len(value):
+                file_section, retriever = self._get_retriever(section, number_hist, host_uuid, editable=True)
+                struct_model = file_section.struct_models[struct_datatype[len(prefix):]]
+
+                RetrieverObjectLink.update_retriever_length(
+                    retriever, struct_model, len(value), host_uuid, owner=file_section._owner
+                )
+                changed = True
+            RetrieverObjectLink.commit_object_list(value, host_obj._instance_number_history)
+        elif retriever.data != value:
+            file_section, retriever = self._get_retriever(section, number_hist, host_uuid, editable=True)
+            retriever.data = value
+            changed = True
+
+        # Dependencies of unchanged retrievers within structs still hold, running them would only copy the struct
+        if hasattr(retriever, 'on_commit') and (changed or file_section is section):
+            handle_retriever_dependency(retriever, "commit", file_section, host_uuid)
+
+    def _get_retriever(self, section: AoE2FileSection, number_hist: List[int], host_uuid, editable: bool):
+        """
+        Find the retriever this link points to.
+
+        Args:
+            section: The section the link starts in
+            number_hist: The instance number history of the object
+            host_uuid: The UUID of the scenario
+            editable: If the structs on the way to the retriever should be copied when they're shared with another
+                scenario (see: ``AoE2FileSection.get_editable_struct``)
+
+        Returns:
+            The section or struct containing the retriever and the retriever itself. The retriever is None when the
+            link is not supported in the scenario version (or writing errors are ignored)
+        """
         # Retrieve value without using eval() -- Eval is slow
         retriever = None
         file_section = section
         for index, item in enumerate(self.splitted_link):
             try:
                 if "[" in item:
-                    file_section = getattr(file_section, item[:-11])[number_hist[index]]
+                    if editable:
+                        file_section = file_section.get_editable_struct(item[:-11], number_hist[index])
+                    else:
+                        file_section = file_section.retriever_map[item[:-11]].data[number_hist[index]]
                 else:
                     retriever = file_section.retriever_map[item]
             except KeyError as e:
@@ -119,33 +171,14 @@ class RetrieverObjectLink:
                 if self.support is not None:
                     if not self.support.supports(
                             getters.get_scenario_version(host_uuid)):
-                        return
+                        return file_section, None
                 if settings.IGNORE_WRITING_ERRORS:
-                    return
+                    return file_section, None
                 raise e
 
         if retriever is None:
             raise ValueError("RetrieverObjectLink is unable to find retriever")
-
-        if self.process_as_object:
-            struct_datatype = retriever.datatype.var
-
-            prefix = "struct:"
-            if not struct_datatype.startswith(prefix):
-                raise ValueError(
-                    f"process_as_object isn't defined properly. Expected: '{prefix}...', got: '{struct_datatype}'"
-                )
-
-            struct_name = struct_datatype[len(prefix):]
-            struct_model = file_section.struct_models[struct_name]
-
-            RetrieverObjectLink.update_retriever_length(retriever, struct_model, len(value), host_uuid)
-            RetrieverObjectLink.commit_object_list(value, host_obj._instance_number_history)
-        else:
-            retriever.data = value
-
-        if hasattr(retriever, 'on_commit'):
-            handle_retriever_dependency(retriever, "commit", file_section, host_uuid)
+        return file_section, retriever
 
     @staticmethod
     def commit_object_list(object_list, instance_number_history):
@@ -155,7 +188,7 @@ class RetrieverObjectLink:
             obj.commit()
 
     @staticmethod
-    def update_retriever_length(retriever, model, new_len, host_uuid):
+    def update_retriever_length(retriever, model, new_len, host_uuid, owner=None):
         try:
             old_len = len(retriever.data)
         except TypeError:  # retriever.data was not set before (list of 0 -> None)
@@ -165,10 +198,10 @@ class RetrieverObjectLink:
         if new_len < old_len:
             retriever.data = retriever.data[:new_len]
         elif new_len > old_len:
-            retriever.data += [
-                AoE2FileSection.from_model(model, host_uuid, set_defaults=True)
-                for _ in range(new_len - old_len)
-            ]
+            # Creating a struct from the model is relatively expensive, so it's only done once. All other new structs
+            # are copies of that struct (with the same owner, so they're not copied again when edited)
+            struct = AoE2FileSection.from_model(model, host_uuid, set_defaults=True, owner=owner)
+            retriever.data += [struct] + [struct.copy(host_uuid, owner=struct._owner) for _ in range(new_len - old_len - 1)]
 
             if retriever.log_value:
                 retriever._print_value_update(f"[{model.name}] * {old_len}", f"[{model.name}] * {new_len}")
@@ -193,13 +226,15 @@ class RetrieverObjectLink:
         sections = getters.get_sections(host_uuid)
 
         for player, player_unit in enumerate(value):
-            player_unit_retriever = sections["Units"].players_units[player]
+            player_unit_retriever = sections["Units"].get_editable_struct("players_units", player)
             retriever_list = player_unit_retriever.retriever_map.values()
             units = player_unit_retriever.retriever_map["units"]
             # units = get_retriever_by_name(retriever_list, "units")
             struct_model = player_unit_retriever.struct_models["UnitStruct"]
 
-            RetrieverObjectLink.update_retriever_length(units, struct_model, len(value[player]), host_uuid)
+            RetrieverObjectLink.update_retriever_length(
+                units, struct_model, len(value[player]), host_uuid, owner=player_unit_retriever._owner
+            )
             RetrieverObjectLink.commit_object_list(player_unit, [player])
 
             for retriever in retriever_list:
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import math
+import struct
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from AoE2ScenarioParser.helper.bytes_conversions import bytes_to_str
+from AoE2ScenarioParser.helper.exceptions import InvalidScenarioDataError
+from AoE2ScenarioParser.sections.dependencies.dependency_action import DependencyAction
+from AoE2ScenarioParser.sections.retrievers.datatype import datatype_to_type_length
+
+_END_OF_FILE_MARK = "__END_OF_FILE_MARK__"
+
+
+class ScannedRetriever(NamedTuple):
+    """The location of a retriever directly within a section found by the ``StructureScanner``"""
+    start: int
+    end: int
+    repeat: int
+
+
+class ScannedSection(NamedTuple):
+    """
+    The location of a section or struct (and optionally the retrievers and structs directly within it) found by the
+    ``StructureScanner``
+    """
+    name: str
+    start: int
+    end: int
+    retrievers: Dict[str, ScannedRetriever]
+    """The location and repeat of every retriever. Only when requested"""
+    structs: Dict[str, List[Tuple[int, int]]]
+    """The (start, end) offsets of every struct per (struct) retriever. Only when requested"""
+    trailing_bytes: int
+    """The amount of bytes found from the end of file mark onwards. Only non-zero for the last section"""
+
+
+class StructureScanner:
+    def __init__(self, structure: Dict[str, dict], check_strings: bool = True):
+        """
+        Walks through the bytes of a scenario following its structure without creating any sections, structs or
+        objects. Only the values other retrievers depend on (like the amount of triggers) are decoded. Structs that
+        always have the same length are skipped entirely.
+
+        Used to find where sections (and the structs within them) start and end, and to validate scenario files.
+
+        Args:
+            structure: The structure of the scenario version (like: ``scenario.structure``)
+            check_strings: If strings should be checked to be decodable
+        """
+        self.structure = structure
+        self.check_strings = check_strings
+        self._plans: Dict[int, _StructPlan] = {}
+
+    def scan_section(self, name: str, data: bytes, offset: int = 0, ranges: bool = False) -> ScannedSection:
+        """
+        Find the end of a section in the given data.
+
+        Args:
+            name: The name of the section
+            data: The bytes containing the section
+            offset: The offset of the first byte of the section in the data
+            ranges: If the location of every retriever and struct directly within the section should be included
+
+        Returns:
+            The location of the section
+
+        Raises:
+            InvalidScenarioDataError: When the data doesn't match the structure of the section
+        """
+        return self.scan_struct(name, self.structure[name], data, offset, ranges)
+
+    def scan_struct(
+            self, name: str, structure: dict, data: bytes, offset: int = 0, ranges: bool = False
+    ) -> ScannedSection:
+        """
+        Find the end of a single struct in the given data. Works the same as ``scan_section`` for (nested) structs.
+
+        Args:
+            name: The name of the struct
+            structure: The structure of the struct (like: ``structure['Triggers']['structs']['TriggerStruct']``)
+            data: The bytes containing the struct
+            offset: The offset of the first byte of the struct in the data
+            ranges: If the location of every retriever and struct directly within the struct should be included
+
+        Returns:
+            The location of the struct
+
+        Raises:
+            InvalidScenarioDataError: When the data doesn't match the structure of the struct
+        """
+        plan = self._get_plan(structure)
+        retrievers, structs = ({}, {}) if ranges else (None, None)
+        end, trailing_bytes = self._scan_struct(plan, memoryview(data), offset, retrievers, structs)
+        return ScannedSection(name, offset, end, retrievers or {}, structs or {}, trailing_bytes)
+
+    def _get_plan(self, struct_structure: dict) -> _StructPlan:
+        """Get the (cached) plan for walking through a section or struct"""
+        plan = self._plans.get(id(struct_structure))
+        if plan is None:
+            plan = self._plans[id(struct_structure)] = _StructPlan(struct_structure)
+            plan.fixed_length = self._get_fixed_length(plan)
+        return plan
+
+    def _get_fixed_length(self, plan: _StructPlan) -> Optional[int]:
+        """The length of a struct when every instance has the same length, None otherwise"""
+        length = 0
+        for retriever in plan.retrievers:
+            if retriever.dependencies or retriever.var_type == "str" or retriever.name == _END_OF_FILE_MARK:
+                return None
+            if retriever.var_type == "struct":
+                try:
+                    struct_plan = self._get_plan(plan.get_struct_structure(retriever))
+                except InvalidScenarioDataError:
+                    return None  # Reported with the correct offset when the struct is scanned
+                if struct_plan.fixed_length is None:
+                    return None
+                length += struct_plan.fixed_length * retriever.repeat
+            else:
+                length += retriever.var_len * retriever.repeat
+        return length
+
+    def _scan_struct(
+            self,
+            plan: _StructPlan,
+            data: memoryview,
+            offset: int,
+            retriever_ranges: Optional[Dict[str, ScannedRetriever]],
+            struct_ranges: Optional[Dict[str, List[Tuple[int, int]]]]
+    ) -> Tuple[int, int]:
+        """
+        Walk through a single section or struct.
+
+        Returns:
+            The offset of the end of the struct and the amount of bytes found from the end of file mark onwards
+        """
+        values: Dict[str, Any] = {}
+        repeats: Dict[str, int] = {}
+        trailing_bytes = 0
+
+        for retriever in plan.retrievers:
+            repeat = repeats.get(retriever.name, retriever.repeat)
+            if retriever.on_construct is not None:
+                repeat = self._handle_construct(plan, retriever, repeat, values, repeats, offset)
+
+            if not isinstance(repeat, int):
+                raise InvalidScenarioDataError(f"Invalid repeat value: {repeat!r}", offset, retriever.name)
+            # Negative repeats (like -1 for empty lists) are read as no values at all
+            repeat = max(0, repeat)
+            start = offset
+
+            if retriever.name == _END_OF_FILE_MARK:
+                trailing_bytes = len(data) - offset
+                offset = len(data)
+            elif retriever.var_type == "struct":
+                offset = self._scan_structs(plan, retriever, repeat, data, offset, struct_ranges)
+                if retriever.name in plan.targets:
+                    values[retriever.name] = _present(retriever, [None] * repeat)
+            elif retriever.var_type == "str":
+                target_values = values if retriever.name in plan.targets else None
+                offset = self._scan_strings(retriever, repeat, data, offset, target_values)
+            else:
+                length = retriever.var_len * repeat
+                if offset + length > len(data):
+                    raise _not_available_error(data, offset, length, retriever.name)
+                if retriever.name in plan.targets:
+                    decoded = _decode(retriever, data[offset:offset + length], repeat)
+                    values[retriever.name] = _present(retriever, decoded)
+                offset += length
+
+            if retriever_ranges is not None:
+                retriever_ranges[retriever.name] = ScannedRetriever(start, offset, repeat)
+
+        return offset, trailing_bytes
+
+    def _scan_structs(
+            self,
+            plan: _StructPlan,
+            retriever: _RetrieverPlan,
+            repeat: int,
+            data: memoryview,
+            offset: int,
+            struct_ranges: Optional[Dict[str, List[Tuple[int, int]]]]
+    ) -> int:
+        """Walk through the structs of a struct retriever. Returns the offset of the end of the last struct"""
+        struct_plan = self._get_plan(plan.get_struct_structure(retriever, offset))
+
+        if struct_plan.fixed_length is not None:
+            length = struct_plan.fixed_length
+            if offset + length * repeat > len(data):
+                raise _not_available_error(data, offset, length * repeat, retriever.name)
+            if struct_ranges is not None:
+                struct_ranges[retriever.name] = [
+                    (offset + i * length, offset + (i + 1) * length) for i in range(repeat)
+                ]
+            return offset + length * repeat
+
+        ranges = []
+        for index in range(repeat):
+            start = offset
+            try:
+                offset, _ = self._scan_struct(struct_plan, data, offset, None, None)
+            except InvalidScenarioDataError as e:
+                e.path = f"{retriever.name}[{index}]" + (f".{e.path}" if e.path else "")
+                raise
+            ranges.append((start, offset))
+
+        if struct_ranges is not None:
+            struct_ranges[retriever.name] = ranges
+        return offset
+
+    def _scan_strings(
+            self,
+            retriever: _RetrieverPlan,
+            repeat: int,
+            data: memoryview,
+            offset: int,
+            values: Optional[Dict[str, Any]]
+    ) -> int:
+        """Walk through the strings of a retriever. Returns the offset of the end of the last string"""
+        strings = []
+        for _ in range(repeat):
+            if offset + retriever.var_len > len(data):
+                raise _not_available_error(data, offset, retriever.var_len, retriever.name)
+            string_length = int.from_bytes(data[offset:offset + retriever.var_len], 'little', signed=True)
+            offset += retriever.var_len
+
+            # Negative lengths are read as empty strings
+            string_length = max(0, string_length)
+            if offset + string_length > len(data):
+                raise _not_available_error(data, offset, string_length, retriever.name)
+            if self.check_strings or values is not None:
+                string = bytes_to_str(bytes(data[offset:offset + string_length]))
+                if type(string) is not str:
+                    raise InvalidScenarioDataError("String could not be decoded", offset, retriever.name)
+                strings.append(string)
+            offset += string_length
+
+        if values is not None:
+            values[retriever.name] = _present(retriever, strings)
+        return offset
+
+    def _handle_construct(
+            self,
+            plan: _StructPlan,
+            retriever: _RetrieverPlan,
+            repeat: int,
+            values: Dict[str, Any],
+            repeats: Dict[str, int],
+            offset: int
+    ) -> int:
+        """
+        Handle the construct dependency of a retriever the same way ``handle_retriever_dependency`` does when parsing.
+        Only the repeat values are affected, values set by dependencies are overwritten when the retriever is read.
+
+        Returns:
+            The repeat value of the retriever
+        """
+        dependency = retriever.on_construct
+        action = dependency.dependency_action
+
+        if action == DependencyAction.SET_REPEAT:
+            return self._evaluate(dependency, values, retriever, offset)
+        elif action == DependencyAction.REFRESH_SELF:
+            return self._handle_refresh(retriever, repeat, values, offset)
+        elif action == DependencyAction.REFRESH:
+            for _, target_name in dependency.dependency_target.targets:
+                target = plan.retriever_map[target_name]
+                target_repeat = repeats.get(target_name, target.repeat)
+                repeats[target_name] = self._handle_refresh(target, target_repeat, values, offset)
+        return repeat
+
+    def _handle_refresh(self, retriever: _RetrieverPlan, repeat: int, values: Dict[str, Any], offset: int) -> int:
+        """Handle the refresh dependency of a retriever. Returns the (new) repeat value of the retriever"""
+        dependency = retriever.on_refresh
+        if dependency is not None and dependency.dependency_action == DependencyAction.SET_REPEAT:
+            return self._evaluate(dependency, values, retriever, offset)
+        return repeat
+
+    @staticmethod
+    def _evaluate(dependency, values: Dict[str, Any], retriever: _RetrieverPlan, offset: int) -> Any:
+        """Evaluate the eval code of a dependency with the values decoded so far"""
+        eval_locals = {target_name: values.get(target_name) for _, target_name in dependency.dependency_target.targets}
+        eval_locals['math'] = math
+        try:
+            return eval(dependency.dependency_eval.eval_code, {}, eval_locals)
+        except Exception as e:
+            raise InvalidScenarioDataError(
+                f"Unable to evaluate dependency: [{e.__class__.__name__}] {e}", offset, retriever.name
+            ) from None
+
+
+class _RetrieverPlan:
+    __slots__ = ['name', 'var_type', 'var_len', 'repeat', 'is_list', 'dependencies', 'on_construct', 'on_refresh']
+
+    def __init__(self, name: str, structure: dict):
+        """The information of a single retriever from the structure that's needed to walk through its bytes"""
+        from AoE2ScenarioParser.sections.dependencies.retriever_dependency import RetrieverDependency
+
+        self.name = name
+        self.var_type, self.var_len = datatype_to_type_length(structure.get('type'))
+        self.repeat: int = structure.get('repeat', 1)
+        self.is_list: Optional[bool] = structure.get('is_list', None)
+        self.dependencies: dict = structure.get('dependencies', {})
+
+        self.on_construct = self.on_refresh = None
+        for dependency_name, properties in self.dependencies.items():
+            for dependency_structure in (properties if type(properties) is list else [properties]):
+                if dependency_structure.get('action') == 'SET_REPEAT' and self.is_list is None:
+                    self.is_list = True
+            if type(properties) is not list and dependency_name in ('on_construct', 'on_refresh'):
+                setattr(self, dependency_name, RetrieverDependency.from_structure(properties))
+
+
+class _StructPlan:
+    def __init__(self, structure: dict):
+        """The retrievers of a section or struct and the names of the retrievers other retrievers depend on"""
+        self.structure = structure
+        self.retrievers = [_RetrieverPlan(name, attr) for name, attr in structure.get('retrievers').items()]
+        self.retriever_map = {retriever.name: retriever for retriever in self.retrievers}
+        self.fixed_length: Optional[int] = None
+
+        self.targets = set()
+        for retriever in self.retrievers:
+            for dependency in (retriever.on_construct, retriever.on_refresh):
+                if dependency is not None and dependency.dependency_target is not None:
+                    self.targets.update(name for section, name in dependency.dependency_target.targets)
+
+    def get_struct_structure(self, retriever: _RetrieverPlan, offset: int = -1) -> dict:
+        """Get the structure of the struct used by the given retriever"""
+        struct_name = self.structure['retrievers'][retriever.name]['type'][7:]
+        try:
+            return self.structure['structs'][struct_name]
+        except KeyError:
+            raise InvalidScenarioDataError(
+                f"Model '{struct_name}' not found. Likely not defined in structure.", offset, retriever.name
+            ) from None
+
+
+def _not_available_error(data: memoryview, offset: int, length: int, name: str) -> InvalidScenarioDataError:
+    """The error for when less than ``length`` bytes are available from the offset onwards"""
+    return InvalidScenarioDataError(
+        f"Expected {length} byte(s), but only {max(0, len(data) - offset)} byte(s) are left", offset, name
+    )
+
+
+def _decode(retriever: _RetrieverPlan, data: memoryview, repeat: int) -> List[Any]:
+    """Decode the (fixed length) values of a retriever"""
+    var_type, var_len = retriever.var_type, retriever.var_len
+    chunks = [bytes(data[i * var_len:(i + 1) * var_len]) for i in range(repeat)]
+
+    if var_type == "u" or var_type == "s":
+        return [int.from_bytes(chunk, 'little', signed=var_type == "s") for chunk in chunks]
+    elif var_type == "f":
+        return [struct.unpack('f' if var_len == 4 else 'd', chunk)[0] for chunk in chunks]
+    return chunks
+
+
+def _present(retriever: _RetrieverPlan, values: List[Any]) -> Any:
+    """Present decoded values the same way a retriever does (see: ``bytes_parser.vorl``)"""
+    if len(values) != 1:
+        return values
+    if retriever.is_list is not None:
+        return values if retriever.is_list else values[0]
+    return values[0]
@@ -6,6 +6,8 @@ PRINT_STATUS_UPDATES = True
 """If status updates of what is being read and written should be printed to console or not."""
 DISABLE_ERROR_ON_OVERWRITING_SOURCE = False
 """Disable the error being raised when overwriting source scenario."""
+COMPRESSION_THREADS = None
+"""The amount of threads used to compress a scenario when writing it. Uses the amount of CPU cores when None."""
 
 # Warning related settings
 DISABLE_WARNINGS = False
@@ -0,0 +1,298 @@
+"""
+Benchmark suite for AoE2ScenarioParser.
+
+All cases run against synthetic scenarios (see ``benchmarks/synthetic.py``), so the suite runs offline and does not
+need any scenario files. Run it from the root of the repository:
+
+    python -m benchmarks.run --triggers 200 --effects 10 --units 5000 --map-size 144
+
+To compare two branches, save the results of one and compare the other against it:
+
+    git checkout main && python -m benchmarks.run --output main.json
+    git checkout feature && python -m benchmarks.run --compare main.json
+
+Every case is timed ``--repeat`` times (reporting the best and mean time). The peak memory is measured in a separate
+run using ``tracemalloc`` so tracing does not influence the timings.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from AoE2ScenarioParser import settings
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.objects.aoe2_object_manager import AoE2ObjectManager
+from AoE2ScenarioParser.objects.support.area import Area
+from AoE2ScenarioParser.scenarios.aoe2_de_scenario import AoE2DEScenario
+from benchmarks.synthetic import DEFAULT_SCENARIO_VERSION, build_scenario
+
+
+class BenchmarkContext:
+    def __init__(self, args: argparse.Namespace, directory: str):
+        self.args = args
+        self.directory = Path(directory)
+        self.source_file = self.directory / "synthetic.aoe2scenario"
+        self.output_file = self.directory / "synthetic_written.aoe2scenario"
+        self._scenarios: List[AoE2DEScenario] = []
+
+    @property
+    def object_count(self) -> int:
+        """The amount of objects the managers handle (triggers, conditions, effects, units and terrain tiles)"""
+        a = self.args
+        return a.triggers * (a.effects + 1) + a.units + a.map_size * a.map_size
+
+    def build(self) -> AoE2DEScenario:
+        a = self.args
+        return self.track(build_scenario(
+            scenario_version=a.scenario_version,
+            triggers=a.triggers,
+            effects=a.effects,
+            units=a.units,
+            map_size=a.map_size,
+            tree_size=a.tree_size,
+        ))
+
+    def read(self) -> AoE2DEScenario:
+        return self.track(AoE2DEScenario.from_file(str(self.source_file)))
+
+    def track(self, scenario: AoE2DEScenario) -> AoE2DEScenario:
+        self._scenarios.append(scenario)
+        return scenario
+
+    def release(self) -> None:
+        """Close all scenarios created during a case so they don't accumulate over the cases"""
+        for scenario in self._scenarios:
+            scenario.close()
+        self._scenarios.clear()
+
+
+class BenchmarkCase(NamedTuple):
+    name: str
+    unit: str
+    prepare: Callable[[BenchmarkContext], Callable[[], float]]
+    """Prepares the (untimed) state for a single run and returns the timed function. That returns the work done."""
+
+
+def _case_generate(ctx: BenchmarkContext):
+    def run():
+        ctx.build()
+        return ctx.object_count
+    return run
+
+
+def _case_from_file(ctx: BenchmarkContext):
+    def run():
+        ctx.read()
+        return ctx.source_file.stat().st_size
+    return run
+
+
+def _case_manager_setup(ctx: BenchmarkContext):
+    scenario = ctx.read()
+
+    def run():
+        AoE2ObjectManager(scenario.uuid).setup()
+        return ctx.object_count
+    return run
+
+
+def _case_reconstruct(ctx: BenchmarkContext):
+    scenario = ctx.read()
+
+    def run():
+        scenario._object_manager.reconstruct()
+        return ctx.object_count
+    return run
+
+
+def _case_write_to_file(ctx: BenchmarkContext):
+    scenario = ctx.read()
+
+    def run():
+        scenario.write_to_file(str(ctx.output_file))
+        return ctx.output_file.stat().st_size
+    return run
+
+
+def _case_fork(ctx: BenchmarkContext):
+    scenario = ctx.read()
+
+    def run():
+        ctx.track(scenario.fork())
+        return ctx.object_count
+    return run
+
+
+def _case_copy_trigger_tree_per_player(ctx: BenchmarkContext):
+    trigger_manager = ctx.read().trigger_manager
+
+    def run():
+        copies = trigger_manager.copy_trigger_tree_per_player(PlayerId.ONE, 0)
+        return sum(len(triggers) for player, triggers in copies.items() if player != PlayerId.ONE)
+    return run
+
+
+def _case_get_units_in_area(ctx: BenchmarkContext):
+    unit_manager = ctx.read().unit_manager
+    half = ctx.args.map_size / 2
+
+    def run():
+        for _ in range(10):
+            unit_manager.get_units_in_area(x1=0, y1=0, x2=half, y2=half)
+        return ctx.args.units * 10
+    return run
+
+
+def _case_area_to_chunks(ctx: BenchmarkContext):
+    scenario = ctx.read()
+
+    def run():
+        Area(uuid=scenario.uuid).select_entire_map().use_pattern_grid(block_size=3, gap_size=1).to_chunks()
+        return ctx.args.map_size * ctx.args.map_size
+    return run
+
+
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase("generate", "objects", _case_generate),
+    BenchmarkCase("from_file", "bytes", _case_from_file),
+    BenchmarkCase("manager_setup", "objects", _case_manager_setup),
+    BenchmarkCase("reconstruct", "objects", _case_reconstruct),
+    BenchmarkCase("write_to_file", "bytes", _case_write_to_file),
+    BenchmarkCase("fork", "objects", _case_fork),
+    BenchmarkCase("copy_trigger_tree_per_player", "triggers", _case_copy_trigger_tree_per_player),
+    BenchmarkCase("get_units_in_area", "units", _case_get_units_in_area),
+    BenchmarkCase("area_to_chunks", "tiles", _case_area_to_chunks),
+]
+
+
+def run_case(ctx: BenchmarkContext, case: BenchmarkCase, repeat: int) -> Dict:
+    times = []
+    work = 0
+    for _ in range(repeat):
+        run = case.prepare(ctx)
+        start = time.perf_counter()
+        work = run()
+        times.append(time.perf_counter() - start)
+        ctx.release()
+
+    run = case.prepare(ctx)
+    tracemalloc.start()
+    try:
+        run()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        ctx.release()
+
+    best = min(times)
+    return {
+        'name': case.name,
+        'best': best,
+        'mean': sum(times) / len(times),
+        'work': work,
+        'unit': case.unit,
+        'throughput': work / best if best else float('inf'),
+        'peak_memory': peak_memory,
+    }
+
+
+def _format_amount(value: float, unit: str) -> str:
+    if unit == "bytes":
+        for suffix in ["B", "KiB", "MiB", "GiB"]:
+            if value < 1024:
+                return f"{value:.1f} {suffix}"
+            value /= 1024
+        return f"{value:.1f} TiB"
+    for suffix in ["", "k", "M", "G"]:
+        if value < 1000:
+            return f"{value:.1f}{suffix} {unit}"
+        value /= 1000
+    return f"{value:.1f}T {unit}"
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: List[Dict], baseline: Dict[str, Dict] = None) -> None:
+    header = f"{'case':<30} {'best':>10} {'mean':>10} {'throughput':>18} {'peak memory':>12}"
+    if baseline:
+        header += f" {'vs baseline':>12}"
+    print(header)
+    print("-" * len(header))
+
+    for result in results:
+        line = f"{result['name']:<30} {result['best'] * 1000:>8.1f}ms {result['mean'] * 1000:>8.1f}ms " \
+               f"{_format_amount(result['throughput'], result['unit']) + '/s':>18} " \
+               f"{_format_amount(result['peak_memory'], 'bytes'):>12}"
+        if baseline:
+            base = baseline.get(result['name'])
+            line += f" {base['best'] / result['best']:>11.2f}x" if base else f" {'-':>12}"
+        print(line)
+
+
+def _parse_arguments(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark AoE2ScenarioParser using synthetic scenarios.")
+    parser.add_argument("--scenario-version", default=DEFAULT_SCENARIO_VERSION, help="The DE scenario version")
+    parser.add_argument("-n", "--triggers", type=int, default=200, help="Amount of triggers (N)")
+    parser.add_argument("-m", "--effects", type=int, default=10, help="Amount of effects per trigger (M)")
+    parser.add_argument("-k", "--units", type=int, default=5000, help="Amount of units (K)")
+    parser.add_argument("-s", "--map-size", type=int, default=144, help="Size of the map (S)")
+    parser.add_argument("--tree-size", type=int, default=5, help="Amount of triggers per activation chain")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Amount of timed runs per case")
+    parser.add_argument("--cases", nargs="+", choices=[case.name for case in CASES], help="Only run these cases")
+    parser.add_argument("-o", "--output", help="Write the results as JSON to this file")
+    parser.add_argument("-c", "--compare", help="Compare against the JSON results of an earlier run")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> Dict:
+    args = _parse_arguments(argv)
+    settings.PRINT_STATUS_UPDATES = False
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {result['name']: result for result in json.load(f)['results']}
+
+    cases = [case for case in CASES if args.cases is None or case.name in args.cases]
+    with tempfile.TemporaryDirectory() as directory:
+        ctx = BenchmarkContext(args, directory)
+        ctx.build().write_to_file(str(ctx.source_file))
+        ctx.release()
+
+        print(f"Scenario: DE {args.scenario_version} | triggers: {args.triggers} x {args.effects} effects | "
+              f"units: {args.units} | map size: {args.map_size} | "
+              f"file size: {_format_amount(ctx.source_file.stat().st_size, 'bytes')}\n")
+
+        results = [run_case(ctx, case, args.repeat) for case in cases]
+
+    print_results(results, baseline)
+
+    report = {
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'parameters': {key: value for key, value in vars(args).items() if key not in ['output', 'compare']},
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=4)
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Generation of synthetic DE scenarios for the benchmark suite.
+
+Scenarios are built in memory using ``AoE2DEScenario.from_default``, so no scenario file needs to be read (or shipped)
+to run the benchmarks.
+"""
+from __future__ import annotations
+
+import random
+
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.scenarios.aoe2_de_scenario import AoE2DEScenario
+
+DEFAULT_SCENARIO_VERSION = "1.45"
+
+
+def build_scenario(
+        scenario_version: str = DEFAULT_SCENARIO_VERSION,
+        triggers: int = 100,
+        effects: int = 10,
+        units: int = 1000,
+        map_size: int = 144,
+        tree_size: int = 5,
+        seed: int = 0,
+) -> AoE2DEScenario:
+    """
+    Build a synthetic scenario with the given amount of content.
+
+    Triggers are linked into activation chains (trees) of ``tree_size`` triggers so trigger tree operations have
+    something to follow. The first effect of every trigger (except the last one in a chain) activates the next trigger.
+
+    Args:
+        scenario_version: The DE scenario version to build the scenario with
+        triggers: The amount of triggers (N)
+        effects: The amount of effects per trigger (M)
+        units: The amount of units (K), spread over all players
+        map_size: The size of the map (S)
+        tree_size: The amount of triggers in a single activation chain
+        seed: The seed used for placing units and effect locations
+
+    Returns:
+        The generated scenario
+    """
+    rng = random.Random(seed)
+    scenario = AoE2DEScenario.from_default(scenario_version, map_size=map_size)
+
+    unit_manager = scenario.unit_manager
+    players = PlayerId.all()
+    for i in range(units):
+        unit_manager.add_unit(
+            player=players[i % len(players)],
+            unit_const=4,
+            x=rng.uniform(0, map_size),
+            y=rng.uniform(0, map_size),
+        )
+
+    trigger_manager = scenario.trigger_manager
+    for i in range(triggers):
+        trigger = trigger_manager.add_trigger(f"Trigger {i}")
+        trigger.new_condition.timer(timer=i % 60 + 1)
+
+        remaining = effects
+        if remaining and (i + 1) % tree_size and i + 1 < triggers:
+            trigger.new_effect.activate_trigger(trigger_id=i + 1)
+            remaining -= 1
+
+        for j in range(remaining):
+            if j % 2:
+                trigger.new_effect.send_chat(source_player=PlayerId.ONE, message=f"Message {i}.{j}")
+            else:
+                trigger.new_effect.create_object(
+                    object_list_unit_id=4,
+                    source_player=PlayerId.ONE,
+                    location_x=rng.randrange(map_size),
+                    location_y=rng.randrange(map_size),
+                )
+
+    return scenario
@@ -0,0 +1,71 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from AoE2ScenarioParser import settings
+from AoE2ScenarioParser.scenarios.aoe2_de_scenario import AoE2DEScenario
+
+
+def default_scenario(map_size: int = 20) -> AoE2DEScenario:
+    """Create a new (empty) 1.45 scenario with a small map to keep the tests fast"""
+    return AoE2DEScenario.from_default("1.45", map_size=map_size)
+
+
+class SilentStatusUpdatesMixin:
+    """Disables the status updates while the tests of the class run. Can be combined with any ``TestCase`` class"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._print_status_updates = settings.PRINT_STATUS_UPDATES
+        settings.PRINT_STATUS_UPDATES = False
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        settings.PRINT_STATUS_UPDATES = cls._print_status_updates
+
+
+class ScenarioFileMixin(SilentStatusUpdatesMixin):
+    """
+    Writes a scenario to ``cls.filename`` in a temporary directory (``cls.directory``) once for all tests of the class.
+    Override ``build_source_scenario`` to add content to the scenario before it's written.
+    """
+    directory: tempfile.TemporaryDirectory
+    filename: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.filename = cls._path('source.aoe2scenario')
+
+        scenario = default_scenario()
+        cls.build_source_scenario(scenario)
+        scenario.write_to_file(cls.filename)
+        scenario.close()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        cls.directory.cleanup()
+
+    @classmethod
+    def build_source_scenario(cls, scenario: AoE2DEScenario) -> None:
+        pass
+
+    @classmethod
+    def _path(cls, name: str) -> str:
+        return os.path.join(cls.directory.name, name)
+
+
+class ScenarioTestCase(SilentStatusUpdatesMixin, TestCase):
+    """Creates a new scenario (``self.scenario``) with a map of ``map_size`` for every test and closes it afterwards"""
+    map_size: int = 20
+    scenario: AoE2DEScenario
+
+    def setUp(self) -> None:
+        self.scenario = default_scenario(self.map_size)
+
+    def tearDown(self) -> None:
+        self.scenario.close()
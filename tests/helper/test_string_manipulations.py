@@ -0,0 +1,16 @@
+from unittest import TestCase
+
+from AoE2ScenarioParser.helper.string_manipulations import create_textual_hex, create_textual_hex_lines
+
+
+class Test(TestCase):
+    def test_create_textual_hex_lines(self):
+        self.assertListEqual(create_textual_hex_lines(b''), [''])
+        self.assertListEqual(create_textual_hex_lines(b'\x01\x02\x03', bytes_per_line=2), ['01 02 ', '03'])
+
+        for length in range(0, 20):
+            data = bytes(range(length))
+            self.assertListEqual(
+                create_textual_hex_lines(data, bytes_per_line=8),
+                create_textual_hex(data.hex(), space_distance=2, enter_distance=24).split("\n")
+            )
@@ -0,0 +1,61 @@
+from AoE2ScenarioParser.datasets.terrains import TerrainId
+
+from tests import ScenarioTestCase
+
+
+class Test(ScenarioTestCase):
+    map_size = 10
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mm = self.scenario.map_manager
+
+    def test_paint_area(self):
+        area = self.scenario.new.area().select(2, 3, 4, 5)
+
+        count = self.mm.paint(area, terrain_id=TerrainId.ICE, elevation=3)
+
+        self.assertEqual(9, count)
+        for tile in self.mm.terrain:
+            selected = area.is_within_selection(tile.x, tile.y)
+            self.assertEqual(TerrainId.ICE if selected else TerrainId.GRASS_1, tile.terrain_id)
+            self.assertEqual(3 if selected else 0, tile.elevation)
+            self.assertEqual(-1, tile.layer)
+
+    def test_paint_selection_and_mask(self):
+        area = self.scenario.new.area().select(0, 0, 9, 1)
+        self.mm.paint(area - self.scenario.new.area().select(0, 0, 4, 4), layer=TerrainId.DESERT_SAND)
+        self.assertListEqual([-1] * 5 + [TerrainId.DESERT_SAND] * 5, [t.layer for t in self.mm.terrain[0:10]])
+
+        mask = bytearray(100)
+        mask[99] = 1
+        self.assertEqual(1, self.mm.paint(mask, elevation=7))
+        self.assertEqual(7, self.mm.terrain[99].elevation)
+
+        with self.assertRaises(ValueError):
+            self.mm.paint(bytearray(10), elevation=1)
+
+    def test_apply(self):
+        self.mm.apply(lambda tile: setattr(tile, 'elevation', tile.x))
+        self.assertListEqual(list(range(10)) * 10, [t.elevation for t in self.mm.terrain])
+
+        area = self.scenario.new.area().select(0, 0, 9, 0)
+        self.mm.apply(lambda tile: setattr(tile, 'elevation', 0), area)
+        self.assertListEqual([0] * 10 + list(range(10)) * 9, [t.elevation for t in self.mm.terrain])
+
+    def test_commit_only_changed_tiles(self):
+        self.mm.paint(self.scenario.new.area().select(0, 0, 1, 0), terrain_id=TerrainId.ICE)
+        fork = self.scenario.fork()
+        structs = self.scenario.sections['Map'].terrain_data
+        fork_structs = fork.sections['Map'].terrain_data
+
+        fork.map_manager.paint(fork.new.area().select(0, 0, 0, 0), terrain_id=TerrainId.SNOW)
+        fork.map_manager.commit()
+
+        self.assertIsNot(structs[0], fork_structs[0])
+        self.assertEqual(TerrainId.SNOW, fork_structs[0].terrain_id)
+        self.assertEqual(TerrainId.ICE, structs[0].terrain_id)
+        # Unchanged tiles are still shared between both scenarios
+        self.assertIs(structs[1], fork_structs[1])
+        self.assertEqual(TerrainId.ICE, fork_structs[1].terrain_id)
+        fork.close()
@@ -0,0 +1,155 @@
+from unittest import TestCase
+
+from AoE2ScenarioParser.datasets.effects import EffectId
+from AoE2ScenarioParser.objects.managers.de.trigger_manager_de import TriggerManagerDE
+from AoE2ScenarioParser.objects.support.trigger_graph import TriggerGraph
+from AoE2ScenarioParser.scenarios.aoe2_scenario import initialise_version_dependencies
+
+from tests import ScenarioTestCase, default_scenario
+
+initialise_version_dependencies("DE", 1.43)
+
+
+class Test(TestCase):
+    tm: TriggerManagerDE
+
+    def setUp(self) -> None:
+        self.tm = TriggerManagerDE([], [], [])
+
+        # 0 -> 1 -> 2 -> 1, 2 -> 3, 4 -> 4, 5
+        triggers = [self.tm.add_trigger(f"Trigger{i}") for i in range(6)]
+        triggers[0].new_effect.activate_trigger(1)
+        triggers[1].new_effect.activate_trigger(2)
+        triggers[2].new_effect.deactivate_trigger(1)
+        triggers[2].new_effect.activate_trigger(3)
+        triggers[2].new_effect.activate_trigger(3)
+        triggers[4].new_effect.deactivate_trigger(4)
+        triggers[5].new_effect.activate_trigger(-1)
+
+    def test_edges(self):
+        graph = self.tm.get_activation_graph()
+
+        self.assertListEqual(graph.successors(2), [1, 3])
+        self.assertListEqual(graph.predecessors(1), [0, 2])
+        self.assertListEqual(graph.successors(5), [])
+        self.assertEqual(len(graph.incoming_effects(3)), 2)
+
+    def test_reachable(self):
+        graph = self.tm.get_activation_graph()
+
+        self.assertListEqual(graph.reachable(0), [0, 1, 2, 3])
+        self.assertListEqual(graph.reachable([2, 4]), [2, 4, 1, 3])
+        self.assertListEqual(graph.reachable(5), [5])
+
+    def test_strongly_connected_components(self):
+        components = self.tm.get_activation_graph().strongly_connected_components()
+
+        self.assertEqual(len(components), 5)
+        self.assertIn([1, 2], components)
+        self.assertLess(components.index([0]), components.index([1, 2]))
+        self.assertLess(components.index([1, 2]), components.index([3]))
+
+    def test_topological_order(self):
+        self.assertRaises(ValueError, self.tm.get_activation_graph().topological_order)
+
+        self.tm.triggers[2].remove_effect(effect_index=0)
+        order = self.tm.get_activation_graph().topological_order()
+
+        self.assertListEqual(sorted(order), list(range(6)))
+        self.assertLess(order.index(0), order.index(1))
+        self.assertLess(order.index(1), order.index(2))
+        self.assertLess(order.index(2), order.index(3))
+
+    def test_long_trigger_chain(self):
+        self.tm = TriggerManagerDE([], [], [])
+        for i in range(1999):
+            self.tm.add_trigger(f"Trigger{i}").new_effect.activate_trigger(i + 1)
+        self.tm.add_trigger("Trigger1999")
+
+        self.assertEqual(len(self.tm.copy_trigger_tree(0)), 2000)
+        self.assertEqual(len(self.tm.get_activation_graph().strongly_connected_components()), 4000)
+
+
+class TestScenario(ScenarioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tm = self.scenario.trigger_manager
+
+        # 0 -> 1 -> 2
+        self.triggers = [self.tm.add_trigger(f"Trigger{i}") for i in range(3)]
+        self.effect = self.triggers[0].new_effect.activate_trigger(1)
+        self.triggers[1].new_effect.activate_trigger(2)
+
+    def test_graph_is_kept_up_to_date(self):
+        graph = self.tm.get_activation_graph()
+        self.assertListEqual(graph.reachable(0), [0, 1, 2])
+
+        self.triggers[2].new_effect.deactivate_trigger(0)
+        self.tm.add_trigger("Trigger3")
+        self.assertIs(graph, self.tm.get_activation_graph())
+        self.assertListEqual(graph.successors(2), [0])
+        self.assertEqual(graph.trigger_count, 4)
+
+        self.effect.trigger_id = 3
+        self.assertListEqual(graph.successors(0), [3])
+        self.assertListEqual(graph.predecessors(1), [])
+
+        self.effect.effect_type = EffectId.CHANGE_VIEW
+        self.assertListEqual(graph.successors(0), [])
+        self.assertListEqual(graph.incoming_effects(3), [])
+
+        self.triggers[2].remove_effect(effect_index=0)
+        self.assertListEqual(graph.successors(2), [])
+
+    def test_graph_after_reorder(self):
+        graph = self.tm.get_activation_graph()
+
+        self.tm.reorder_triggers([2, 1, 0])
+        self.assertEqual(self.effect.trigger_id, 1)
+        self.assertListEqual(graph.successors(2), [1])
+        self.assertListEqual(graph.successors(1), [0])
+        self.assertListEqual(graph.reachable(2), [2, 1, 0])
+
+        self.tm.remove_trigger(0)
+        self.assertListEqual(graph.successors(1), [0])
+        fresh = TriggerGraph(self.tm.triggers)
+        for trigger_id in range(graph.trigger_count):
+            self.assertListEqual(graph.successors(trigger_id), fresh.successors(trigger_id))
+            self.assertListEqual(graph.predecessors(trigger_id), fresh.predecessors(trigger_id))
+
+    def test_graph_after_replacing_effects_and_triggers(self):
+        graph = self.tm.get_activation_graph()
+
+        effect = self.effect.copy()
+        effect.trigger_id = 2
+        self.triggers[0].effects[0] = effect
+        self.assertListEqual(graph.successors(0), [2])
+
+        self.tm.reorder_triggers([2, 0, 1])
+        self.assertEqual(effect.trigger_id, 0)
+        self.assertListEqual(graph.successors(1), [0])
+        self.assertListEqual(graph.reachable(1), [1, 0])
+
+        replacement = self.tm.triggers[0].copy()
+        replacement.new_effect.activate_trigger(2)
+        self.tm.triggers[0] = replacement
+        self.assertListEqual(graph.successors(0), [2])
+        self.assertListEqual(graph.predecessors(2), [0])
+        self.assertListEqual(graph.predecessors(0), [1, 2])
+
+    def test_import_triggers_resets_source_graph(self):
+        other = default_scenario()
+        try:
+            other_tm = other.trigger_manager
+            other_tm.add_trigger("Other")
+            source_graph = self.tm.get_activation_graph()
+            other_tm.import_triggers(self.tm.triggers[1:])
+
+            self.assertIsNot(source_graph, self.tm.get_activation_graph())
+            fresh = TriggerGraph(self.tm.triggers)
+            graph = self.tm.get_activation_graph()
+            for trigger_id in range(graph.trigger_count):
+                self.assertListEqual(graph.successors(trigger_id), fresh.successors(trigger_id))
+            self.assertListEqual(other_tm.get_activation_graph().successors(1), [2])
+        finally:
+            other.close()
@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+from AoE2ScenarioParser.objects.managers.de.trigger_manager_de import TriggerManagerDE
+from AoE2ScenarioParser.objects.support.trigger_select import TS
+from AoE2ScenarioParser.scenarios.aoe2_scenario import initialise_version_dependencies
+
+initialise_version_dependencies("DE", 1.43)
+
+
+class Test(TestCase):
+    tm: TriggerManagerDE
+
+    def setUp(self) -> None:
+        self.tm = TriggerManagerDE([], [], [])
+
+    def test_batch_move_triggers(self):
+        for i in range(10):
+            self.tm.add_trigger(f"Trigger{i}")
+
+        with self.tm.batch():
+            self.tm.move_triggers([3, 4, 5], 0)
+            self.tm.move_triggers([3, 9, 6], 5)  # IDs don't change within a batch
+
+            # Nothing is reordered until the batch ends
+            self.assertListEqual([t.trigger_id for t in self.tm.triggers], list(range(10)))
+            self.assertListEqual(self.tm.trigger_display_order, [4, 5, 0, 1, 3, 9, 6, 2, 7, 8])
+
+        self.assertListEqual(
+            [t.name for t in self.tm.triggers],
+            [f"Trigger{i}" for i in [4, 5, 0, 1, 3, 9, 6, 2, 7, 8]]
+        )
+        self.assertListEqual([t.trigger_id for t in self.tm.triggers], list(range(10)))
+        self.assertListEqual(self.tm.trigger_display_order, list(range(10)))
+
+    def test_batch_copy_trigger(self):
+        t0 = self.tm.add_trigger("Trigger0")
+        t1 = self.tm.add_trigger("Trigger1")
+        t2 = self.tm.add_trigger("Trigger2")
+        t0.new_effect.activate_trigger(2)
+        t2.new_effect.deactivate_trigger(0)
+
+        with self.tm.batch():
+            for _ in range(2):
+                self.tm.copy_trigger(TS.trigger(t0), add_suffix=False)
+            self.tm.copy_trigger(TS.trigger(t1))
+
+        self.assertListEqual(
+            [t.name for t in self.tm.triggers],
+            ["Trigger0", "Trigger0", "Trigger0", "Trigger1", "Trigger1 (copy)", "Trigger2"]
+        )
+        self.assertListEqual([t.trigger_id for t in self.tm.triggers], list(range(6)))
+        self.assertEqual(t0.effects[0].trigger_id, 5)
+        self.assertEqual(self.tm.triggers[1].effects[0].trigger_id, 5)
+        self.assertEqual(t2.effects[0].trigger_id, 0)
+
+    def test_batch_remove_trigger(self):
+        for i in range(4):
+            self.tm.add_trigger(f"Trigger{i}")
+
+        with self.tm.batch():
+            self.tm.move_triggers([3], 0)
+            self.tm.remove_trigger(TS.trigger(self.tm.triggers[1]))
+
+            self.assertListEqual([t.name for t in self.tm.triggers], ["Trigger3", "Trigger0", "Trigger2"])
+        self.assertListEqual([t.trigger_id for t in self.tm.triggers], list(range(3)))
+
+    def test_batch_nested(self):
+        for i in range(3):
+            self.tm.add_trigger(f"Trigger{i}")
+
+        with self.tm.batch():
+            with self.tm.batch():
+                self.tm.move_triggers([2], 0)
+            self.assertListEqual([t.name for t in self.tm.triggers], ["Trigger0", "Trigger1", "Trigger2"])
+        self.assertListEqual([t.name for t in self.tm.triggers], ["Trigger2", "Trigger0", "Trigger1"])
@@ -50,6 +50,18 @@ class Test(TestCase):
             ["Trigger1", "Trigger1 (copy)", "Trigger2", "Trigger3", "Trigger1 (copy)"]
         )
 
+    def test_copy_trigger_append_after_source_display_order(self):
+        for name in ["Trigger0", "Trigger1", "Trigger2", "Trigger3"]:
+            self.tm.add_trigger(name)
+        # The display order differs from the trigger order, like in scenarios read from a file
+        self.tm.trigger_display_order = [3, 2, 0, 1]
+
+        self.tm.copy_trigger(0, append_after_source=True)
+        self.assertListEqual(
+            [self.tm.triggers[i].name for i in self.tm.trigger_display_order],
+            ["Trigger3", "Trigger2", "Trigger0", "Trigger0 (copy)", "Trigger1"]
+        )
+
     def test_copy_trigger_ce(self):
         trigger = self.tm.add_trigger("50% Create object")
         trigger.new_condition.chance(50)
@@ -70,3 +82,28 @@ class Test(TestCase):
         self.assertEqual(te0.location_x, ce0.location_x)
         self.assertEqual(te0.location_y, ce0.location_y)
         self.assertEqual(te0.area_x2, ce0.area_x2)  # Random value
+
+    def test_copy_trigger_independent(self):
+        trigger = self.tm.add_trigger("Trigger")
+        trigger.new_condition.timer(10)
+        trigger.new_effect.change_view(PlayerId.ONE, 5, 6)
+        trigger.effects[0].selected_object_ids = [1, 2]
+
+        copy = self.tm.copy_trigger(0)
+
+        self.assertIsNot(copy.conditions[0], trigger.conditions[0])
+        self.assertIsNot(copy.effects[0], trigger.effects[0])
+
+        copy.effects[0].selected_object_ids.append(3)
+        copy.conditions[0].timer = 20
+        self.assertListEqual(trigger.effects[0].selected_object_ids, [1, 2])
+        self.assertEqual(trigger.conditions[0].timer, 10)
+
+        copy.new_effect.send_chat(PlayerId.ONE, "Hello")
+        copy.new_condition.timer(5)
+        self.assertEqual(len(copy.effects), 2)
+        self.assertEqual(len(copy.conditions), 2)
+        self.assertEqual(len(trigger.effects), 1)
+        self.assertEqual(len(trigger.conditions), 1)
+        self.assertListEqual(copy.effect_order, [0, 1])
+        self.assertListEqual(trigger.effect_order, [0])
@@ -0,0 +1,65 @@
+import copy
+from unittest import TestCase
+
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.objects.managers.de.trigger_manager_de import TriggerManagerDE
+from AoE2ScenarioParser.scenarios.aoe2_scenario import initialise_version_dependencies
+
+initialise_version_dependencies("DE", 1.43)
+
+
+class Test(TestCase):
+    tm: TriggerManagerDE
+
+    def setUp(self) -> None:
+        self.tm = TriggerManagerDE([], [], [])
+
+    def test_trigger_display_order(self):
+        for i in range(4):
+            self.tm.add_trigger(f"Trigger{i}")
+        self.assertListEqual(self.tm.trigger_display_order, [0, 1, 2, 3])
+
+        self.tm.trigger_display_order = [3, 2, 1, 0]
+        self.tm.triggers.pop()
+        self.assertListEqual(self.tm.trigger_display_order, [2, 1, 0])
+
+        self.tm.add_trigger("Trigger3")
+        self.assertListEqual(self.tm.trigger_display_order, [2, 1, 0, 3])
+
+    def test_effect_and_condition_order(self):
+        trigger = self.tm.add_trigger("Trigger")
+        for i in range(3):
+            trigger.new_effect.send_chat(PlayerId.ONE, f"Message {i}")
+            trigger.new_condition.timer(i)
+        trigger.effect_order = [2, 0, 1]
+
+        trigger.remove_effect(effect_index=2)
+        trigger.remove_condition(condition_index=2)
+        self.assertListEqual(trigger.effect_order, [0, 1])
+        self.assertListEqual(trigger.condition_order, [0, 1])
+
+        trigger.effects += [trigger.effects[0].copy()]
+        self.assertListEqual(trigger.effect_order, [0, 1, 2])
+
+    def test_order_of_copies(self):
+        trigger = self.tm.add_trigger("Trigger")
+        trigger.new_effect.send_chat(PlayerId.ONE, "Message")
+
+        for trigger_copy in [trigger.copy(), copy.deepcopy(trigger)]:
+            trigger_copy.new_effect.send_chat(PlayerId.ONE, "Message")
+            self.assertListEqual(trigger_copy.effect_order, [0, 1])
+        self.assertListEqual(trigger.effect_order, [0])
+
+    def test_order_of_manager_copy(self):
+        self.tm.add_trigger("Trigger0")
+        self.tm.add_trigger("Trigger1")
+        self.tm.trigger_display_order = [1, 0]
+
+        tm_copy = copy.deepcopy(self.tm)
+        tm_copy.add_trigger("Trigger2")
+        tm_copy.triggers[0].new_effect.send_chat(PlayerId.ONE, "Message")
+
+        self.assertListEqual(tm_copy.trigger_display_order, [1, 0, 2])
+        self.assertListEqual(tm_copy.triggers[0].effect_order, [0])
+        self.assertListEqual(self.tm.trigger_display_order, [1, 0])
+        self.assertEqual(2, len(self.tm.triggers))
@@ -31,3 +31,11 @@ class Test(TestCase):
 
         self.tm.remove_trigger(1)
         self.assertEqual(t0.effects[0].trigger_id, t2.trigger_id)
+
+    def test_remove_trigger_keeps_display_order(self):
+        for i in range(4):
+            self.tm.add_trigger(f"Trigger{i}")
+        self.tm.trigger_display_order = [3, 1, 0, 2]
+
+        self.tm.remove_trigger(1)
+        self.assertListEqual([t.name for t in self.tm.triggers], ["Trigger3", "Trigger0", "Trigger2"])
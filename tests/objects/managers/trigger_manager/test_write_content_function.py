@@ -0,0 +1,132 @@
+from io import StringIO
+from unittest import TestCase
+
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.helper import helper
+from AoE2ScenarioParser.objects.managers.de.trigger_manager_de import TriggerManagerDE
+from AoE2ScenarioParser.scenarios.aoe2_scenario import initialise_version_dependencies
+
+initialise_version_dependencies("DE", 1.43)
+
+
+class Test(TestCase):
+    tm: TriggerManagerDE
+
+    def setUp(self) -> None:
+        self.tm = TriggerManagerDE([], [], [])
+
+        trigger = self.tm.add_trigger("Trigger0", description="Multi\nline")
+        trigger.new_condition.timer(20)
+        trigger.new_effect.send_chat(source_player=PlayerId.ONE, message="Hello\nWorld")
+        self.tm.add_trigger("Trigger1")
+        self.tm.add_variable("Variable0")
+
+    def test_write_summary(self):
+        fp = StringIO()
+        self.tm.write_summary(fp)
+
+        self.assertEqual(
+            "\n"
+            "Trigger Summary:\n"
+            "\tTrigger0    [Index: 0, Display: 0] \t(conditions: 1,  effects: 1)\n"
+            "\tTrigger1    [Index: 1, Display: 1] \t(conditions: 0,  effects: 0)\n"
+            "\n"
+            "Variables Summary:\n"
+            "\tVariable0   [Index: 0]\n",
+            fp.getvalue()
+        )
+        self.assertEqual(fp.getvalue(), self.tm.get_summary_as_string())
+
+    def test_write_summary_empty(self):
+        tm = TriggerManagerDE([], [], [])
+        fp = StringIO()
+        tm.write_summary(fp)
+
+        self.assertEqual(
+            "\n"
+            "Trigger Summary:\n"
+            "\t<< No Triggers >>"
+            "\n"
+            "Variables Summary:\n"
+            "\t<< No Variables >>",
+            fp.getvalue()
+        )
+        self.assertEqual(_summary_as_string_before_streaming(tm), fp.getvalue())
+
+    def test_write_summary_same_as_before_streaming(self):
+        for tm in [self.tm, TriggerManagerDE([], [], [])]:
+            self.assertEqual(_summary_as_string_before_streaming(tm), tm.get_summary_as_string())
+            tm.add_trigger("Trigger")
+            self.assertEqual(_summary_as_string_before_streaming(tm), tm.get_summary_as_string())
+
+    def test_write_content(self):
+        fp = StringIO()
+        self.tm.write_content(fp)
+
+        self.assertEqual(
+            "\n"
+            "Triggers:\n"
+            "\t'Trigger0' [Index: 0, Display: 0]:\n"
+            "\t\tenabled: True\n"
+            "\t\tlooping: False\n"
+            "\t\tdescription: 'Multi\n"
+            "\t\tline'\n"
+            "\t\tconditions:\n"
+            "\t\t\ttimer [Index: 0, Display: 0]:\n"
+            "\t\t\t\ttimer: 20\n"
+            "\t\t\t\tinverted: False (0)\n"
+            "\t\teffects:\n"
+            "\t\t\tsend_chat [Index: 0, Display: 0]:\n"
+            "\t\t\t\tsource_player: Player One (1)\n"
+            "\t\t\t\tmessage: 'Hello\n"
+            "\t\t\t\tWorld'\n"
+            "\n"
+            "\t'Trigger1' [Index: 1, Display: 1]:\n"
+            "\t\tenabled: True\n"
+            "\t\tlooping: False\n"
+            "\n"
+            "Variables:\n"
+            "\t'Variable0' [Index: 0]\n",
+            fp.getvalue()
+        )
+        self.assertEqual(fp.getvalue(), self.tm.get_content_as_string())
+
+    def test_iter_lines(self):
+        for lines in [self.tm.iter_content_lines(), self.tm.iter_summary_lines()]:
+            for line in lines:
+                self.assertTrue(line.endswith("\n"))
+                self.assertNotIn("\n", line[:-1])
+
+
+def _summary_as_string_before_streaming(tm: TriggerManagerDE) -> str:
+    """The string building implementation of ``get_summary_as_string`` before it was built from streamed lines"""
+    return_string = "\nTrigger Summary:\n"
+    if len(tm.trigger_display_order) == 0:
+        return_string += "\t<< No Triggers >>"
+
+    longest_trigger_name = max([len(trigger.name) for trigger in tm.triggers], default=-1) + 3
+    longest_index_notation = max(
+        [
+            helper.get_int_len(display) + helper.get_int_len(trigger_index)
+            for display, trigger_index in enumerate(tm.trigger_display_order)
+        ],
+        default=-1
+    )
+    for display, trigger_index in enumerate(tm.trigger_display_order):
+        trigger = tm.triggers[trigger_index]
+        name_buffer = longest_trigger_name - len(trigger.name)
+        index_buffer = longest_index_notation - (helper.get_int_len(display) + helper.get_int_len(trigger_index))
+        return_string += "\t" + trigger.name + (" " * name_buffer)
+        return_string += f" [Index: {trigger_index}, Display: {display}] {' ' * index_buffer}"
+        return_string += "\t(conditions: " + str(len(trigger.conditions)) + ", "
+        return_string += " effects: " + str(len(trigger.effects)) + ")\n"
+
+    return_string += "\nVariables Summary:\n"
+    if len(tm.variables) == 0:
+        return_string += "\t<< No Variables >>"
+
+    longest_variable_name = max([len(variable.name) for variable in tm.variables], default=-1) + 3
+    for variable in tm.variables:
+        name_buffer = " " * (longest_variable_name - len(variable.name))
+        return_string += f"\t{variable.name}{name_buffer}[Index: {variable.variable_id}]\n"
+    return return_string
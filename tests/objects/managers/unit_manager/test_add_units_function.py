@@ -0,0 +1,54 @@
+from AoE2ScenarioParser.datasets.players import PlayerId
+
+from tests import ScenarioTestCase
+
+
+class Test(ScenarioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.um = self.scenario.unit_manager
+
+    def test_add_units(self):
+        first = self.um.add_unit(PlayerId.ONE, 4)
+        units = self.um.add_units(PlayerId.ONE, [4, 5, 6], xs=[1, 2, 3], ys=[4, 5, 6], rotations=[.5, 1, 1.5], zs=2)
+        last = self.um.add_unit(PlayerId.ONE, 4)
+
+        self.assertListEqual([first] + units + [last], self.um.units[PlayerId.ONE])
+        self.assertListEqual([4, 5, 6], [u.unit_const for u in units])
+        self.assertListEqual([(1, 4), (2, 5), (3, 6)], [(u.x, u.y) for u in units])
+        self.assertListEqual([2, 2, 2], [u.z for u in units])
+        self.assertListEqual([.5, 1, 1.5], [u.rotation for u in units])
+        self.assertListEqual([-1, -1, -1], [u.garrisoned_in_id for u in units])
+
+        self.assertListEqual([first.reference_id + i for i in range(1, 5)], [u.reference_id for u in units + [last]])
+        for unit in units:
+            self.assertEqual(PlayerId.ONE, unit.player)
+            self.assertEqual(self.scenario.uuid, unit._host_uuid)
+        self.assertIsNot(units[0]._instance_number_history, units[1]._instance_number_history)
+
+    def test_add_units_single_const_and_reference_ids(self):
+        units = self.um.add_units(PlayerId.GAIA, 411, xs=[1, 2], ys=[1, 2], reference_ids=[100, 200])
+
+        self.assertListEqual([411, 411], [u.unit_const for u in units])
+        self.assertListEqual([100, 200], [u.reference_id for u in units])
+
+    def test_add_units_invalid(self):
+        next_unit_id = self.um.next_unit_id
+        with self.assertRaises(ValueError):
+            self.um.add_units(PlayerId.ONE, 4, xs=[1, 2], ys=[1])
+        with self.assertRaises(ValueError):
+            self.um.add_units(PlayerId.ONE, [4], xs=[1, 2], ys=[1, 2])
+        with self.assertRaises(TypeError):
+            self.um.add_units(PlayerId.ONE, [4, 4.5], xs=[1, 2], ys=[1, 2])
+        self.assertListEqual([], self.um.add_units(PlayerId.ONE, 4, xs=[], ys=[]))
+        self.assertListEqual([], self.um.units[PlayerId.ONE])
+        self.assertEqual(next_unit_id, self.um.next_unit_id)
+
+    def test_add_units_write(self):
+        self.um.add_units(PlayerId.TWO, 4, xs=[float(i) for i in range(50)], ys=[1.5] * 50)
+        self.scenario._object_manager.reconstruct()
+
+        structs = self.scenario.sections['Units'].players_units[PlayerId.TWO].units
+        self.assertEqual(50, len(structs))
+        self.assertEqual(len({id(struct) for struct in structs}), 50)
+        self.assertListEqual([float(i) for i in range(50)], [struct.x for struct in structs])
@@ -0,0 +1,90 @@
+import gc
+import weakref
+
+from AoE2ScenarioParser.datasets.players import PlayerId
+
+from tests import ScenarioTestCase
+
+
+class Test(ScenarioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.um = self.scenario.unit_manager
+
+        self.castle = self.um.add_unit(PlayerId.ONE, 82, reference_id=100)
+        self.tower = self.um.add_unit(PlayerId.TWO, 79, reference_id=200)
+        self.archer = self.um.add_unit(PlayerId.ONE, 4, garrisoned_in_id=100)
+        self.militia = self.um.add_unit(PlayerId.TWO, 74, garrisoned_in_id=200)
+        self.villagers = self.um.add_units(PlayerId.ONE, 83, xs=[1, 2], ys=[1, 2], garrisoned_in_ids=[200, 100])
+
+    def test_get_garrisoned_units(self):
+        self.assertListEqual([self.archer, self.villagers[1]], self.um.get_garrisoned_units(self.castle))
+        self.assertListEqual([self.villagers[0], self.militia], self.um.get_garrisoned_units(200))
+        self.assertListEqual([], self.um.get_garrisoned_units(self.archer))
+        self.assertDictEqual(
+            {100: [self.archer, self.villagers[1]], 200: [self.villagers[0], self.militia]},
+            self.um.get_garrisons()
+        )
+
+    def test_garrison_index_updates(self):
+        self.um.get_garrisons()
+
+        archer2 = self.um.add_unit(PlayerId.ONE, 4, garrisoned_in_id=200)
+        self.archer.garrisoned_in_id = -1
+        self.villagers[0].garrisoned_in_id = 100
+        self.um.remove_unit(unit=self.militia)
+        self.um.remove_units(units=[self.villagers[1]])
+        self.um.change_ownership(archer2, PlayerId.THREE)
+
+        self.assertDictEqual({100: [self.villagers[0]], 200: [archer2]}, self.um.get_garrisons())
+
+        # Removed units are no longer part of the index
+        self.militia.garrisoned_in_id = 100
+        self.assertListEqual([self.villagers[0]], self.um.get_garrisoned_units(100))
+
+    def test_move_garrison(self):
+        moved = self.um.move_garrison(self.castle, self.tower)
+
+        self.assertListEqual([self.archer, self.villagers[1]], moved)
+        self.assertListEqual([], self.um.get_garrisoned_units(self.castle))
+        self.assertListEqual(
+            [self.villagers[0], self.militia, self.archer, self.villagers[1]], self.um.get_garrisoned_units(self.tower)
+        )
+        self.assertEqual(200, self.archer.garrisoned_in_id)
+
+        self.um.move_garrison(200, -1)
+        self.assertDictEqual({}, self.um.get_garrisons())
+        self.assertEqual(-1, self.militia.garrisoned_in_id)
+
+    def test_update_garrison_index(self):
+        self.um.get_garrisons()
+        self.um.units[PlayerId.ONE].remove(self.archer)
+        self.um.update_garrison_index()
+
+        self.assertListEqual([self.villagers[1]], self.um.get_garrisoned_units(self.castle))
+
+    def test_garrison_index_keeps_indexed_units(self):
+        unit = self.um.add_unit(PlayerId.THREE, 4)
+        unit_ref = weakref.ref(unit)
+        self.um.get_garrisons()
+
+        # The index holds the removed unit, so its id() can't be reused by a new unit until the index is rebuilt
+        self.um.units[PlayerId.THREE].clear()
+        del unit
+        gc.collect()
+        self.assertIsNotNone(unit_ref())
+
+        self.um.update_garrison_index()
+        gc.collect()
+        self.assertIsNone(unit_ref())
+
+        new_unit = self.um.add_unit(PlayerId.THREE, 4)
+        new_unit.garrisoned_in_id = 100
+        self.assertListEqual([self.archer, self.villagers[1], new_unit], self.um.get_garrisoned_units(self.castle))
+
+    def test_garrison_write(self):
+        self.um.move_garrison(self.castle, self.tower)
+        self.scenario._object_manager.reconstruct()
+
+        structs = self.scenario.sections['Units'].players_units[PlayerId.ONE].units
+        self.assertListEqual([-1, 200, 200, 200], [struct.garrisoned_in_id for struct in structs])
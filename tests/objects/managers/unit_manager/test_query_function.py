@@ -0,0 +1,71 @@
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.objects.support.area import Area
+
+from tests import ScenarioTestCase
+
+
+class Test(ScenarioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.um = self.scenario.unit_manager
+
+        self.units = {
+            PlayerId.GAIA: self.um.add_units(PlayerId.GAIA, [411, 411, 59], xs=[1.5, 8.5, 15.5], ys=[1.5, 8.5, 15.5]),
+            PlayerId.ONE: self.um.add_units(PlayerId.ONE, [4, 83, 4], xs=[2.5, 3.5, 19.9], ys=[2.5, 3.5, 19.9]),
+            PlayerId.TWO: self.um.add_units(PlayerId.TWO, [4, 83], xs=[5, 6], ys=[5, 6], rotations=[1, 2]),
+        }
+
+    def test_query_all(self):
+        self.assertListEqual(self.um.get_all_units(), list(self.um.query()))
+        self.assertEqual(8, self.um.query().count())
+
+    def test_query_player(self):
+        self.assertListEqual(self.units[PlayerId.TWO], self.um.query().player(PlayerId.TWO).to_list())
+        self.assertListEqual(
+            self.units[PlayerId.TWO] + self.units[PlayerId.ONE],
+            self.um.query().player(PlayerId.TWO, PlayerId.ONE).to_list()
+        )
+        self.assertListEqual(
+            self.units[PlayerId.ONE],
+            self.um.query().player(PlayerId.TWO, PlayerId.ONE).player(PlayerId.ONE, PlayerId.THREE).to_list()
+        )
+
+    def test_query_const(self):
+        p1, p2 = self.units[PlayerId.ONE], self.units[PlayerId.TWO]
+
+        self.assertListEqual([p1[0], p1[2], p2[0]], self.um.query().const_in([4]).to_list())
+        self.assertListEqual([p1[1], p2[1]], self.um.query().player(1, 2).const_not_in({4}).to_list())
+        self.assertListEqual([p1[1], p2[1]], self.um.query().const_in([4, 83]).const_not_in([4]).to_list())
+        self.assertEqual(0, self.um.query().const_in([4]).const_in([83]).count())
+
+    def test_query_in_area(self):
+        area = Area(uuid=self.scenario.uuid).select(0, 0, 5, 5)
+        gaia, p1, p2 = self.units[PlayerId.GAIA], self.units[PlayerId.ONE], self.units[PlayerId.TWO]
+
+        self.assertListEqual([gaia[0], p1[0], p1[1], p2[0]], self.um.query().in_area(area).to_list())
+        self.assertListEqual([p1[2]], self.um.query().in_area(Area(uuid=self.scenario.uuid).select(19, 19)).to_list())
+        self.assertListEqual(
+            [p1[0], p1[1]],
+            self.um.query().in_area(area).in_area(area.copy().select(2, 2, 4, 4)).to_list()
+        )
+        selection = area - Area(uuid=self.scenario.uuid).select(0, 0, 4, 4)
+        self.assertListEqual([p2[0]], self.um.query().in_area(selection).to_list())
+
+        with self.assertRaises(ValueError):
+            self.um.query().in_area(area).in_area(Area(10))
+
+    def test_query_where(self):
+        p2 = self.units[PlayerId.TWO]
+
+        self.assertListEqual([p2[1]], self.um.query().where(lambda u: u.rotation > 1).to_list())
+        self.assertEqual(
+            p2[0], self.um.query().const_in([4]).where(lambda u: u.rotation > 0).where(lambda u: u.x == 5).first()
+        )
+        self.assertIsNone(self.um.query().where(lambda u: u.x > 100).first())
+        self.assertFalse(self.um.query().player(PlayerId.EIGHT).exists())
+
+    def test_query_is_lazy(self):
+        query = self.um.query().player(PlayerId.THREE)
+        unit = self.um.add_unit(PlayerId.THREE, 4)
+
+        self.assertListEqual([unit], query.to_list())
@@ -0,0 +1,67 @@
+from AoE2ScenarioParser import settings
+from AoE2ScenarioParser.datasets.players import PlayerId
+
+from tests import ScenarioTestCase
+
+
+class Test(ScenarioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.um = self.scenario.unit_manager
+
+    def test_new_reference_ids_skip_used_ids(self):
+        first = self.um.add_unit(PlayerId.ONE, 4)
+        self.um.add_unit(PlayerId.ONE, 4, reference_id=first.reference_id + 10)
+
+        self.assertEqual(first.reference_id + 10, self.um.find_highest_reference_id())
+        self.assertEqual(first.reference_id + 11, self.um.get_new_reference_id())
+        self.assertEqual(range(first.reference_id + 12, first.reference_id + 17), self.um.get_new_reference_ids(5))
+
+        self.um.add_units(PlayerId.TWO, 4, xs=[1, 2], ys=[1, 2], reference_ids=[500, 20])
+        self.assertEqual(500, self.um.find_highest_reference_id())
+        self.assertEqual(501, self.um.next_unit_id)
+
+    def test_highest_reference_id_updates(self):
+        units = self.um.add_units(PlayerId.ONE, 4, xs=[1, 2, 3], ys=[1, 2, 3], reference_ids=[10, 30, 20])
+        self.assertEqual(30, self.um.find_highest_reference_id())
+
+        units[0].reference_id = 40
+        self.assertEqual(40, self.um.find_highest_reference_id())
+
+        self.um.remove_unit(unit=units[0])
+        self.assertEqual(30, self.um.find_highest_reference_id())
+
+        units[1].reference_id = 5
+        self.assertEqual(20, self.um.find_highest_reference_id())
+
+        self.um.remove_units(reference_ids=[20, 5])
+        self.assertEqual(0, self.um.find_highest_reference_id())
+
+    def test_find_highest_reference_id_rescan(self):
+        self.um.add_unit(PlayerId.ONE, 4, reference_id=10)
+        self.assertEqual(10, self.um.find_highest_reference_id())
+
+        self.um.units[PlayerId.TWO].append(self.um.units[PlayerId.ONE].pop())
+        self.um.units[PlayerId.TWO][0]._reference_id = 50
+        self.assertEqual(50, self.um.find_highest_reference_id(rescan=True))
+
+    def test_next_unit_id_to_place_on_commit(self):
+        self.um.add_unit(PlayerId.ONE, 4, reference_id=1000)
+        self.scenario._object_manager.reconstruct()
+
+        self.assertEqual(1001, self.scenario.sections['DataHeader'].next_unit_id_to_place)
+        self.assertEqual(1001, self.um.get_new_reference_id())
+
+    def test_reference_id_generator(self):
+        first = self.um.add_unit(PlayerId.ONE, 4)
+        disable_warnings = settings.DISABLE_WARNINGS
+        settings.DISABLE_WARNINGS = True
+        try:
+            generator = self.um.reference_id_generator
+        finally:
+            settings.DISABLE_WARNINGS = disable_warnings
+
+        self.assertEqual(first.reference_id + 1, next(generator))
+        self.assertEqual(first.reference_id + 2, self.um.get_new_reference_id())
+        self.um.add_unit(PlayerId.ONE, 4, reference_id=first.reference_id + 10)
+        self.assertEqual(first.reference_id + 11, next(generator))
@@ -0,0 +1,84 @@
+from AoE2ScenarioParser.datasets.players import PlayerId
+
+from tests import ScenarioTestCase
+
+
+class Test(ScenarioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.um = self.scenario.unit_manager
+
+        self.gaia = self.um.add_units(PlayerId.GAIA, [411, 1351, 411, 1366], xs=[1, 2, 3, 4], ys=[1, 2, 3, 4])
+        self.p1 = self.um.add_units(PlayerId.ONE, [4, 83, 4], xs=[1, 2, 3], ys=[1, 2, 3])
+
+    def test_change_ownership(self):
+        self.um.change_ownership(self.gaia[2], PlayerId.TWO)
+
+        self.assertListEqual([self.gaia[0], self.gaia[1], self.gaia[3]], self.um.units[PlayerId.GAIA])
+        self.assertListEqual([self.gaia[2]], self.um.units[PlayerId.TWO])
+        self.assertEqual(PlayerId.TWO, self.gaia[2].player)
+
+    def test_change_ownership_multiple(self):
+        units = [self.p1[2], self.gaia[3], self.gaia[0], self.gaia[0], self.p1[1]]
+        self.um.change_ownership(units, PlayerId.TWO)
+
+        self.assertListEqual([self.gaia[1], self.gaia[2]], self.um.units[PlayerId.GAIA])
+        self.assertListEqual([self.p1[0]], self.um.units[PlayerId.ONE])
+        self.assertListEqual([self.p1[2], self.gaia[3], self.gaia[0], self.p1[1]], self.um.units[PlayerId.TWO])
+        for unit in self.um.units[PlayerId.TWO]:
+            self.assertEqual(PlayerId.TWO, unit.player)
+
+        # Units already owned by the player are left in place
+        self.um.change_ownership([self.gaia[2], self.p1[2]], PlayerId.TWO)
+        self.assertListEqual(
+            [self.p1[2], self.gaia[3], self.gaia[0], self.p1[1], self.gaia[2]], self.um.units[PlayerId.TWO]
+        )
+
+    def test_change_ownership_player_mismatch(self):
+        # Move units between lists directly, so their player no longer matches the list they're in
+        self.um.units[PlayerId.GAIA].remove(self.gaia[0])
+        self.um.units[PlayerId.THREE].append(self.gaia[0])
+        self.um.units[PlayerId.GAIA].remove(self.gaia[1])
+        self.um.units[PlayerId.FOUR].append(self.gaia[1])
+
+        self.um.change_ownership(self.gaia[0], PlayerId.TWO)
+        self.um.change_ownership([self.gaia[1], self.gaia[2]], PlayerId.TWO)
+
+        self.assertListEqual([], self.um.units[PlayerId.THREE])
+        self.assertListEqual([], self.um.units[PlayerId.FOUR])
+        self.assertListEqual([self.gaia[3]], self.um.units[PlayerId.GAIA])
+        self.assertListEqual(self.gaia[:3], self.um.units[PlayerId.TWO])
+        for unit in self.gaia[:3]:
+            self.assertEqual(PlayerId.TWO, unit.player)
+
+    def test_player_setter(self):
+        self.gaia[1].player = PlayerId.ONE
+
+        self.assertListEqual(self.p1 + [self.gaia[1]], self.um.units[PlayerId.ONE])
+        self.assertNotIn(self.gaia[1], self.um.units[PlayerId.GAIA])
+        self.assertIsInstance(self.gaia[1].player, PlayerId)
+
+    def test_remove_units(self):
+        removed = self.um.remove_units(lambda unit: unit.unit_const == 411)
+        self.assertListEqual([self.gaia[0], self.gaia[2]], removed)
+        self.assertListEqual([self.gaia[1], self.gaia[3]], self.um.units[PlayerId.GAIA])
+
+        removed = self.um.remove_units(reference_ids=[self.p1[0].reference_id, self.gaia[1].reference_id, -5])
+        self.assertListEqual([self.gaia[1], self.p1[0]], removed)
+
+        removed = self.um.remove_units(units=[self.gaia[3], self.p1[1]], players=[PlayerId.ONE])
+        self.assertListEqual([self.p1[1]], removed)
+        self.assertListEqual([self.gaia[3]], self.um.units[PlayerId.GAIA])
+        self.assertListEqual([self.p1[2]], self.um.units[PlayerId.ONE])
+
+    def test_remove_units_invalid(self):
+        with self.assertRaises(ValueError):
+            self.um.remove_units()
+        with self.assertRaises(ValueError):
+            self.um.remove_units(lambda unit: True, reference_ids=[1])
+
+    def test_remove_eye_candy(self):
+        self.um.remove_eye_candy()
+
+        self.assertListEqual([self.gaia[0], self.gaia[2]], self.um.units[PlayerId.GAIA])
+        self.assertListEqual(self.p1, self.um.units[PlayerId.ONE])
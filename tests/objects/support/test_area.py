@@ -132,6 +132,40 @@ class TestArea(TestCase):
             self.area.to_coords(as_terrain=True)
         )
 
+    def test_area_to_mask(self):
+        self.area = Area(4).select(1, 1, 2, 3)
+        self.assertEqual(bytearray([
+            0, 0, 0, 0,
+            0, 1, 1, 0,
+            0, 1, 1, 0,
+            0, 1, 1, 0,
+        ]), self.area.to_mask())
+
+        self.area.use_pattern_lines(axis="x").invert()
+        self.assertEqual(bytearray([
+            0, 0, 0, 0,
+            0, 0, 0, 0,
+            0, 1, 1, 0,
+            0, 0, 0, 0,
+        ]), self.area.to_mask())
+
+    def test_area_to_mask_matches_is_within_selection(self):
+        self.area = Area(30).select(3, 4, 26, 21)
+        configurations = [
+            lambda a: a.use_full(),
+            lambda a: a.use_only_edge(line_width_x=2, line_width_y=3),
+            lambda a: a.use_pattern_grid(block_size_x=3, block_size_y=2, gap_size_x=1, gap_size_y=2),
+            lambda a: a.use_pattern_lines(axis="x", line_width=2, gap_size=3),
+            lambda a: a.use_pattern_lines(axis="y", line_width=1, gap_size=0),
+            lambda a: a.use_only_corners(corner_size_x=4, corner_size_y=2),
+        ]
+        for configure in configurations:
+            for inverted in (False, True):
+                configure(self.area)
+                self.area.inverted = inverted
+                expected = bytearray(self.area.is_within_selection(x, y) for y in range(30) for x in range(30))
+                self.assertEqual(expected, self.area.to_mask())
+
     def test_area_selection(self):
         self.assertEqual(((3, 3), (5, 5)), self.area.select(3, 3, 5, 5).get_selection())
 
@@ -302,6 +336,21 @@ class TestArea(TestCase):
                 self.assertEqual(tiles[index], tile)
                 index += 1
 
+    def test_area_to_chunks_entire_map(self):
+        self.area = Area(6).select_entire_map().use_pattern_lines(axis="x", gap_size=0, line_width=2)
+
+        chunks = self.area.to_chunks()
+        self.assertEqual(3, len(chunks))
+        for index, chunk in enumerate(chunks):
+            self.assertListEqual([(x, y) for y in range(index * 2, index * 2 + 2) for x in range(6)], list(chunk))
+
+        chunks = self.area.to_chunks(separate_by_id=False)
+        self.assertEqual(1, len(chunks))
+        self.assertListEqual([(x, y) for y in range(6) for x in range(6)], list(chunks[0]))
+
+        self.area.use_pattern_grid(block_size=1, gap_size=1)
+        self.assertEqual(9, len(self.area.to_chunks()))
+
     def test_area_get_chunk_id(self):
         self.area.use_pattern_grid().select(1, 1, 5, 5)
         self.assertEqual(0, self.area._get_chunk_id(Tile(1, 1)))
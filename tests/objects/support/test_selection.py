@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from AoE2ScenarioParser.objects.data_objects.terrain_tile import TerrainTile
+from AoE2ScenarioParser.objects.support.area import Area
+from AoE2ScenarioParser.objects.support.selection import Selection
+from AoE2ScenarioParser.scenarios.scenario_store import store
+
+
+class TestSelection(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        store.register_scenario(SCN)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        store.unregister_scenario(SCN)
+
+    def setUp(self) -> None:
+        self.area1 = Area(10).select(0, 0, 5, 5)
+        self.area2 = Area(10).select(3, 3, 8, 8)
+
+    def assert_matches_tiles(self, selection: Selection) -> None:
+        mask = selection.to_mask()
+        for y in range(10):
+            for x in range(10):
+                self.assertEqual(selection.is_within_selection(x, y), bool(mask[y * 10 + x]))
+
+    def test_selection_union(self):
+        selection = self.area1 | self.area2
+
+        self.assertEqual(36 + 36 - 9, len(selection.to_coords()))
+        self.assertEqual(1, len(selection.to_chunks()))
+        self.assert_matches_tiles(selection)
+
+    def test_selection_intersection(self):
+        selection = self.area1 & self.area2
+
+        self.assertListEqual([(x, y) for y in range(3, 6) for x in range(3, 6)], list(selection.to_coords()))
+        self.assert_matches_tiles(selection)
+
+    def test_selection_difference(self):
+        selection = self.area1 - self.area2 | Area(10).select(9, 9, 9, 9)
+
+        self.assertEqual(36 - 9 + 1, len(selection.to_coords()))
+        self.assertListEqual([36 - 9, 1], [len(chunk) for chunk in selection.to_chunks()])
+        self.assert_matches_tiles(selection)
+
+    def test_selection_with_patterns(self):
+        selection = self.area1.use_pattern_grid(block_size=1, gap_size=1) - self.area2.select(2, 2, 8, 8).use_only_edge()
+
+        self.assertListEqual([(0, 0), (2, 0), (4, 0), (0, 2), (0, 4), (4, 4)], list(selection.to_coords()))
+        self.assertEqual(6, len(selection.to_chunks()))
+        self.assert_matches_tiles(selection)
+
+    def test_selection_chunks_separate_by_id(self):
+        lines = Area(10).select(0, 0, 3, 3).use_pattern_lines(axis="x", gap_size=0)
+        selection = lines | Area(10).select(4, 0, 4, 3)
+
+        self.assertListEqual([4 + 4, 4, 4, 4], [len(chunk) for chunk in selection.to_chunks()])
+        self.assertEqual(1, len(selection.to_chunks(separate_by_id=False)))
+
+    def test_selection_is_lazy(self):
+        selection = self.area1 | self.area2
+        self.area2.select(9, 9, 9, 9)
+
+        self.assertEqual(36 + 1, len(selection.to_coords()))
+
+    def test_selection_empty(self):
+        selection = Selection(10)
+
+        self.assertEqual(bytearray(100), selection.to_mask())
+        self.assertEqual(36, len((selection | self.area1).to_coords()))
+
+    def test_selection_different_map_sizes(self):
+        with self.assertRaises(ValueError):
+            _ = self.area1 | Area(20)
+
+    def test_selection_to_terrain(self):
+        area = Area(uuid=SCN.uuid).select(0, 0, 1, 1)
+        selection = area - Area(uuid=SCN.uuid).select(1, 1, 1, 1)
+
+        self.assertListEqual([MM.terrain[0], MM.terrain[1], MM.terrain[5]], list(selection.to_coords(as_terrain=True)))
+        self.assertListEqual(
+            [[MM.terrain[0], MM.terrain[1], MM.terrain[5]]],
+            [list(chunk) for chunk in selection.to_chunks(as_terrain=True)]
+        )
+
+
+# Mock Objects & Variables
+uuid = "selection_uuid"
+
+
+class MM:
+    """Mock object for map_manager"""
+    map_size = 5
+    terrain = [TerrainTile(_index=index, host_uuid=uuid) for index in range(pow(map_size, 2))]
+
+
+class SCN:
+    """Mock object for scenario"""
+    map_manager = MM
+    uuid = uuid
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from AoE2ScenarioParser.objects.support.tracked_list import TrackedList
+
+
+class TestTrackedList(TestCase):
+    lst: TrackedList
+
+    def setUp(self) -> None:
+        self.changes = []
+        self.lst = TrackedList([1, 2, 3], on_length_change=lambda old, new: self.changes.append((old, new)))
+
+    def test_growing(self):
+        self.lst.append(4)
+        self.lst.extend([5, 6])
+        self.lst.insert(0, 0)
+        self.lst += [7]
+        self.lst[8:] = [8, 9]
+
+        self.assertListEqual(self.lst, list(range(10)))
+        self.assertListEqual(self.changes, [(3, 4), (4, 6), (6, 7), (7, 8), (8, 10)])
+
+    def test_shrinking(self):
+        self.lst.pop()
+        self.lst.remove(1)
+        del self.lst[0]
+        self.lst.extend([1, 2])
+        self.lst.clear()
+
+        self.assertListEqual(self.lst, [])
+        self.assertListEqual(self.changes, [(3, 2), (2, 1), (1, 0), (0, 2), (2, 0)])
+
+    def test_same_length(self):
+        self.lst[0] = 5
+        self.lst[0:2] = [6, 7]
+        self.lst.extend([])
+        self.lst.sort()
+        self.lst.reverse()
+
+        self.assertListEqual(self.changes, [])
+
+    def test_on_change(self):
+        changes = []
+        self.lst.on_change = lambda: changes.append(list(self.lst))
+
+        self.lst[0] = 5
+        self.lst.sort()
+        self.lst.reverse()
+        self.lst.append(4)
+        del self.lst[0]
+
+        self.assertListEqual(changes, [[5, 2, 3], [2, 3, 5], [5, 3, 2], [5, 3, 2, 4], [3, 2, 4]])
+        self.assertListEqual(self.changes, [(3, 4), (4, 3)])
+
+    def test_deepcopy_drops_callback(self):
+        from copy import deepcopy
+
+        copy = deepcopy(self.lst)
+        copy.append(4)
+
+        self.assertListEqual(copy, [1, 2, 3, 4])
+        self.assertIsNone(copy.on_length_change)
+        self.assertIsNone(copy.on_change)
+        self.assertListEqual(self.changes, [])
@@ -124,3 +124,66 @@ class TestUuidList(TestCase):
             self.assertEqual(lst.uuid, "uuid")
             for e in lst:
                 self.assertEqual(e._host_uuid, "uuid")
+
+    # ################## Ownership propagation ##################
+
+    def test_nested_uuid_list_not_rewrapped(self):
+        inner = UuidList('uuid', (U(),))
+        self.lst.append(inner)
+        self.lst.extend([inner])
+        self.lst[0] = inner
+
+        self.assertIs(self.lst[0], inner)
+        self.assertIs(self.lst[1], inner)
+
+    def test_nested_foreign_uuid_list_copied(self):
+        inner = UuidList('not-uuid', (U(),))
+        self.lst.append(inner)
+        self.lst.extend([inner])
+        self.lst.insert(0, inner)
+
+        for lst in self.lst:
+            self.assertIsNot(lst, inner)
+            self.assertEqual(lst.uuid, "uuid")
+        self.assertEqual(inner.uuid, "not-uuid")
+
+        self.lst[0].append(U())
+        self.assertEqual(1, len(inner))
+        self.assertEqual(1, len(self.lst[1]))
+
+    def test_nested_uuid_list_keeps_callback(self):
+        changes = []
+        inner = UuidList('uuid', (U(),), on_length_change=lambda old, new: changes.append((old, new)))
+        self.lst.append(inner)
+
+        self.lst[0].append(U())
+        self.assertEqual(changes, [(1, 2)])
+
+    def test_uuid_setter_nested(self):
+        self.lst.append((U(), U()))
+        inner = self.lst[0]
+
+        self.lst.uuid = "new-uuid"
+        self.assertIs(self.lst[0], inner)
+        self.assertEqual(inner.uuid, "new-uuid")
+        self.assertEqual(inner[0]._host_uuid, "new-uuid")
+
+    def test_extend_only_updates_new_elements(self):
+        u1, u2 = U(), U()
+        self.lst.extend((u1,))
+        u1._host_uuid = "changed"
+
+        self.lst.extend((u2,))
+        self.assertEqual(u1._host_uuid, "changed")
+        self.assertEqual(u2._host_uuid, "uuid")
+
+    def test_uuid_setter_same_value_does_not_walk(self):
+        u = U()
+        self.lst.append(u)
+        u._host_uuid = "changed"
+
+        self.lst.uuid = "uuid"
+        self.assertEqual(u._host_uuid, "changed")
+
+        self.lst.uuid = "new-uuid"
+        self.assertEqual(u._host_uuid, "new-uuid")
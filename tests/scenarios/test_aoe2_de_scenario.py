@@ -0,0 +1,197 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from AoE2ScenarioParser import settings
+from AoE2ScenarioParser.datasets.effects import EffectId
+from AoE2ScenarioParser.helper.exceptions import ScenarioNotFoundError
+from AoE2ScenarioParser.scenarios.aoe2_de_scenario import AoE2DEScenario
+from AoE2ScenarioParser.scenarios.scenario_store import getters, store
+
+from tests import SilentStatusUpdatesMixin
+
+
+class TestAoE2DEScenario(SilentStatusUpdatesMixin, TestCase):
+    def test_from_default(self):
+        scenario = AoE2DEScenario.from_default("1.45")
+
+        self.assertEqual("1.45", scenario.scenario_version)
+        self.assertEqual("1.45", scenario.sections['FileHeader'].version)
+        self.assertEqual(120, scenario.map_manager.map_size)
+        self.assertEqual(120 * 120, len(scenario.map_manager.terrain))
+        self.assertEqual([], scenario.trigger_manager.triggers)
+        self.assertEqual([], scenario.unit_manager.get_all_units())
+
+    def test_from_default_map_size(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=60)
+
+        self.assertEqual(60, scenario.map_manager.map_size)
+        self.assertEqual(60 * 60, len(scenario.map_manager.terrain))
+
+    def test_from_default_write_and_read(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        trigger = scenario.trigger_manager.add_trigger("Trigger")
+        trigger.new_effect.activate_trigger(trigger_id=0)
+        scenario.unit_manager.add_unit(player=1, unit_const=4, x=5, y=6)
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = str(Path(directory) / "default.aoe2scenario")
+            scenario.write_to_file(filename)
+            read_scenario = AoE2DEScenario.from_file(filename)
+
+        self.assertEqual(40, read_scenario.map_manager.map_size)
+        self.assertEqual(["Trigger"], [t.name for t in read_scenario.trigger_manager.triggers])
+        self.assertEqual(1, len(read_scenario.trigger_manager.triggers[0].effects))
+        units = read_scenario.unit_manager.get_all_units()
+        self.assertEqual(1, len(units))
+        self.assertEqual((5, 6), (units[0].x, units[0].y))
+
+    def test_fork(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        scenario.trigger_manager.add_trigger("Trigger")
+        scenario.unit_manager.add_unit(player=1, unit_const=4, x=5, y=6)
+
+        fork = scenario.fork()
+
+        self.assertNotEqual(scenario.uuid, fork.uuid)
+        self.assertEqual(["Trigger"], [t.name for t in fork.trigger_manager.triggers])
+        self.assertEqual(1, len(fork.unit_manager.get_all_units()))
+        self.assertIs(scenario.sections['Map'].terrain_data[0], fork.sections['Map'].terrain_data[0])
+
+    def test_fork_copy_on_write(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        scenario.trigger_manager.add_trigger("Trigger")
+        fork = scenario.fork()
+
+        fork.trigger_manager.triggers[0].name = "Fork"
+        fork.trigger_manager.add_trigger("Fork only")
+        fork.map_manager.terrain[0].terrain_id = 9
+        scenario.unit_manager.add_unit(player=1, unit_const=4, x=5, y=6)
+
+        scenario._object_manager.reconstruct()
+        fork._object_manager.reconstruct()
+
+        self.assertIsNot(scenario.sections['Map'].terrain_data[0], fork.sections['Map'].terrain_data[0])
+        self.assertEqual(0, scenario.sections['Map'].terrain_data[0].terrain_id)
+        self.assertEqual(9, fork.sections['Map'].terrain_data[0].terrain_id)
+        self.assertEqual(["Trigger"], [t.trigger_name for t in scenario.sections['Triggers'].trigger_data])
+        self.assertEqual(["Fork", "Fork only"], [t.trigger_name for t in fork.sections['Triggers'].trigger_data])
+        self.assertEqual(1, len(scenario.sections['Units'].players_units[1].units))
+        self.assertEqual(0, len(fork.sections['Units'].players_units[1].units))
+
+    def test_fork_reconstruct_without_changes(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        scenario.trigger_manager.add_trigger("Trigger").new_effect.display_instructions(message="Message")
+        scenario.unit_manager.add_unit(player=1, unit_const=4, x=5, y=6)
+        fork = scenario.fork()
+
+        fork._object_manager.reconstruct()
+        scenario._object_manager.reconstruct()
+
+        trigger, fork_trigger = scenario.sections['Triggers'].trigger_data[0], fork.sections['Triggers'].trigger_data[0]
+        self.assertIs(trigger, fork_trigger)
+        self.assertIs(trigger.effect_data[0], fork_trigger.effect_data[0])
+        self.assertIs(
+            scenario.sections['Units'].players_units[1].units[0], fork.sections['Units'].players_units[1].units[0]
+        )
+        self.assertEqual("Message", fork.trigger_manager.triggers[0].effects[0].message)
+
+    def test_fork_keeps_trailing_null_set_on_purpose(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        effect = scenario.trigger_manager.add_trigger("Trigger").new_effect.display_instructions(message="Message\x00")
+        fork = scenario.fork()
+
+        self.assertEqual("Message\x00", effect.message)
+        self.assertEqual("Message\x00", fork.trigger_manager.triggers[0].effects[0].message)
+
+    def test_write_error_file(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=10)
+        version = scenario.sections['FileHeader'].retriever_map['version'].get_data_as_bytes().hex(" ")
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = str(Path(directory) / "error_file.txt")
+
+            scenario.write_error_file(filename)
+            with open(filename, encoding=settings.MAIN_CHARSET) as f:
+                full = f.read()
+
+            scenario.write_error_file(filename, sections=['FileHeader', 'Map'])
+            with open(filename, encoding=settings.MAIN_CHARSET) as f:
+                selected_sections = f.read()
+
+            scenario.write_error_file(filename, byte_range=(0, 4))
+            with open(filename, encoding=settings.MAIN_CHARSET) as f:
+                selected_range = f.read()
+
+        self.assertEqual(full, "".join(s.get_byte_structure_as_string() for s in scenario.sections.values()))
+        self.assertIn("[SECTION]", full)
+        self.assertIn("######################## Map ########################", selected_sections)
+        self.assertNotIn("Triggers", selected_sections)
+        self.assertLess(len(selected_sections), len(full))
+
+        # The first 4 bytes of the file (version) & of the decompressed data (DataHeader.next_unit_id_to_place)
+        self.assertIn(version, selected_range)
+        self.assertIn("next_unit_id_to_place", selected_range)
+        self.assertNotIn("Map", selected_range)
+
+    def test_close(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        trigger = scenario.trigger_manager.add_trigger("Trigger")
+        scenario.close()
+        scenario.close()
+
+        self.assertNotIn(scenario.uuid, store._scenarios)
+        self.assertEqual({}, scenario.sections)
+        with self.assertRaises(ScenarioNotFoundError):
+            _ = scenario.trigger_manager
+        with self.assertRaises(ScenarioNotFoundError):
+            scenario.write_to_file("never_written.aoe2scenario")
+        with self.assertRaises(ScenarioNotFoundError):
+            getters.get_trigger_name(trigger._host_uuid, 0)
+
+    def test_str_after_close(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        unit = scenario.unit_manager.add_unit(player=1, unit_const=4, x=5, y=6)
+        trigger = scenario.trigger_manager.add_trigger("Trigger")
+        effect = trigger.new_effect.activate_trigger(trigger_id=0)
+        trigger.new_effect.kill_object(selected_object_ids=[unit.reference_id])
+        condition = trigger.new_condition.variable_value(variable=0, quantity=1)
+        scenario.close()
+
+        self.assertIn("trigger_id: Unknown (0)", str(effect))
+        self.assertIn(f"selected_object_ids: Unknown ([{unit.reference_id}])", str(trigger))
+        self.assertIn("variable: 0", str(condition))
+
+    def test_change_objects_after_close(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        unit = scenario.unit_manager.add_unit(player=1, unit_const=4, x=5, y=6)
+        trigger = scenario.trigger_manager.add_trigger("Trigger")
+        effect = trigger.new_effect.activate_trigger(trigger_id=0)
+        scenario.trigger_manager.get_activation_graph()
+        scenario.unit_manager.get_garrisons()
+        scenario.close()
+
+        effect.trigger_id = 1
+        effect.effect_type = EffectId.DEACTIVATE_TRIGGER
+        trigger.effects.append(effect.copy())
+        trigger.effects[0] = effect.copy()
+        unit.garrisoned_in_id = 10
+        unit.reference_id = 20
+
+        self.assertEqual(2, len(trigger.effects))
+        self.assertEqual((10, 20), (unit.garrisoned_in_id, unit.reference_id))
+
+    def test_close_context_manager(self):
+        with AoE2DEScenario.from_default("1.45", map_size=40) as scenario:
+            self.assertIs(scenario, store.get_scenario(scenario.uuid))
+
+        self.assertTrue(scenario.closed)
+        self.assertNotIn(scenario.uuid, store._scenarios)
+
+    def test_close_fork_keeps_source(self):
+        scenario = AoE2DEScenario.from_default("1.45", map_size=40)
+        scenario.trigger_manager.add_trigger("Trigger")
+        fork = scenario.fork()
+        fork.close()
+
+        self.assertEqual(["Trigger"], [t.name for t in scenario.trigger_manager.triggers])
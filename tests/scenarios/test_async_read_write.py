@@ -0,0 +1,109 @@
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from unittest import IsolatedAsyncioTestCase
+
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.helper.exceptions import UnknownStructureError
+from AoE2ScenarioParser.helper.printers import s_print, status_updates
+from AoE2ScenarioParser.scenarios.aoe2_de_scenario import AoE2DEScenario
+from AoE2ScenarioParser.scenarios.scenario_store import store
+
+from tests import ScenarioFileMixin
+
+
+class TestAsyncReadWrite(ScenarioFileMixin, IsolatedAsyncioTestCase):
+    @classmethod
+    def build_source_scenario(cls, scenario: AoE2DEScenario) -> None:
+        scenario.trigger_manager.add_trigger("Trigger")
+        scenario.unit_manager.add_unit(PlayerId.ONE, 4, x=1, y=1)
+
+    async def test_read_and_write_with_thread_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            scenario = await AoE2DEScenario.from_file_async(self.filename, executor=executor)
+            scenario.trigger_manager.add_trigger("Added")
+            await scenario.write_to_file_async(self._path('async.aoe2scenario'), executor=executor)
+
+        scenario.write_to_file(self._path('sync.aoe2scenario'))
+        scenario.close()
+
+        with open(self._path('async.aoe2scenario'), 'rb') as async_file, \
+                open(self._path('sync.aoe2scenario'), 'rb') as sync_file:
+            self.assertEqual(sync_file.read(), async_file.read())
+
+    async def test_read_concurrently_with_process_executor(self):
+        with ProcessPoolExecutor(2) as executor:
+            scenarios = await asyncio.gather(
+                AoE2DEScenario.from_file_async(self.filename, executor=executor),
+                AoE2DEScenario.from_file_async(self.filename, executor=executor),
+            )
+
+        self.assertNotEqual(scenarios[0].uuid, scenarios[1].uuid)
+        for scenario in scenarios:
+            self.assertEqual("Trigger", scenario.trigger_manager.triggers[0].name)
+            self.assertEqual(1, len(scenario.unit_manager.units[PlayerId.ONE]))
+            scenario.close()
+
+    async def test_write_concurrently_with_fork(self):
+        scenario = AoE2DEScenario.from_file(self.filename)
+        fork = scenario.fork()
+        scenario.trigger_manager.add_trigger("Original")
+        fork.trigger_manager.add_trigger("Fork")
+        fork.unit_manager.add_unit(PlayerId.TWO, 4, x=2, y=2)
+
+        with ThreadPoolExecutor(2) as executor:
+            await asyncio.gather(
+                scenario.write_to_file_async(self._path('original_async.aoe2scenario'), executor=executor),
+                fork.write_to_file_async(self._path('fork_async.aoe2scenario'), executor=executor),
+            )
+
+        scenario.write_to_file(self._path('original_sync.aoe2scenario'))
+        fork.write_to_file(self._path('fork_sync.aoe2scenario'))
+        scenario.close()
+        fork.close()
+
+        for name in ['original', 'fork']:
+            with open(self._path(f'{name}_async.aoe2scenario'), 'rb') as async_file, \
+                    open(self._path(f'{name}_sync.aoe2scenario'), 'rb') as sync_file:
+                self.assertEqual(sync_file.read(), async_file.read())
+
+        written = AoE2DEScenario.from_file(self._path('fork_async.aoe2scenario'))
+        self.assertListEqual(["Trigger", "Fork"], [trigger.name for trigger in written.trigger_manager.triggers])
+        self.assertEqual(1, len(written.unit_manager.units[PlayerId.TWO]))
+        written.close()
+
+    async def test_read_failure_closes_scenario(self):
+        with open(self.filename, 'rb') as file:
+            content = file.read()
+        filename = self._path('unknown_version.aoe2scenario')
+        with open(filename, 'wb') as file:
+            file.write(b'0.00' + content[4:])
+
+        registered = set(store._scenarios)
+        with self.assertRaises(UnknownStructureError):
+            await AoE2DEScenario.from_file_async(filename)
+        self.assertSetEqual(registered, set(store._scenarios))
+
+    async def test_print_status(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            scenario = await AoE2DEScenario.from_file_async(self.filename, print_status=True)
+            printed = output.getvalue()
+            await scenario.write_to_file_async(self._path('silent.aoe2scenario'), print_status=False)
+        scenario.close()
+
+        self.assertIn("Reading scenario file", printed)
+        self.assertIn("Setting up managers", printed)
+        self.assertEqual(printed, output.getvalue())
+
+    def test_status_updates(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            with status_updates(True):
+                s_print("Printed", final=True)
+                with status_updates(None):
+                    s_print("Not printed", final=True)
+            s_print("Not printed", final=True)
+
+        self.assertEqual("\rPrinted\n", output.getvalue())
@@ -0,0 +1,37 @@
+import random
+import zlib
+from unittest import TestCase
+
+from AoE2ScenarioParser.scenarios.aoe2_scenario import compress_bytes, decompress_bytes
+
+
+class TestCompressBytes(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        rng = random.Random(0)
+        cls.content = bytes(rng.choice(b'abc\x00\x00\x01') for _ in range(600_000))
+
+    def test_compress_single_block(self):
+        content = self.content[:128 * 1024]
+        deflate_obj = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+        expected = deflate_obj.compress(content) + deflate_obj.flush()
+
+        self.assertEqual(expected, compress_bytes(content, threads=4))
+
+    def test_compress_independent_of_threads(self):
+        compressed = compress_bytes(self.content, threads=1)
+
+        self.assertEqual(self.content, decompress_bytes(compressed))
+        self.assertEqual(compressed, compress_bytes(self.content, threads=4))
+
+    def test_compress_multiple_threads(self):
+        compressed = compress_bytes(self.content, threads=4)
+
+        self.assertEqual(self.content, decompress_bytes(compressed))
+        self.assertEqual(self.content, zlib.decompressobj(-zlib.MAX_WBITS).decompress(compressed))
+
+    def test_compress_multiple_threads_block_edges(self):
+        for length in (0, 1, 128 * 1024, 128 * 1024 + 1, 2 * 128 * 1024, 3 * 128 * 1024 + 1):
+            content = self.content[:length]
+            self.assertEqual(content, decompress_bytes(compress_bytes(content, threads=3)))
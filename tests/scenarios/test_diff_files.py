@@ -0,0 +1,126 @@
+from unittest import TestCase
+
+from AoE2ScenarioParser.datasets.players import PlayerId
+from AoE2ScenarioParser.scenarios.aoe2_de_scenario import AoE2DEScenario
+from AoE2ScenarioParser.scenarios.support.scenario_diff import DiffStatus, TerrainRegion, ValueChange
+
+from tests import ScenarioFileMixin
+
+
+class TestDiffFiles(ScenarioFileMixin, TestCase):
+    @classmethod
+    def build_source_scenario(cls, scenario: AoE2DEScenario) -> None:
+        for i in range(3):
+            trigger = scenario.trigger_manager.add_trigger(f"Trigger {i}")
+            trigger.new_effect.display_instructions(message=f"Message {i}")
+            trigger.new_condition.timer(timer=i)
+        scenario.unit_manager.add_unit(PlayerId.ONE, 4, x=1, y=1, reference_id=10)
+        scenario.unit_manager.add_unit(PlayerId.ONE, 4, x=2, y=2, reference_id=11)
+        scenario.unit_manager.add_unit(PlayerId.TWO, 4, x=3, y=3, reference_id=12)
+
+    def setUp(self) -> None:
+        self.scenario = AoE2DEScenario.from_file(self.filename)
+        self.other_filename = self._path('other.aoe2scenario')
+
+    def tearDown(self) -> None:
+        self.scenario.close()
+
+    def _diff(self):
+        self.scenario.write_to_file(self.other_filename)
+        return AoE2DEScenario.diff_files(self.filename, self.other_filename)
+
+    def test_no_changes(self):
+        diff = self._diff()
+
+        self.assertTrue(diff.is_empty)
+        self.assertEqual([], diff.values)
+
+    def test_trigger_changes(self):
+        triggers = self.scenario.trigger_manager.triggers
+        triggers[0].name = "Renamed"
+        triggers[1].effects[0].message = "Changed"
+        triggers[2].new_effect.none()
+        self.scenario.trigger_manager.add_trigger("Added")
+
+        diff = self._diff()
+
+        self.assertIn('Triggers', diff.sections)
+        self.assertListEqual([0, 1, 2, 3], [change.index for change in diff.triggers])
+
+        self.assertEqual("Renamed", diff.triggers[0].name)
+        self.assertListEqual([ValueChange('trigger_name', "Trigger 0", "Renamed")], diff.triggers[0].changes)
+
+        self.assertListEqual([], diff.triggers[1].changes)
+        self.assertEqual(1, len(diff.triggers[1].effects))
+        self.assertListEqual([ValueChange('message', "Message 1", "Changed")], diff.triggers[1].effects[0].changes)
+
+        self.assertListEqual([(1, DiffStatus.ADDED, [])], diff.triggers[2].effects)
+        self.assertEqual(DiffStatus.ADDED, diff.triggers[3].status)
+        self.assertIn(ValueChange('Triggers.number_of_triggers', 3, 4), diff.values)
+
+    def test_unit_changes(self):
+        units = self.scenario.unit_manager.units
+        units[PlayerId.ONE][0].x = 5
+        self.scenario.unit_manager.remove_unit(reference_id=11)
+        self.scenario.unit_manager.add_unit(PlayerId.TWO, 4, x=4, y=4, reference_id=13)
+
+        diff = self._diff()
+
+        self.assertListEqual(
+            [
+                (PlayerId.ONE, 10, DiffStatus.CHANGED),
+                (PlayerId.ONE, 11, DiffStatus.REMOVED),
+                (PlayerId.TWO, 13, DiffStatus.ADDED),
+            ],
+            [(change.player, change.reference_id, change.status) for change in diff.units]
+        )
+        self.assertListEqual([ValueChange('x', 1, 5)], diff.units[0].changes)
+
+    def test_unit_changes_duplicate_reference_ids(self):
+        units = self.scenario.unit_manager.units
+        units[PlayerId.ONE][1].reference_id = 10
+        units[PlayerId.ONE][0].x = 5
+
+        diff = self._diff()
+
+        self.assertListEqual(
+            [
+                (PlayerId.ONE, 10, DiffStatus.CHANGED, 0),
+                (PlayerId.ONE, 10, DiffStatus.CHANGED, 1),
+            ],
+            [(change.player, change.reference_id, change.status, change.index) for change in diff.units]
+        )
+        self.assertListEqual([ValueChange('x', 1, 5)], diff.units[0].changes)
+        self.assertListEqual([ValueChange('reference_id', 11, 10)], diff.units[1].changes)
+
+    def test_terrain_changes(self):
+        map_manager = self.scenario.map_manager
+        for x in range(2, 5):
+            for y in range(3, 5):
+                map_manager.get_tile(x, y).terrain_id = 5
+        map_manager.get_tile(10, 11).elevation = 2
+
+        diff = self._diff()
+
+        self.assertListEqual(['Map'], diff.sections)
+        self.assertListEqual([TerrainRegion(2, 3, 4, 4), TerrainRegion(10, 11, 10, 11)], diff.terrain)
+
+    def test_value_changes(self):
+        self.scenario.map_manager.map_color_mood = "Changed"
+
+        diff = self._diff()
+
+        self.assertListEqual([ValueChange('Map.map_color_mood', "Empty", "Changed")], diff.values)
+
+    def test_hash_file(self):
+        self.scenario.trigger_manager.triggers[1].name = "Renamed"
+        self.scenario.write_to_file(self.other_filename)
+
+        hashes = AoE2DEScenario.hash_file(self.filename)
+        other_hashes = AoE2DEScenario.hash_file(self.other_filename)
+
+        self.assertEqual('1.45', hashes.scenario_version)
+        self.assertListEqual(['Triggers'], hashes.changed_sections(other_hashes))
+        trigger_hashes = hashes.sections['Triggers'].structs['trigger_data']
+        other_trigger_hashes = other_hashes.sections['Triggers'].structs['trigger_data']
+        self.assertListEqual([True, False, True], [a == b for a, b in zip(trigger_hashes, other_trigger_hashes)])
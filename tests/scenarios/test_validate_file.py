@@ -0,0 +1,88 @@
+import struct
+from unittest import TestCase
+
+from AoE2ScenarioParser.helper.exceptions import InvalidScenarioDataError
+from AoE2ScenarioParser.scenarios.aoe2_de_scenario import AoE2DEScenario
+from AoE2ScenarioParser.scenarios.aoe2_scenario import compress_bytes, decompress_bytes
+
+from tests import ScenarioFileMixin
+
+
+class TestValidateFile(ScenarioFileMixin, TestCase):
+    @classmethod
+    def build_source_scenario(cls, scenario: AoE2DEScenario) -> None:
+        scenario.trigger_manager.add_trigger("Trigger").new_effect.display_instructions(message="Hello")
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        with open(cls.filename, 'rb') as file:
+            cls.content = file.read()
+        header = AoE2DEScenario.validate_file(cls.filename).sections['FileHeader']
+        cls.header = cls.content[:header[1]]
+        cls.data = decompress_bytes(cls.content[header[1]:])
+
+    def _write(self, content: bytes) -> str:
+        filename = self._path('test.aoe2scenario')
+        with open(filename, 'wb') as file:
+            file.write(content)
+        return filename
+
+    def test_valid_file(self):
+        validation = AoE2DEScenario.validate_file(self.filename)
+
+        self.assertTrue(validation.is_valid)
+        self.assertEqual("1.45", validation.scenario_version)
+        self.assertEqual(0, validation.trailing_bytes)
+        self.assertEqual(len(self.data), validation.sections['Files'][1])
+
+    def test_truncated_data(self):
+        validation = AoE2DEScenario.validate_file(self._write(self.header + compress_bytes(self.data[:-40])))
+
+        self.assertFalse(validation.is_valid)
+        self.assertEqual(1, len(validation.issues))
+        self.assertNotIn('Triggers', validation.sections)
+        issue = validation.issues[0]
+        self.assertEqual('Triggers', issue.section)
+        self.assertLessEqual(validation.sections['Units'][1], issue.offset)
+
+    def test_invalid_string_length(self):
+        # Set the length of the effect message to more than the amount of bytes left
+        message = self.data.index(b"Hello")
+        data = bytearray(self.data)
+        data[message - 4:message] = struct.pack('<i', len(self.data))
+        validation = AoE2DEScenario.validate_file(self._write(self.header + compress_bytes(bytes(data))))
+
+        issue = validation.issues[0]
+        self.assertEqual('Triggers', issue.section)
+        self.assertEqual('trigger_data[0].effect_data[0].message', issue.path)
+        self.assertEqual(message, issue.offset)
+
+    def test_trailing_bytes(self):
+        validation = AoE2DEScenario.validate_file(self._write(self.header + compress_bytes(self.data + b'\x00' * 7)))
+
+        self.assertTrue(validation.is_valid)
+        self.assertEqual(7, validation.trailing_bytes)
+
+    def test_not_decompressable(self):
+        validation = AoE2DEScenario.validate_file(self._write(self.header + b'\xff' * 20))
+
+        self.assertFalse(validation.is_valid)
+        self.assertIsNone(validation.issues[0].section)
+        self.assertEqual(len(self.header), validation.issues[0].offset)
+
+    def test_unknown_version(self):
+        validation = AoE2DEScenario.validate_file(self._write(b'0.00' + self.content[4:]))
+
+        self.assertFalse(validation.is_valid)
+        self.assertIsNone(validation.scenario_version)
+
+    def test_hash_file_uses_same_scan(self):
+        filename = self._write(self.header + compress_bytes(self.data[:-40]))
+        issue = AoE2DEScenario.validate_file(filename).issues[0]
+
+        with self.assertRaises(InvalidScenarioDataError) as context:
+            AoE2DEScenario.hash_file(filename)
+        error = context.exception
+        self.assertEqual((issue.section, issue.path, issue.offset), (error.section, error.path, error.offset))